@@ -1,84 +1,151 @@
+import heapq
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from lxml import html, etree
+from lxml import etree
 
+# Movie URLs typically have pattern: /title/tt\d{7,8} or https://www.imdb.com/title/tt\d{7,8}
+_MOVIE_ID_RE = re.compile(r'/title/(tt\d{7,8})', re.IGNORECASE)
+_MOVIE_ID_BYTES_RE = re.compile(rb'/title/(tt\d{7,8})', re.IGNORECASE)
+# Primary Actor heading selector, checked against each <h3> as it is parsed
+_PRIMARY_ACTOR_HEADING = etree.XPath(
+    "self::h3[contains(@class, 'ipc-title__text') and contains(@class, 'ipc-title__text--reduced') and contains(text(), 'Actor')]"
+)
 
-def find_actor_section_and_count_movies(file_path):
+# Last-resort selector: any title element mentioning "Actor"
+_ANY_ACTOR_TITLE = etree.XPath("//*[contains(@class, 'ipc-title') and contains(text(), 'Actor')]")
+
+
+def _first_text(element):
+    """Return the element's first text node, which is what XPath's text() compares."""
+    if element.text is not None:
+        return element.text
+    return next((child.tail for child in element if child.tail is not None), '')
+
+
+def _find_section_container(actor_heading):
+    """Walk up from the Actor heading to the element that holds the whole section."""
+    # Find the parent container - typically a section or div
+    # The Actor section content is usually in a parent container
+    parent = actor_heading.getparent()
+    
+    # Keep going up until we find a meaningful container (section, div with class, etc.)
+    actor_section = parent
+    max_depth = 10
+    depth = 0
+    
+    while actor_section is not None and depth < max_depth:
+        # Check if this is a good container (has class or is a section)
+        tag = actor_section.tag.lower()
+        classes = actor_section.get('class', '')
+    
+        # If it's a section or has relevant classes, use it
+        if tag in ['section', 'div'] and ('ipc-page-section' in classes or 'credits' in classes.lower() or depth > 2):
+            break
+    
+        parent = actor_section.getparent()
+        if parent is None:
+            break
+        actor_section = parent
+        depth += 1
+    
+    if actor_section is None:
+        print("Warning: Could not find Actor section container. Using parent of heading.")
+        actor_section = actor_heading.getparent()
+    
+    return actor_section
+
+
+def count_movie_urls_in_file(file_path):
+    """
+    Count movie URLs anywhere in the file with one bytes regex scan, without parsing HTML.
+    
+    Args:
+        file_path: Path to the HTML file
+    
+    Returns:
+        tuple: (count, unique_movie_ids) - count is the total number of movie URL occurrences
+    """
+    unique_ids = set()
+    total = 0
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # mmap refuses empty files
+            return 0, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for match in _MOVIE_ID_BYTES_RE.finditer(content):
+                total += 1
+                unique_ids.add(match.group(1))
+    return total, [raw_id.decode('ascii') for raw_id in unique_ids]
+
+
+def find_actor_section_and_count_movies(file_path, fast=False):
     """
     Find the Actor section in the HTML and count movie URLs within it.
     
     Args:
         file_path: Path to the HTML file
+        fast: Skip HTML parsing and count movie URLs across the whole file
+            (see count_movie_urls_in_file) instead of only the Actor section
     
     Returns:
-        tuple: (count, unique_movie_ids, movie_urls_list)
+        tuple: (count, unique_movie_ids) - count is the total number of movie URL occurrences
     """
+    if fast:
+        return count_movie_urls_in_file(file_path)
+    
     try:
-        # Read the HTML file
-        content = file_path.read_text(encoding='utf-8')
-        
-        # Parse the HTML
-        tree = html.fromstring(content)
-        
-        # Find the h3 element with class containing "ipc-title__text" and text "Actor"
-        # Try multiple XPath selectors to find the Actor heading
-        actor_headings = tree.xpath(
-            "//h3[contains(@class, 'ipc-title__text') and contains(@class, 'ipc-title__text--reduced') and contains(text(), 'Actor')]"
-        )
-        
-        if not actor_headings:
-            # Try alternative selectors
-            actor_headings = tree.xpath("//h3[contains(@class, 'ipc-title__text') and normalize-space(text())='Actor']")
-        
-        if not actor_headings:
-            # Try finding by text content
-            actor_headings = tree.xpath("//h3[normalize-space(text())='Actor']")
-        
-        if not actor_headings:
-            print("Warning: Could not find Actor heading with expected class.")
-            print("Trying alternative search methods...")
-            # Try to find any element containing "Actor" as a section title
-            actor_headings = tree.xpath("//*[contains(@class, 'ipc-title') and contains(text(), 'Actor')]")
-        
-        if not actor_headings:
-            print("Error: Could not find Actor section heading.")
-            return 0, [], []
-        
-        actor_heading = actor_headings[0]
-        print(f"Found Actor heading: '{actor_heading.text_content().strip()}'")
-        
-        # Find the parent container - typically a section or div
-        # The Actor section content is usually in a parent container
-        parent = actor_heading.getparent()
-        
-        # Keep going up until we find a meaningful container (section, div with class, etc.)
-        actor_section = parent
-        max_depth = 10
-        depth = 0
+        # Stream the page: the first heading matching the primary selector settles the
+        # search, so once its section container is complete the rest of the page
+        # (later credit sections, footer, the large trailing scripts) is never parsed
+        actor_heading = None
+        actor_section = None
+        context = etree.iterparse(str(file_path), events=('end',), html=True, encoding='utf-8')
+        for _, element in context:
+            if actor_heading is None:
+                if element.tag == 'h3' and _PRIMARY_ACTOR_HEADING(element):
+                    actor_heading = element
+                    actor_section = _find_section_container(actor_heading)
+            elif element is actor_section:
+                break
         
-        while actor_section is not None and depth < max_depth:
-            # Check if this is a good container (has class or is a section)
-            tag = actor_section.tag.lower()
-            classes = actor_section.get('class', '')
+        if actor_heading is None:
+            # No primary match anywhere, so the whole page has been parsed
+            tree = context.root
             
-            # If it's a section or has relevant classes, use it
-            if tag in ['section', 'div'] and ('ipc-page-section' in classes or 'credits' in classes.lower() or depth > 2):
-                break
+            # Try alternative selectors in one pass over the <h3>s: a heading with the
+            # title class wins, otherwise the first plain "Actor" heading is used
+            plain_heading = None
+            for h3 in tree.iter('h3'):
+                if ' '.join(_first_text(h3).split()) != 'Actor':
+                    continue
+                if 'ipc-title__text' in h3.get('class', ''):
+                    actor_heading = h3
+                    break
+                if plain_heading is None:
+                    plain_heading = h3
+            if actor_heading is None:
+                actor_heading = plain_heading
             
-            parent = actor_section.getparent()
-            if parent is None:
-                break
-            actor_section = parent
-            depth += 1
+            if actor_heading is None:
+                print("Warning: Could not find Actor heading with expected class.")
+                print("Trying alternative search methods...")
+                # Try to find any element containing "Actor" as a section title
+                actor_headings = _ANY_ACTOR_TITLE(tree)
+                if not actor_headings:
+                    print("Error: Could not find Actor section heading.")
+                    return 0, []
+                actor_heading = actor_headings[0]
+            
+            actor_section = _find_section_container(actor_heading)
         
-        if actor_section is None:
-            print("Warning: Could not find Actor section container. Using parent of heading.")
-            actor_section = actor_heading.getparent()
+        print(f"Found Actor heading: '{''.join(actor_heading.itertext()).strip()}'")
         
-        # Now find all movie URLs in the Actor section
-        # Movie URLs typically have pattern: /title/tt\d{7,8} or https://www.imdb.com/title/tt\d{7,8}
-        movie_url_pattern = r'/title/(tt\d{7,8})'
-        movie_ids = []
+        # Now find all movie URLs in the Actor section, deduplicating as we go
+        unique_movie_ids = set()
+        total = 0
         
         # Method 1: Get all links with href containing /title/tt
         if actor_section is not None:
@@ -88,41 +155,76 @@ def find_actor_section_and_count_movies(file_path):
             for link in links:
                 href = link.get('href', '')
                 # Extract movie ID from href
-                match = re.search(movie_url_pattern, href, re.IGNORECASE)
+                match = _MOVIE_ID_RE.search(href)
                 if match:
-                    movie_ids.append(match.group(1))
+                    total += 1
+                    unique_movie_ids.add(match.group(1))
         
         # Method 2: Also search the HTML content as text (in case URLs are in data attributes, scripts, etc.)
+        # Walk the parsed section rather than serialising it back to HTML; attribute
+        # values, text and tails are exactly where the serialised form could match
         if actor_section is not None:
-            try:
-                section_html = etree.tostring(actor_section, encoding='unicode', method='html')
-                # Find all movie URLs using regex in the HTML content
-                text_matches = re.findall(movie_url_pattern, section_html, re.IGNORECASE)
-                movie_ids.extend(text_matches)
-            except:
-                pass
-        
-        # Get unique movie IDs
-        unique_movie_ids = list(set(movie_ids))
+            # A movie URL always contains '/', so strings without one (names, years,
+            # whitespace) are rejected with a plain substring test before the regex
+            for element in actor_section.iter():
+                for value in element.attrib.values():
+                    if '/' not in value:
+                        continue
+                    for match in _MOVIE_ID_RE.finditer(value):
+                        total += 1
+                        unique_movie_ids.add(match.group(1))
+                for text in (element.text, element.tail):
+                    if text and '/' in text:
+                        for match in _MOVIE_ID_RE.finditer(text):
+                            total += 1
+                            unique_movie_ids.add(match.group(1))
         
-        return len(movie_ids), unique_movie_ids, movie_ids
+        return total, list(unique_movie_ids)
         
     except Exception as e:
         print(f"Error processing file: {e}")
         import traceback
         traceback.print_exc()
-        return 0, [], []
+        return 0, []
+
+
+def count_all(actors_root, workers=None, fast=False):
+    """
+    Count Actor-section movie URLs for every actors_root/*/actor.html file.
+    
+    Files are independent, so they are spread over a process pool.
+    
+    Args:
+        actors_root: Directory holding one folder per actor
+        workers: Number of worker processes (defaults to the CPU count)
+        fast: Count across whole files instead of Actor sections (no HTML parsing)
+    
+    Returns:
+        dict: {file_path: (count, unique_movie_ids)}
+    """
+    paths = sorted(Path(actors_root).glob('*/actor.html'))
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        results = executor.map(partial(find_actor_section_and_count_movies, fast=fast), paths, chunksize=8)
+        return dict(zip(paths, results))
 
 
 def main():
     """
     Main function to count movie URLs in the Actor section.
+    
+    Usage: count_actor_movies.py [--fast] [actor.html | actors_root [workers]]
+    
+    --fast counts movie URLs in the whole page with a plain regex scan instead of
+    parsing the HTML to restrict the count to the Actor section.
     """
     import sys
     
+    fast = '--fast' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--fast']
+    
     # Default file path
-    if len(sys.argv) > 1:
-        file_path = Path(sys.argv[1])
+    if args:
+        file_path = Path(args[0])
     else:
         file_path = Path("movies/actors/nm0000138/actor.html")
     
@@ -130,12 +232,29 @@ def main():
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
     
+    # A directory means batch mode over every <actor>/actor.html below it
+    if file_path.is_dir():
+        workers = int(args[1]) if len(args) > 1 else None
+        results = count_all(file_path, workers, fast=fast)
+        all_unique_ids = set()
+        for total_count, unique_ids in results.values():
+            all_unique_ids.update(unique_ids)
+        
+        print("\n" + "=" * 60)
+        print("COUNTING MOVIE URLS IN ACTOR SECTIONS")
+        print("=" * 60)
+        print(f"  Actor files analyzed: {len(results)}")
+        print(f"  Total movie URL occurrences: {sum(count for count, _ in results.values())}")
+        print(f"  Unique movie IDs across actors: {len(all_unique_ids)}")
+        print("\n" + "=" * 60)
+        return
+    
     print("=" * 60)
     print("COUNTING MOVIE URLS IN ACTOR SECTION")
     print("=" * 60)
     print(f"\nAnalyzing file: {file_path}")
     
-    total_count, unique_ids, all_movie_ids = find_actor_section_and_count_movies(file_path)
+    total_count, unique_ids = find_actor_section_and_count_movies(file_path, fast=fast)
     
     print(f"\nResults:")
     print(f"  Total movie URL occurrences: {total_count}")
@@ -143,7 +262,7 @@ def main():
     
     if unique_ids:
         print(f"\nFirst 20 unique movie IDs:")
-        for i, movie_id in enumerate(sorted(unique_ids)[:20], 1):
+        for i, movie_id in enumerate(heapq.nsmallest(20, unique_ids), 1):
             print(f"  {i}. {movie_id}")
     
     print("\n" + "=" * 60)
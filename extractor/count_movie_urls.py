@@ -1,31 +1,40 @@
+import heapq
+import mmap
+import os
 import re
 from pathlib import Path
 
+# Every IMDb movie URL variant (absolute, root-relative, or a relative href="title/tt...")
+# contains title/tt..., so one bytes pattern finds them all in a single pass without
+# decoding the file
+_MOVIE_ID_RE = re.compile(rb'title/(tt\d{7,8})', re.IGNORECASE)
+
 def count_movie_urls(file_path):
-    """Count movie URLs in an HTML file."""
+    """Count movie URLs in an HTML file.
+
+    Returns (unique movie IDs, total number of movie URL occurrences).
+    """
+    # Scan a read-only mapping of the file: the page cache is searched in place,
+    # with no copy of the (multi-MB) page into a Python object
     try:
-        content = file_path.read_text(encoding='utf-8')
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:  # mmap refuses empty files
+                return set(), 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # Find all IMDb movie URLs, counting occurrences and keeping only distinct IDs
+                raw_ids = set()
+                total = 0
+                for match in _MOVIE_ID_RE.finditer(content):
+                    total += 1
+                    raw_ids.add(match.group(1))
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
-        return set(), []
-    
-    # Find all IMDb movie URLs - try multiple patterns
-    patterns = [
-        r'https?://(?:www\.)?imdb\.com/title/(tt\d{7,8})',
-        r'/title/(tt\d{7,8})',
-        r'href="[^"]*title/(tt\d{7,8})',
-        r'href=\'[^\']*title/(tt\d{7,8})',
-    ]
-    
-    all_matches = []
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE)
-        all_matches.extend(matches)
+        return set(), 0
     
-    # Get unique movie IDs
-    unique_movie_ids = set(all_matches)
+    # Get unique movie IDs, decoding only the distinct ones
+    unique_movie_ids = {raw_id.decode('ascii') for raw_id in raw_ids}
     
-    return unique_movie_ids, all_matches
+    return unique_movie_ids, total
 
 # Compare both files
 file1 = Path("Leonardo DiCaprio - IMDb.html")
@@ -37,14 +46,14 @@ print("=" * 60)
 
 # Count in first file
 print(f"\n1. Analyzing: {file1}")
-unique1, all1 = count_movie_urls(file1)
-print(f"   Total movie URL occurrences: {len(all1)}")
+unique1, total1 = count_movie_urls(file1)
+print(f"   Total movie URL occurrences: {total1}")
 print(f"   Unique movie IDs: {len(unique1)}")
 
 # Count in second file
 print(f"\n2. Analyzing: {file2}")
-unique2, all2 = count_movie_urls(file2)
-print(f"   Total movie URL occurrences: {len(all2)}")
+unique2, total2 = count_movie_urls(file2)
+print(f"   Total movie URL occurrences: {total2}")
 print(f"   Unique movie IDs: {len(unique2)}")
 
 # Compare
@@ -52,7 +61,7 @@ print("\n" + "=" * 60)
 print("COMPARISON RESULTS")
 print("=" * 60)
 
-print(f"\nDifference in total occurrences: {len(all1) - len(all2)}")
+print(f"\nDifference in total occurrences: {total1 - total2}")
 print(f"Difference in unique movie IDs: {len(unique1) - len(unique2)}")
 
 if len(unique1) > len(unique2):
@@ -73,11 +82,11 @@ if len(unique1) != len(unique2):
     
     if only_in_file1:
         print(f"\nMovie IDs only in '{file1.name}' (first 10):")
-        for i, movie_id in enumerate(sorted(only_in_file1)[:10], 1):
+        for i, movie_id in enumerate(heapq.nsmallest(10, only_in_file1), 1):
             print(f"  {i}. {movie_id}")
     
     if only_in_file2:
         print(f"\nMovie IDs only in '{file2.name}' (first 10):")
-        for i, movie_id in enumerate(sorted(only_in_file2)[:10], 1):
+        for i, movie_id in enumerate(heapq.nsmallest(10, only_in_file2), 1):
             print(f"  {i}. {movie_id}")
 
@@ -3,26 +3,32 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
+import random
 import time
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 try:
-    from extractor.download_imdb_actor import download_imdb_actor, extract_actor_id
+    from extractor.download_imdb_actor import DriverPool, download_imdb_actor, download_many, extract_actor_id
 except ModuleNotFoundError:  # pragma: no cover
     import sys
 
     sys.path.append(str(Path(__file__).resolve().parent.parent))
-    from extractor.download_imdb_actor import download_imdb_actor, extract_actor_id
+    from extractor.download_imdb_actor import DriverPool, download_imdb_actor, download_many, extract_actor_id
 
 
 def read_actor_urls(csv_path: Path) -> Iterable[str]:
     with csv_path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        if "actor_url" not in (reader.fieldnames or []):
-            raise ValueError(f"{csv_path} missing 'actor_url' column")
+        # Only one column is needed, so index into plain rows instead of a dict per row
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        try:
+            url_idx = header.index("actor_url")
+        except ValueError:
+            raise ValueError(f"{csv_path} missing 'actor_url' column") from None
         for row in reader:
-            url = (row.get("actor_url") or "").strip()
+            url = row[url_idx].strip() if url_idx < len(row) else ""
             if url:
                 yield url
 
@@ -32,15 +38,36 @@ def load_existing_actor_ids(output_dir: Path) -> Set[str]:
     actors_dir = output_dir / "actors"
     if not actors_dir.exists():
         return existing
-    for actor_dir in actors_dir.iterdir():
-        if not actor_dir.is_dir():
-            continue
-        actor_html = actor_dir / "actor.html"
-        if actor_html.exists():
-            existing.add(actor_dir.name)
+    # os.scandir reuses the type info from readdir, leaving one stat per actor dir
+    with os.scandir(actors_dir) as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "actor.html")):
+                existing.add(entry.name)
     return existing
 
 
+def collect_pending_downloads(urls: Iterable[str], existing: Set[str]) -> Dict[str, List[str]]:
+    """Return {actor_id: distinct URLs in CSV order} for each actor still to download.
+
+    The first URL is tried first; the others are only used to retry actors whose
+    earlier URLs failed.
+    """
+    pending: Dict[str, List[str]] = {}
+    seen_urls: Set[str] = set()  # cast CSVs repeat actors across movies; skip repeats before parsing
+    for url in urls:
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+        try:
+            actor_id = extract_actor_id(url)
+        except ValueError as exc:
+            print(f"Skipping invalid URL {url}: {exc}")
+            continue
+        if actor_id not in existing:
+            pending.setdefault(actor_id, []).append(url)
+    return pending
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Download IMDb actor pages from actor CSV data."
@@ -63,7 +90,13 @@ def main() -> None:
         "--delay",
         type=float,
         default=5.0,
-        help="Delay in seconds between downloads.",
+        help="Minimum delay in seconds after a successful download before the next one.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of browsers downloading in parallel (default: 1). --delay only applies to a single worker.",
     )
     parser.add_argument(
         "--headless",
@@ -76,6 +109,7 @@ def main() -> None:
     output_dir: Path = args.output_dir
     delay: float = args.delay
     headless: bool = args.headless
+    workers: int = max(1, args.workers)
 
     if not csv_path.exists():
         parser.error(f"CSV file not found: {csv_path}")
@@ -83,32 +117,68 @@ def main() -> None:
     existing = load_existing_actor_ids(output_dir)
     print(f"Found {len(existing)} actors already downloaded; they will be skipped.")
 
-    seen_ids: Set[str] = set(existing)
-    total_attempted = 0
-    total_downloaded = 0
-
-    for url in read_actor_urls(csv_path):
-        try:
-            actor_id = extract_actor_id(url)
-        except ValueError as exc:
-            print(f"Skipping invalid URL {url}: {exc}")
-            continue
-
-        if actor_id in seen_ids:
-            continue
+    pending = collect_pending_downloads(read_actor_urls(csv_path), existing)
+    print(f"{len(pending)} actors to download.")
+    if not pending:
+        return
 
-        total_attempted += 1
-        try:
-            download_imdb_actor(url, output_dir=output_dir, headless=headless)
-            seen_ids.add(actor_id)
-            total_downloaded += 1
-        except Exception as exc:  # noqa: BLE001
-            print(f"Failed to download {actor_id}: {exc}")
-        if delay > 0:
-            time.sleep(delay)
+    total_attempted = 0
+    downloaded: Set[str] = set()
+
+    def download_parallel(batch: List[Tuple[str, str]], pool: DriverPool) -> None:
+        nonlocal total_attempted
+        results = download_many(
+            [url for url, _ in batch], output_dir=output_dir, pool=pool, workers=workers
+        )
+        for url, actor_id in batch:
+            total_attempted += 1
+            if isinstance(results[url], Exception):
+                print(f"Failed to download {actor_id}: {results[url]}")
+            else:
+                downloaded.add(actor_id)
+
+    next_allowed = 0.0  # time.monotonic() before which the next download must wait
+
+    def download_sequential(batch: List[Tuple[str, str]], pool: DriverPool) -> None:
+        nonlocal total_attempted, next_allowed
+        for url, actor_id in batch:
+            # Only wait out whatever is left of the gap since the last successful
+            # download, so failures and the end of the run cost no extra sleep
+            sleep_for = next_allowed - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+
+            total_attempted += 1
+            try:
+                with pool.acquire() as driver:
+                    download_imdb_actor(url, output_dir=output_dir, driver=driver)
+                downloaded.add(actor_id)
+                if delay > 0:
+                    # Small jitter so requests don't land on an exact period
+                    next_allowed = time.monotonic() + delay + random.uniform(0, delay * 0.1)
+            except Exception as exc:  # noqa: BLE001
+                print(f"Failed to download {actor_id}: {exc}")
+
+    download_batch = download_parallel if workers > 1 else download_sequential
+
+    # One pool serves every download instead of a fresh Chrome per actor
+    with DriverPool(size=workers, headless=headless) as pool:
+        attempt = 0
+        batch = [(urls[0], actor_id) for actor_id, urls in pending.items()]
+        while batch:
+            download_batch(batch, pool)
+            # An actor that failed is retried with its next distinct URL from the CSV
+            attempt += 1
+            batch = [
+                (urls[attempt], actor_id)
+                for actor_id, urls in pending.items()
+                if actor_id not in downloaded and attempt < len(urls)
+            ]
+            if batch:
+                print(f"Retrying {len(batch)} failed actors with another URL from the CSV.")
 
     print(
-        f"Attempted {total_attempted} downloads, successfully downloaded {total_downloaded} actors."
+        f"Attempted {total_attempted} downloads, successfully downloaded {len(downloaded)} actors."
     )
 
 
@@ -1,5 +1,12 @@
+import queue
 import re
-import time
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -8,7 +15,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 
+_ACTOR_ID_RE = re.compile(r'/name/(nm\d{7,8})')
+_TITLE_ID_RE = re.compile(r'/title/(tt\d{7,8})')
+
+
+@lru_cache(maxsize=65536)
 def extract_actor_id(url):
     """
     Extract the actor ID from an IMDb URL.
@@ -20,8 +33,7 @@ def extract_actor_id(url):
         str: Actor ID (e.g., 'nm0000138')
     """
     # Pattern to match IMDb actor ID (nm followed by 7-8 digits)
-    pattern = r'/name/(nm\d{7,8})'
-    match = re.search(pattern, url)
+    match = _ACTOR_ID_RE.search(url)
     
     if match:
         return match.group(1)
@@ -29,13 +41,41 @@ def extract_actor_id(url):
         raise ValueError(f"Could not extract actor ID from URL: {url}")
 
 
-def setup_driver(headless=True):
+# Only Chrome's disk cache is kept between runs, so IMDb's scripts and static assets
+# are reused without carrying cookies or consent state over from earlier runs.
+# Chrome expects a single owner per cache, so pooled browsers use CACHE_DIR/<slot>
+CACHE_DIR = Path.home() / ".imdb_scrape_cache"
+
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*amazon-adsystem.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*googlesyndication.com*",
+    "*scorecardresearch.com*",
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+]
+
+
+def setup_driver(headless=True, profile_dir=None, cache_dir=CACHE_DIR):
     """
     Set up and return a Chrome WebDriver instance.
     Automatically downloads and manages ChromeDriver using webdriver-manager.
     
     Args:
         headless: Whether to run browser in headless mode (default: True)
+        profile_dir: Chrome user data directory to keep between runs, cookies and
+            session state included. By default every browser gets a fresh
+            temporary profile, removed once the driver is gone; Chrome locks its
+            profile, so browsers running at the same time need different directories.
+        cache_dir: Chrome disk cache directory (default: CACHE_DIR); browsers
+            running at the same time need different directories here as well.
     
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver
@@ -46,14 +86,193 @@ def setup_driver(headless=True):
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+
+    temp_profile = profile_dir is None
+    if temp_profile:
+        profile_dir = tempfile.mkdtemp(prefix="imdb_scrape_profile_")
+    chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+    chrome_options.add_argument(f'--disk-cache-dir={cache_dir}')
+
+    # Only the HTML/JS that renders the credit links is needed, so skip images, CSS and fonts
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+        "profile.default_content_setting_values.fonts": 2,
+    })
+
     # Selenium Manager will locate the correct ChromeDriver automatically
-    driver = webdriver.Chrome(options=chrome_options)
+    try:
+        driver = webdriver.Chrome(options=chrome_options)
+    except Exception:
+        if temp_profile:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+    if temp_profile:
+        weakref.finalize(driver, shutil.rmtree, profile_dir, ignore_errors=True)
+
+    # Ad/analytics scripts delay readyState and never carry credits, so don't fetch them
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except Exception:
+        driver.quit()
+        raise
     return driver
 
 
-def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
+CREDITS_SECTION_XPATH = "//section[contains(@class, 'ipc-page-section')]"
+
+
+# Counting in the page itself costs one WebDriver round-trip instead of one per element list
+_COUNT_MOVIE_LINKS_JS = "return document.querySelectorAll('a[href*=\"/title/tt\"]').length"
+_COUNT_CREDIT_LINKS_JS = """
+const selector = 'a[href*="/title/tt"]';
+return {
+    total: document.querySelectorAll(selector).length,
+    sections: Array.from(document.querySelectorAll('section[class*="ipc-page-section"]'),
+                         s => s.querySelectorAll(selector).length),
+};
+"""
+
+
+def count_movie_links(driver):
+    """Return how many movie links the current page has."""
+    return driver.execute_script(_COUNT_MOVIE_LINKS_JS)
+
+
+def count_credit_links(driver):
+    """
+    Count movie links on the whole page and inside each credits section at once.
+    
+    Returns:
+        tuple: (total movie links, list of movie link counts per ipc-page-section)
+    """
+    counts = driver.execute_script(_COUNT_CREDIT_LINKS_JS)
+    return counts["total"], counts["sections"]
+
+
+def wait_for_document_ready(driver, timeout):
+    """Wait until the browser reports the document as fully loaded (gives up quietly on timeout)."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        print("Document did not finish loading in time; continuing...")
+
+
+def wait_for_stable_link_count(driver, timeout, poll=0.5, settle_polls=3):
+    """
+    Wait until the number of movie links stops changing, i.e. pending AJAX
+    requests have rendered their credits.
+    
+    Args:
+        driver: WebDriver on the actor page
+        timeout: Maximum time to wait in seconds
+        poll: Seconds between checks
+        settle_polls: Consecutive unchanged checks that count as stable
+    
+    Returns:
+        int: The last observed number of movie links
+    """
+    state = {"count": -1, "unchanged": 0}
+    
+    def settled(d):
+        count = count_movie_links(d)
+        if count == state["count"]:
+            state["unchanged"] += 1
+        else:
+            state["count"], state["unchanged"] = count, 0
+        return state["unchanged"] >= settle_polls
+    
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(settled)
+    except TimeoutException:
+        print("Movie link count still changing; continuing...")
+    return state["count"]
+
+
+def scroll_until_stable(driver, pause=2, max_rounds=10):
+    """
+    Scroll to the bottom repeatedly to trigger lazy loading, stopping as soon as
+    the page height no longer grows within `pause` seconds.
+    """
+    for _ in range(max_rounds):
+        height = driver.execute_script("return document.body.scrollHeight")
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        try:
+            WebDriverWait(driver, pause).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > height
+            )
+        except TimeoutException:
+            break
+
+
+class DriverPool:
+    """
+    Chrome WebDrivers shared by many downloads, so Chrome is not started per actor.
+    
+    Drivers are created lazily, up to `size`, and all of them are quit by close()
+    (or on leaving a `with DriverPool(...)` block). Cookies are cleared whenever a
+    driver is handed back, so every actor page starts from the same state.
+    """
+    
+    def __init__(self, size=1, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    def _get(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._drivers) < self.size:
+                # One disk cache per slot, so concurrent browsers never share one
+                cache_dir = CACHE_DIR / str(len(self._drivers))
+                driver = setup_driver(headless=self.headless, cache_dir=cache_dir)
+                self._drivers.append(driver)
+                return driver
+        return self._idle.get()
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a driver for one download and return it to the pool afterwards."""
+        driver = self._get()
+        try:
+            yield driver
+        finally:
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                print(f"Could not clear cookies: {e}")
+            self._idle.put(driver)
+    
+    def close(self):
+        """Quit every driver the pool has started."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+        if drivers:
+            print("Browser closed")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10, driver=None):
     """
     Download an IMDb actor page with full credits by clicking the "All credits" link.
     
@@ -62,6 +281,8 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         output_dir: Base directory for saving actors (default: 'movies')
         headless: Whether to run browser in headless mode (default: True)
         wait_time: Maximum time to wait for elements to load (default: 10 seconds)
+        driver: Optional WebDriver to reuse (see DriverPool); it is left open.
+            When omitted, a browser is started for this call and closed afterwards.
     
     Returns:
         str: Path to the saved HTML file
@@ -72,12 +293,14 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
     # Create directory structure: movies/actors/{actor_id}/
     actor_dir = Path(output_dir) / "actors" / actor_id
     actor_dir.mkdir(parents=True, exist_ok=True)
+    html_file = actor_dir / "actor.html"
     
-    # Set up WebDriver
-    driver = None
+    # Set up WebDriver unless the caller shares one
+    owns_driver = driver is None
     try:
-        print(f"Setting up browser for actor ID: {actor_id}")
-        driver = setup_driver(headless=headless)
+        if owns_driver:
+            print(f"Setting up browser for actor ID: {actor_id}")
+            driver = setup_driver(headless=headless)
         
         # Navigate to the actor page first
         print(f"Navigating to actor page: {url}")
@@ -90,36 +313,37 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         
         # Wait for JavaScript to finish executing
         print("Waiting for JavaScript to finish...")
-        time.sleep(5)  # Give extra time for JavaScript to render
+        wait_for_document_ready(driver, wait_time)
         
         # Accept cookies if cookie banner appears
         print("Checking for cookie banner...")
         try:
-            # Common cookie accept button selectors
-            cookie_selectors = [
+            # Common cookie accept button selectors, joined into one XPath union so a
+            # page without a banner costs a single short wait instead of one per selector
+            cookie_selector = " | ".join([
+                "//button[@data-testid='accept-button']",
                 "//button[contains(text(), 'Accept')]",
-                "//button[contains(text(), 'Accept All')]",
-                "//button[contains(text(), 'I Accept')]",
                 "//a[contains(text(), 'Accept')]",
                 "//button[@id='accept']",
                 "//button[contains(@class, 'accept')]",
                 "//button[contains(@id, 'accept')]",
-            ]
+            ])
             
             cookie_accepted = False
-            for selector in cookie_selectors:
+            try:
+                cookie_button = WebDriverWait(driver, 2).until(
+                    EC.element_to_be_clickable((By.XPATH, cookie_selector))
+                )
+                print("Found cookie banner, accepting cookies...")
+                driver.execute_script("arguments[0].click();", cookie_button)
                 try:
-                    cookie_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    print("Found cookie banner, accepting cookies...")
-                    driver.execute_script("arguments[0].click();", cookie_button)
-                    time.sleep(2)
-                    cookie_accepted = True
-                    print("✓ Cookies accepted")
-                    break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+                    WebDriverWait(driver, 2).until(EC.invisibility_of_element(cookie_button))
+                except TimeoutException:
+                    pass
+                cookie_accepted = True
+                print("✓ Cookies accepted")
+            except (TimeoutException, NoSuchElementException):
+                pass
             
             if not cookie_accepted:
                 print("No cookie banner found (or already accepted)")
@@ -129,12 +353,14 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         # Wait for document ready state
         ready_state = driver.execute_script("return document.readyState")
         print(f"Document ready state: {ready_state}")
-        time.sleep(2)
         
         # Scroll down to find the Credits section
         print("Scrolling to find Credits section...")
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 3);")
-        time.sleep(2)
+        try:
+            wait.until(EC.presence_of_element_located((By.XPATH, CREDITS_SECTION_XPATH)))
+        except TimeoutException:
+            pass
         
         # Count elements in credits section BEFORE clicking "All credits"
         print("\n" + "="*60)
@@ -143,19 +369,11 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         before_count = 0
         before_movie_links = 0
         try:
-            # Try to find credits section
-            credits_sections = driver.find_elements(By.XPATH, "//section[contains(@class, 'ipc-page-section')]")
-            print(f"Found {len(credits_sections)} section(s) with ipc-page-section class")
-            
-            # Count all links in credits area
-            all_links_before = driver.find_elements(By.XPATH, "//a[contains(@href, '/title/tt')]")
-            before_movie_links = len(all_links_before)
+            # Count all links and the links in each credits section in one call
+            before_movie_links, section_counts = count_credit_links(driver)
+            print(f"Found {len(section_counts)} section(s) with ipc-page-section class")
             print(f"Movie links found BEFORE clicking 'All credits': {before_movie_links}")
-            
-            # Count elements in credits section
-            for section in credits_sections:
-                section_links = section.find_elements(By.XPATH, ".//a[contains(@href, '/title/tt')]")
-                before_count += len(section_links)
+            before_count = sum(section_counts)
             
             print(f"Total movie links in credits sections: {before_count}")
         except Exception as e:
@@ -219,7 +437,10 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
             if element is not None:
                 # Scroll to element to ensure it's visible
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-                time.sleep(1.5)
+                try:
+                    WebDriverWait(driver, 3).until(EC.element_to_be_clickable(element))
+                except TimeoutException:
+                    pass
                 
                 # Try multiple click strategies
                 click_success = False
@@ -256,7 +477,11 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
                     credits_clicked = True
                     # Wait for the page to update after clicking
                     print("Successfully clicked 'All credits' button. Waiting for credits to load...")
-                    time.sleep(5)  # Initial wait for AJAX request to start
+                    # The click triggers an AJAX request; wait until it adds movie links
+                    try:
+                        wait.until(lambda d: count_movie_links(d) > before_movie_links)
+                    except TimeoutException:
+                        print("No new movie links appeared after clicking; continuing...")
                     
                     # Wait for URL to change or for credits content to appear
                     try:
@@ -274,7 +499,7 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
                 print("Clicking failed, navigating directly to #credits URL...")
                 credits_url = f"{url}#credits"
                 driver.get(credits_url)
-                time.sleep(5)
+                wait_for_document_ready(driver, wait_time)
                 credits_clicked = True
             
             # Wait for the credits content to fully load
@@ -283,58 +508,28 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
             # Wait for network requests to complete by checking for specific elements
             try:
                 # Wait for credits section to appear
-                wait.until(EC.presence_of_element_located((By.XPATH, "//section[contains(@class, 'ipc-page-section')]")))
+                wait.until(EC.presence_of_element_located((By.XPATH, CREDITS_SECTION_XPATH)))
                 print("Credits section detected")
             except TimeoutException:
                 print("Warning: Credits section not found, but continuing...")
             
             # Wait for JavaScript/AJAX to finish loading content
             print("Waiting for dynamic content to load...")
-            time.sleep(5)
-            
-            # Check if page is still loading
-            for i in range(3):
-                try:
-                    # Check if there are loading indicators
-                    loading_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'loading') or contains(@class, 'spinner')]")
-                    if not loading_elements:
-                        break
-                    print(f"Still loading... waiting (attempt {i+1}/3)")
-                    time.sleep(3)
-                except:
-                    break
+            try:
+                # Check if there are loading indicators
+                WebDriverWait(driver, 9).until_not(
+                    lambda d: d.find_elements(By.XPATH, "//*[contains(@class, 'loading') or contains(@class, 'spinner')]")
+                )
+            except TimeoutException:
+                print("Page still shows loading indicators; continuing...")
             
-            # Scroll multiple times to trigger lazy loading of all credits
+            # Scroll to trigger lazy loading of all credits until the page stops growing
             print("Scrolling to trigger lazy loading of all credits...")
-            scroll_pause_time = 2
-            
-            # Scroll to bottom
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
-            
-            # Scroll to top
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
-            # Scroll to middle
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-            time.sleep(scroll_pause_time)
-            
-            # Scroll to bottom again
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
-            
-            # Scroll back to top
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
-            # Scroll to bottom one more time to ensure everything is loaded
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
+            scroll_until_stable(driver)
             
             # Wait for any remaining AJAX/network requests
             print("Waiting for network requests to complete...")
-            time.sleep(5)
+            wait_for_stable_link_count(driver, wait_time)
             
             # # Verify content has loaded by checking for movie links
             # # Also check for a specific movie ID to ensure credits are fully loaded
@@ -399,16 +594,10 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         after_count = 0
         after_movie_links = 0
         try:
-            # Count all links in credits area
-            all_links_after = driver.find_elements(By.XPATH, "//a[contains(@href, '/title/tt')]")
-            after_movie_links = len(all_links_after)
+            # Count all links and the links in each credits section in one call
+            after_movie_links, section_counts = count_credit_links(driver)
             print(f"Movie links found AFTER clicking 'All credits': {after_movie_links}")
-            
-            # Count elements in credits section
-            credits_sections = driver.find_elements(By.XPATH, "//section[contains(@class, 'ipc-page-section')]")
-            for section in credits_sections:
-                section_links = section.find_elements(By.XPATH, ".//a[contains(@href, '/title/tt')]")
-                after_count += len(section_links)
+            after_count = sum(section_counts)
             
             print(f"Total movie links in credits sections: {after_count}")
             
@@ -434,7 +623,20 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
             import traceback
             traceback.print_exc()
         
-        # Get the page source after clicking
+        # Save __NEXT_DATA__ on its own (a small string, unlike the serialized DOM)
+        # for consumers that only need the embedded JSON. Readers prefer the sidecar,
+        # so one left from an earlier download must not outlive the new HTML
+        next_data = driver.execute_script(
+            "const s = document.getElementById('__NEXT_DATA__'); return s ? s.textContent : null;"
+        )
+        json_file = actor_dir / "actor.json"
+        if next_data:
+            json_file.write_bytes(next_data.encode('utf-8'))
+        else:
+            json_file.unlink(missing_ok=True)
+        
+        # Get the page source after clicking; the actor parser still reads the
+        # rendered credits and JSON-LD from the full HTML
         html_content = driver.page_source
         
         # # Verify the specific movie ID is present in the HTML
@@ -445,8 +647,10 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         #     print(f"✗ WARNING: Movie ID {verification_movie_id} is NOT present in the HTML")
         #     print("The credits may not be fully loaded. Consider re-running the script.")
         
-        # Count movie links to verify we got the full credits
-        movie_link_count = len(re.findall(r'/title/tt\d{7,8}', html_content))
+        # Count movie links to verify we got the full credits; one scan gives
+        # both the link count and the unique IDs
+        movie_ids = _TITLE_ID_RE.findall(html_content)
+        movie_link_count = len(movie_ids)
         print(f"Found {movie_link_count} movie links in the HTML")
 
         if movie_link_count >= after_movie_links:
@@ -456,7 +660,7 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
             print("The page may not have fully loaded. Try increasing wait_time or check the page manually.")
         
         # Count unique movie IDs
-        unique_movie_ids = set(re.findall(r'/title/(tt\d{7,8})', html_content))
+        unique_movie_ids = set(movie_ids)
         print(f"Found {len(unique_movie_ids)} unique movie IDs in the HTML")
         
         # if movie_link_count < 45:
@@ -464,9 +668,7 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         #     print("The page may not have fully loaded. Try increasing wait_time or check the page manually.")
         
         # Save the HTML content
-        html_file = actor_dir / "actor.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_file.write_bytes(html_content.encode('utf-8'))
         
         print(f"Successfully saved HTML to: {html_file}")
         return str(html_file)
@@ -475,11 +677,53 @@ def download_imdb_actor(url, output_dir="movies", headless=True, wait_time=10):
         print(f"Error downloading the actor page: {e}")
         raise
     finally:
-        if driver:
+        if owns_driver and driver:
             driver.quit()
             print("Browser closed")
 
 
+def download_many(urls, output_dir="movies", headless=True, wait_time=10, pool=None, workers=1):
+    """
+    Download several IMDb actor pages, optionally with several browsers in parallel.
+    
+    Page loads are dominated by network and JavaScript time, so with workers > 1
+    each thread drives its own browser from the pool and pages load concurrently.
+    
+    Args:
+        urls: IMDb actor URLs
+        output_dir: Base directory for saving actors (default: 'movies')
+        headless: Whether to run browser in headless mode (default: True)
+        wait_time: Maximum time to wait for elements to load (default: 10 seconds)
+        pool: Optional DriverPool to draw browsers from; a private pool with one
+            driver per worker is created (and closed afterwards) when omitted
+        workers: Number of downloads to run at once (default: 1)
+    
+    Returns:
+        dict: {url: path to the saved HTML file, or the exception that stopped it}
+    """
+    owns_pool = pool is None
+    if owns_pool:
+        pool = DriverPool(size=workers, headless=headless)
+    
+    def download_one(url):
+        with pool.acquire() as driver:
+            return download_imdb_actor(url, output_dir, wait_time=wait_time, driver=driver)
+    
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(download_one, url): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+    finally:
+        if owns_pool:
+            pool.close()
+    return results
+
+
 def main():
     """
     Main function to run the script from command line.
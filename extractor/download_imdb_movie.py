@@ -4,6 +4,10 @@ import requests
 from pathlib import Path
 from urllib.parse import urlparse
 
+_MOVIE_ID_RE = re.compile(r'/title/(tt\d{7,8})')
+# The JSON payload embedded by IMDb's Next.js frontend
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
 
 def extract_movie_id(url):
     """
@@ -16,8 +20,7 @@ def extract_movie_id(url):
         str: Movie ID (e.g., 'tt0120338')
     """
     # Pattern to match IMDb movie ID (tt followed by 7-8 digits)
-    pattern = r'/title/(tt\d{7,8})'
-    match = re.search(pattern, url)
+    match = _MOVIE_ID_RE.search(url)
     
     if match:
         return match.group(1)
@@ -72,6 +75,15 @@ def download_imdb_movie(url, output_dir="movies"):
         with open(html_file, 'w', encoding='utf-8') as f:
             f.write(response.text)
         
+        # Save __NEXT_DATA__ next to it so JSON-only consumers can skip HTML parsing;
+        # readers prefer the sidecar, so one left from an earlier download must go
+        next_data = _NEXT_DATA_RE.search(response.text)
+        if next_data:
+            with open(html_file.with_suffix(".json"), 'w', encoding='utf-8') as f:
+                f.write(next_data.group(1))
+        else:
+            html_file.with_suffix(".json").unlink(missing_ok=True)
+        
         print(f"Successfully saved HTML to: {html_file}")
         return str(html_file)
         
@@ -4,10 +4,31 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+from lxml.etree import XPath
+
+try:
+    import orjson  # much faster decoding of the large __NEXT_DATA__ payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_NEXT_DATA_TEXT = XPath(
+    "//script[@id='__NEXT_DATA__'][@type='application/json']/text()",
+    smart_strings=False,  # plain str results, which orjson accepts
+)
+# Files are fed to lxml as raw bytes, so the encoding must be given explicitly
+_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+# Movies handed to a worker per task; executor.map pickles each batch in one message
+EXTRACT_CHUNKSIZE = 32
+# Above this size only the __NEXT_DATA__ script is sliced out of a memory map
+MMAP_THRESHOLD = 1 << 20
 
 
 def find_movie_html_files(movies_dir: Path) -> Iterable[tuple[str, Path]]:
@@ -27,12 +48,46 @@ def find_movie_html_files(movies_dir: Path) -> Iterable[tuple[str, Path]]:
             yield movie_id, html_files[0]
 
 
+def _read_html_bytes(html_path: Path) -> bytes:
+    """Return the page bytes, or just its __NEXT_DATA__ script for large files."""
+    with html_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return f.read()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            marker = mm.find(b'id="__NEXT_DATA__"')
+            if marker == -1:
+                return b""
+            start = mm.rfind(b"<script", 0, marker)
+            end = mm.find(b"</script>", marker)
+            if start == -1 or end == -1:
+                return mm[:]
+            return mm[start:end + len(b"</script>")]
+
+
+def load_next_data(html_path: Path) -> dict | None:
+    """Return the page's __NEXT_DATA__ JSON.
+
+    A sidecar `<page>.json` saved by the downloader is preferred, so the HTML
+    does not have to be parsed at all.
+    """
+    json_path = html_path.with_suffix(".json")
+    if json_path.exists():
+        return _json_loads(json_path.read_bytes())
+    data = _read_html_bytes(html_path)
+    if not data.strip():
+        return None
+    tree = lxml_html.fromstring(data, parser=_HTML_PARSER)
+    script_text = _NEXT_DATA_TEXT(tree)
+    if not script_text or not script_text[0]:
+        return None
+    return _json_loads(script_text[0])
+
+
 def extract_top_cast(html_path: Path) -> List[Dict[str, str]]:
-    soup = BeautifulSoup(html_path.read_text(encoding="utf-8"), "html.parser")
-    script = soup.find("script", id="__NEXT_DATA__", type="application/json")
-    if not script or not script.string:
+    data = load_next_data(html_path)
+    if not data:
         return []
-    data = json.loads(script.string)
     main_data = data.get("props", {}).get("pageProps", {}).get("mainColumnData", {})
     cast_groups = main_data.get("castV2") or []
     rows: List[Dict[str, str]] = []
@@ -57,14 +112,50 @@ def extract_top_cast(html_path: Path) -> List[Dict[str, str]]:
     return rows
 
 
-def write_output(rows: List[Dict[str, str]], output_path: Path) -> None:
+def _extract_one(item: tuple[str, Path]) -> Tuple[str, List[Dict[str, str]]]:
+    movie_id, html_path = item
+    return movie_id, extract_top_cast(html_path)
+
+
+def load_cache(cache_path: Path) -> Dict[str, dict]:
+    """Load the extraction cache: movie_id -> {path, size, mtime_ns, rows}."""
+    try:
+        return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: Dict[str, dict], cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    tmp_path.replace(cache_path)
+
+
+def write_output(rows: Iterable[Dict[str, str]], output_path: Path) -> int:
+    """Stream rows to the CSV as they arrive and return how many were written.
+
+    Rows go to a temporary file that only replaces `output_path` when at
+    least one row was written, so an empty run leaves any old output intact.
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as csvfile:
-        writer = csv.DictWriter(
-            csvfile, fieldnames=["movie_id", "actor_id", "actor_name", "actor_url"]
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    written = 0
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as csvfile:
+            writer = csv.DictWriter(
+                csvfile, fieldnames=["movie_id", "actor_id", "actor_name", "actor_url"]
+            )
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                written += 1
+        if written:
+            tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return written
 
 
 def main() -> None:
@@ -84,27 +175,70 @@ def main() -> None:
         default=Path(__file__).resolve().parent / "top_cast.csv",
         help="CSV file to write results to.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parser processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="JSON cache of earlier results, used to skip unchanged HTML files "
+        "(default: .extract_cache.json next to the output).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every HTML file and do not update the cache.",
+    )
     args = parser.parse_args()
 
     movies_dir: Path = args.movies_dir
     if not movies_dir.exists():
         parser.error(f"Movies directory not found: {movies_dir}")
 
-    collected: List[Dict[str, str]] = []
+    cache_path: Path = args.cache or args.output.with_name(".extract_cache.json")
+    cache = {} if args.no_cache else load_cache(cache_path)
+    new_cache: Dict[str, dict] = {}
     missing = []
-    for movie_id, html_path in find_movie_html_files(movies_dir):
-        cast = extract_top_cast(html_path)
-        if not cast:
-            missing.append(movie_id)
-            continue
-        for entry in cast:
-            collected.append({"movie_id": movie_id, **entry})
 
-    if not collected:
+    def cast_rows() -> Iterable[Dict[str, str]]:
+        items = list(find_movie_html_files(movies_dir))
+        stale = []
+        for movie_id, html_path in items:
+            st = html_path.stat()
+            key = {"path": str(html_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            cached = cache.get(movie_id)
+            if cached is not None and all(cached.get(k) == v for k, v in key.items()):
+                new_cache[movie_id] = cached
+            else:
+                new_cache[movie_id] = key
+                stale.append((movie_id, html_path))
+
+        # Each movie is parsed independently, so spread the CPU-bound parsing over processes
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            parsed = executor.map(_extract_one, stale, chunksize=EXTRACT_CHUNKSIZE)
+            for movie_id, _ in items:
+                entry = new_cache[movie_id]
+                if "rows" not in entry:
+                    # Unchanged files were skipped, so results arrive in `items` order
+                    entry["rows"] = next(parsed)[1]
+                cast = entry["rows"]
+                if not cast:
+                    missing.append(movie_id)
+                    continue
+                for row in cast:
+                    yield {"movie_id": movie_id, **row}
+
+    written = write_output(cast_rows(), args.output)
+    if not args.no_cache:
+        save_cache(new_cache, cache_path)
+    if not written:
         parser.error("No cast entries extracted.")
 
-    write_output(collected, args.output)
-    print(f"Wrote {len(collected)} rows to {args.output}")
+    print(f"Wrote {written} rows to {args.output}")
     if missing:
         print(f"Movies without Top Cast data: {len(missing)} (e.g., {', '.join(missing[:5])})")
 
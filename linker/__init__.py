@@ -15,7 +15,7 @@ from .youtube_client import YouTubeClient
 from .gemini_matcher import GeminiMatcher
 from .music_linker import MusicLinker
 from .parser import SoundtrackParser
-from .utils import Config, setup_logging
+from .utils import Config, get_config, setup_logging
 
 __all__ = [
     "SoundtrackMetadata",
@@ -28,5 +28,6 @@ __all__ = [
     "MusicLinker",
     "SoundtrackParser",
     "Config",
+    "get_config",
     "setup_logging",
 ]
@@ -1,18 +1,43 @@
 """
 Gemini LLM matcher for selecting the best YouTube video match.
 """
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from pydantic import BaseModel, Field
 
 from .models import SoundtrackMetadata, YouTubeVideo, MatchScore
-from .prompts import build_matching_prompt
+from .prompts import MATCHING_SYSTEM_INSTRUCTION, build_bulk_matching_prompt, build_matching_prompt
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "imdb4m" / "gemini.sqlite3"
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+BULK_MAX_TASKS = 8  # soundtracks per bulk request
+BULK_MAX_PROMPT_TOKENS = 100_000  # estimated prompt size at which a bulk batch is split
+CHARS_PER_TOKEN = 4  # rough token estimate used for bulk batching
+MAX_ATTEMPTS = 5  # Gemini calls per match before falling back
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 503, 504})  # rate limited / transient server errors
+
+
+def _is_retryable(error: Exception) -> bool:
+	return isinstance(error, errors.APIError) and error.code in RETRYABLE_STATUS_CODES
+
+
+def _retry_delay(attempt: int) -> float:
+	"""Exponential backoff with jitter for the given (0-based) failed attempt."""
+	return min(RETRY_MAX_DELAY, 2 ** attempt) + random.uniform(0, 1)
+
 
 class MatchResult(BaseModel):
 	"""Structured output schema for Gemini's matching response."""
@@ -36,19 +61,121 @@ class MatchResult(BaseModel):
 	)
 
 
+class BulkMatchItem(MatchResult):
+	"""One task's decision within a bulk matching response."""
+	task_index: int = Field(
+		description="The number of the task this decision answers (1-indexed)"
+	)
+
+
+class BulkMatchResult(BaseModel):
+	"""Structured output schema for a bulk matching response."""
+	results: List[BulkMatchItem] = Field(
+		description="One decision per task"
+	)
+
+
+class JsonObjectTracker:
+	"""Follows streamed JSON text and reports when the top-level object is closed."""
+    
+	def __init__(self):
+		self.depth = 0
+		self.started = False
+		self.in_string = False
+		self.escaped = False
+    
+	def feed(self, text: str) -> int:
+		"""
+		Consume the next chunk of text.
+        
+		Returns:
+			The offset just past the closing brace if the first top-level
+			object ends in this chunk, otherwise -1
+		"""
+		for offset, char in enumerate(text):
+			if self.in_string:
+				if self.escaped:
+					self.escaped = False
+				elif char == "\\":
+					self.escaped = True
+				elif char == '"':
+					self.in_string = False
+			elif char == '"':
+				self.in_string = True
+			elif char == "{":
+				self.depth += 1
+				self.started = True
+			elif char == "}":
+				self.depth -= 1
+				if self.started and self.depth == 0:
+					return offset + 1
+		return -1
+
+
+class ResponseCache:
+	"""Persistent cache of Gemini responses, keyed by a SHA-256 of model and prompt."""
+    
+	def __init__(self, path: Path, ttl_seconds: int = CACHE_TTL_SECONDS):
+		"""
+		Open (or create) the cache database.
+        
+		Args:
+			path: SQLite file holding the cached responses
+			ttl_seconds: How long a cached response stays valid
+		"""
+		path = Path(path).expanduser()
+		path.parent.mkdir(parents=True, exist_ok=True)
+		self.ttl_seconds = ttl_seconds
+		# One connection shared by the batch worker threads, serialised by the lock
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(str(path), check_same_thread=False)
+		with self._lock, self._conn:
+			self._conn.execute(
+				"CREATE TABLE IF NOT EXISTS responses "
+				"(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+			)
+    
+	@staticmethod
+	def make_key(model_name: str, prompt: str) -> str:
+		return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+    
+	def get(self, key: str) -> Optional[str]:
+		"""Return the cached response text, or None if missing or expired."""
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT response FROM responses WHERE key = ? AND created >= ?",
+				(key, time.time() - self.ttl_seconds),
+			).fetchone()
+		return row[0] if row else None
+    
+	def set(self, key: str, response: str) -> None:
+		with self._lock, self._conn:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+				(key, response, time.time()),
+			)
+
+
 class GeminiMatcher:
 	"""Uses Google's Gemini API to match soundtrack metadata with YouTube videos."""
     
-	def __init__(self, api_key: str, model_name: str = "gemini-2.5-flash"):
+	def __init__(
+		self,
+		api_key: str,
+		model_name: str = "gemini-2.5-flash",
+		cache_path: Optional[Path] = DEFAULT_CACHE_PATH
+	):
 		"""
 		Initialize the Gemini matcher.
         
 		Args:
 			api_key: Google AI API key
 			model_name: Name of the Gemini model to use
+			cache_path: SQLite file for caching responses across runs (None disables caching)
 		"""
 		self.client = genai.Client(api_key=api_key)
 		self.model_name = model_name
+		self.cache = ResponseCache(cache_path) if cache_path else None
     
 	def find_best_match(
 		self,
@@ -75,53 +202,290 @@ class GeminiMatcher:
 		prompt = build_matching_prompt(soundtrack, candidates, use_comments)
         
 		try:
-			# Call Gemini API with structured output
-			response = self.client.models.generate_content(
-				model=self.model_name,
-				config=types.GenerateContentConfig(
-					max_output_tokens=4096,  # Increased to avoid truncation
-                    temperature=0.1,
-                    top_p=0.95,
-                    top_k=40,
-					response_mime_type="application/json",
-					response_json_schema=MatchResult.model_json_schema(),
-                ),
-				contents=prompt,
-			)
-            
-			# Log raw response for debugging
-			logger.debug(f"Raw Gemini response: {response.text[:500]}...")
-			
-			# Parse structured response using Pydantic
-			match_result = MatchResult.model_validate_json(response.text)
-			
-			# Extract the best match (convert to 0-indexed)
-			best_match_index = match_result.best_match_index - 1
-			
-			if best_match_index < 0 or best_match_index >= len(candidates):
-				logger.warning(f"Invalid match index: {best_match_index}. Using first candidate.")
-				best_match_index = 0
-			
-			best_match = candidates[best_match_index]
-			
-			# Create match score
-			match_score = MatchScore(
-				confidence=match_result.confidence,
-				reasoning=match_result.reasoning,
-				key_factors=match_result.key_factors,
-				concerns=match_result.concerns
-			)
-			
-			return best_match, match_score
-            
+			cache_key, match_result = self._lookup_cache(prompt)
+			if match_result is None:
+				match_result = self._generate_match(prompt)
+				self._store_cache(cache_key, match_result)
+			return self._select_candidate(candidates, match_result)
 		except Exception as e:
-			logger.error(f"Error calling Gemini API: {e}")
-			logger.debug(f"Response text (if available): {getattr(response, 'text', 'N/A')[:1000] if 'response' in locals() else 'N/A'}")
-			# Fallback: return the first candidate with low confidence
-			fallback_score = MatchScore(
-				confidence=0.3,
-				reasoning=f"Error in LLM matching: {str(e)[:200]}. Returning top search result as fallback.",
-				key_factors=["Fallback to top search result"],
-				concerns=["LLM analysis failed", f"Error type: {type(e).__name__}"]
-			)
-			return candidates[0], fallback_score
+			return self._fallback(candidates, e)
+    
+	async def find_best_match_async(
+		self,
+		soundtrack: SoundtrackMetadata,
+		candidates: List[YouTubeVideo],
+		use_comments: bool = True
+	) -> tuple[Optional[YouTubeVideo], Optional[MatchScore]]:
+		"""
+		Async version of find_best_match using the client's asyncio API.
+        
+		The Gemini request is awaited instead of blocking a thread, so many
+		matches can be in flight at once.
+		"""
+		if not candidates:
+			logger.warning("No candidates provided for matching")
+			return None, None
+        
+		prompt = build_matching_prompt(soundtrack, candidates, use_comments)
+        
+		try:
+			cache_key, match_result = self._lookup_cache(prompt)
+			if match_result is None:
+				match_result = await self._generate_match_async(prompt)
+				self._store_cache(cache_key, match_result)
+			return self._select_candidate(candidates, match_result)
+		except Exception as e:
+			return self._fallback(candidates, e)
+    
+	def find_best_matches_bulk(
+		self,
+		pairs: List[Tuple[SoundtrackMetadata, List[YouTubeVideo]]],
+		use_comments: bool = True,
+		max_batch_size: int = BULK_MAX_TASKS
+	) -> List[tuple[Optional[YouTubeVideo], Optional[MatchScore]]]:
+		"""
+		Find the best match for several soundtracks with as few Gemini calls as possible.
+        
+		Soundtracks already in the response cache are answered from it; the
+		rest are sent up to max_batch_size at a time, each batch as a single
+		request asking for one decision per task.
+        
+		Args:
+			pairs: (soundtrack, candidates) pairs to match
+			use_comments: Whether to include comments in the analysis
+			max_batch_size: Maximum number of soundtracks per request
+            
+		Returns:
+			List of (best_match_video, match_score) tuples, in the order of pairs
+		"""
+		results: List[tuple[Optional[YouTubeVideo], Optional[MatchScore]]] = [(None, None)] * len(pairs)
+		pending = []  # (pair index, prompt, cache key) still needing an answer
+		for i, (soundtrack, candidates) in enumerate(pairs):
+			if not candidates:
+				logger.warning(f"No candidates provided for matching '{soundtrack.title}'")
+				continue
+			prompt = build_matching_prompt(soundtrack, candidates, use_comments)
+			try:
+				cache_key, match_result = self._lookup_cache(prompt)
+			except Exception as e:
+				logger.debug(f"Ignoring unreadable cache entry: {e}")
+				cache_key, match_result = None, None
+			if match_result is not None:
+				results[i] = self._select_candidate(candidates, match_result)
+			else:
+				pending.append((i, prompt, cache_key))
+        
+		for batch in self._bulk_batches(pending, max_batch_size):
+			error: Optional[Exception] = None
+			try:
+				decisions = self._generate_bulk_matches([prompt for _, prompt, _ in batch])
+			except Exception as e:
+				decisions, error = {}, e
+			for task_index, (i, _, cache_key) in enumerate(batch, 1):
+				candidates = pairs[i][1]
+				decision = decisions.get(task_index)
+				if decision is None:
+					results[i] = self._fallback(
+						candidates, error or ValueError(f"No decision returned for task {task_index}")
+					)
+					continue
+				self._store_cache(cache_key, MatchResult(**decision.model_dump(exclude={"task_index"})))
+				results[i] = self._select_candidate(candidates, decision)
+        
+		return results
+    
+	@staticmethod
+	def _bulk_batches(pending: list, max_batch_size: int):
+		"""Split pending (index, prompt, key) items into batches by count and estimated size."""
+		batch, batch_tokens = [], 0
+		for item in pending:
+			tokens = len(item[1]) // CHARS_PER_TOKEN
+			if batch and (len(batch) >= max_batch_size or batch_tokens + tokens > BULK_MAX_PROMPT_TOKENS):
+				yield batch
+				batch, batch_tokens = [], 0
+			batch.append(item)
+			batch_tokens += tokens
+		if batch:
+			yield batch
+    
+	def _lookup_cache(self, prompt: str) -> tuple[Optional[str], Optional[MatchResult]]:
+		"""Return (cache_key, cached MatchResult or None) for the prompt."""
+		if not self.cache:
+			return None, None
+		cache_key = ResponseCache.make_key(self.model_name, MATCHING_SYSTEM_INSTRUCTION + prompt)
+		response_text = self.cache.get(cache_key)
+		if response_text is None:
+			return cache_key, None
+		logger.debug("Using cached Gemini response")
+		return cache_key, MatchResult.model_validate_json(response_text)
+    
+	def _store_cache(self, cache_key: Optional[str], match_result: MatchResult) -> None:
+		if self.cache and cache_key:
+			self.cache.set(cache_key, match_result.model_dump_json())
+    
+	@staticmethod
+	def _select_candidate(
+		candidates: List[YouTubeVideo],
+		match_result: MatchResult
+	) -> tuple[YouTubeVideo, MatchScore]:
+		"""Map Gemini's answer back to the chosen candidate and its score."""
+		# Extract the best match (convert to 0-indexed)
+		best_match_index = match_result.best_match_index - 1
+		
+		if best_match_index < 0 or best_match_index >= len(candidates):
+			logger.warning(f"Invalid match index: {best_match_index}. Using first candidate.")
+			best_match_index = 0
+		
+		best_match = candidates[best_match_index]
+		
+		# Create match score
+		match_score = MatchScore(
+			confidence=match_result.confidence,
+			reasoning=match_result.reasoning,
+			key_factors=match_result.key_factors,
+			concerns=match_result.concerns
+		)
+		
+		return best_match, match_score
+    
+	@staticmethod
+	def _fallback(candidates: List[YouTubeVideo], e: Exception) -> tuple[YouTubeVideo, MatchScore]:
+		"""Return the first candidate with low confidence after a failed LLM call."""
+		logger.error(f"Error calling Gemini API: {e}")
+		fallback_score = MatchScore(
+			confidence=0.3,
+			reasoning=f"Error in LLM matching: {str(e)[:200]}. Returning top search result as fallback.",
+			key_factors=["Fallback to top search result"],
+			concerns=["LLM analysis failed", f"Error type: {type(e).__name__}"]
+		)
+		return candidates[0], fallback_score
+    
+	@staticmethod
+	def _generation_config(
+		schema: type[BaseModel] = MatchResult,
+		max_output_tokens: int = 4096
+	) -> types.GenerateContentConfig:
+		"""Build the structured-output config, with the matching instructions as system instruction."""
+		return types.GenerateContentConfig(
+			max_output_tokens=max_output_tokens,  # 4096 per match, to avoid truncation
+			temperature=0.1,
+			top_p=0.95,
+			top_k=40,
+			response_mime_type="application/json",
+			response_json_schema=schema.model_json_schema(),
+			system_instruction=MATCHING_SYSTEM_INSTRUCTION,
+		)
+    
+	@staticmethod
+	def _parse_response(response_text: str) -> MatchResult:
+		# Log raw response for debugging
+		logger.debug(f"Raw Gemini response: {response_text[:500]}...")
+		
+		# Parse structured response using Pydantic
+		try:
+			return MatchResult.model_validate_json(response_text)
+		except Exception:
+			logger.debug(f"Response text: {(response_text or 'N/A')[:1000]}")
+			raise
+    
+	def _call_with_retries(self, call, *args):
+		"""Run call(*args), retrying rate-limit and transient server errors with backoff."""
+		for attempt in range(MAX_ATTEMPTS):
+			try:
+				return call(*args)
+			except Exception as e:
+				if not _is_retryable(e) or attempt == MAX_ATTEMPTS - 1:
+					raise
+				delay = _retry_delay(attempt)
+				logger.warning(
+					f"Gemini call failed ({e}); retry {attempt + 1}/{MAX_ATTEMPTS - 1} in {delay:.1f}s"
+				)
+				time.sleep(delay)
+    
+	async def _call_with_retries_async(self, call, *args):
+		"""Async version of _call_with_retries."""
+		for attempt in range(MAX_ATTEMPTS):
+			try:
+				return await call(*args)
+			except Exception as e:
+				if not _is_retryable(e) or attempt == MAX_ATTEMPTS - 1:
+					raise
+				delay = _retry_delay(attempt)
+				logger.warning(
+					f"Gemini call failed ({e}); retry {attempt + 1}/{MAX_ATTEMPTS - 1} in {delay:.1f}s"
+				)
+				await asyncio.sleep(delay)
+    
+	def _generate_match(self, prompt: str) -> MatchResult:
+		"""Ask Gemini to pick the best candidate for the prompt, retrying transient errors."""
+		return self._call_with_retries(self._generate_match_once, prompt)
+    
+	async def _generate_match_async(self, prompt: str) -> MatchResult:
+		"""Async version of _generate_match."""
+		return await self._call_with_retries_async(self._generate_match_once_async, prompt)
+    
+	def _generate_match_once(self, prompt: str) -> MatchResult:
+		# Stream the structured output and stop reading as soon as the JSON
+		# object is complete, instead of waiting for the whole response
+		stream = self.client.models.generate_content_stream(
+			model=self.model_name,
+			config=self._generation_config(),
+			contents=prompt,
+		)
+		tracker = JsonObjectTracker()
+		parts = []
+		try:
+			for chunk in stream:
+				text = chunk.text or ""
+				end = tracker.feed(text)
+				if end >= 0:
+					parts.append(text[:end])
+					break
+				parts.append(text)
+		finally:
+			close = getattr(stream, "close", None)
+			if close:
+				close()
+		return self._parse_response("".join(parts))
+    
+	async def _generate_match_once_async(self, prompt: str) -> MatchResult:
+		stream = await self.client.aio.models.generate_content_stream(
+			model=self.model_name,
+			config=self._generation_config(),
+			contents=prompt,
+		)
+		tracker = JsonObjectTracker()
+		parts = []
+		try:
+			async for chunk in stream:
+				text = chunk.text or ""
+				end = tracker.feed(text)
+				if end >= 0:
+					parts.append(text[:end])
+					break
+				parts.append(text)
+		finally:
+			aclose = getattr(stream, "aclose", None)
+			if aclose:
+				await aclose()
+		return self._parse_response("".join(parts))
+    
+	def _generate_bulk_matches(self, prompts: List[str]) -> Dict[int, BulkMatchItem]:
+		"""Ask Gemini to answer several matching prompts at once; returns decisions by task number."""
+		return self._call_with_retries(self._generate_bulk_matches_once, prompts)
+    
+	def _generate_bulk_matches_once(self, prompts: List[str]) -> Dict[int, BulkMatchItem]:
+		response = self.client.models.generate_content(
+			model=self.model_name,
+			config=self._generation_config(
+				schema=BulkMatchResult,
+				max_output_tokens=4096 * len(prompts),
+			),
+			contents=build_bulk_matching_prompt(prompts),
+		)
+		logger.debug(f"Raw Gemini bulk response: {response.text[:500]}...")
+		parsed = BulkMatchResult.model_validate_json(response.text)
+		decisions: Dict[int, BulkMatchItem] = {}
+		for item in parsed.results:
+			decisions.setdefault(item.task_index, item)
+		return decisions
@@ -1,14 +1,24 @@
 """
 Data models for the music linker pipeline.
 """
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
+# Only this much of each candidate reaches the matching prompt, so longer
+# text is dropped as soon as it is received instead of being carried along
+MAX_DESCRIPTION_CHARS = 500
+MAX_COMMENT_CHARS = 80
+MAX_COMMENTS_PER_VIDEO = 5
+
 
 class SoundtrackMetadata(BaseModel):
 	"""Represents metadata for a soundtrack entry from IMDb."""
     
+	model_config = ConfigDict(frozen=True)
+    
 	title: str = Field(..., description="Song title")
 	composer: Optional[str] = Field(None, description="Composer or writer")
 	lyrics_by: Optional[str] = Field(None, description="Lyricist")
@@ -39,6 +49,18 @@ class SoundtrackMetadata(BaseModel):
 
 		return " ".join(parts)
     
+	@cached_property
+	def search_query(self) -> str:
+		"""The full search query (title, performer and movie), computed once per soundtrack."""
+		return self.to_search_query()
+    
+	def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "SoundtrackMetadata":
+		"""Copy the model; a copy with updated fields recomputes search_query."""
+		copied = super().model_copy(update=update, deep=deep)
+		if update:
+			copied.__dict__.pop('search_query', None)
+		return copied
+    
 	def to_context_dict(self) -> Dict[str, Any]:
 		"""Convert to a dictionary for LLM context."""
 		return {
@@ -73,7 +95,10 @@ class SoundtrackMetadata(BaseModel):
 		return "\n".join(lines)
 
 
-class YouTubeComment(BaseModel):
+# Comments are the most numerous objects and their fields come straight from
+# the API, so a slotted dataclass is used instead of a validated model
+@dataclass(slots=True, frozen=True)
+class YouTubeComment:
 	"""Represents a YouTube comment."""
     
 	author: str
@@ -85,6 +110,8 @@ class YouTubeComment(BaseModel):
 class YouTubeVideo(BaseModel):
 	"""Represents a YouTube video with metadata."""
     
+	model_config = ConfigDict(frozen=True)
+    
 	video_id: str
 	title: str
 	url: str
@@ -96,6 +123,16 @@ class YouTubeVideo(BaseModel):
 	duration: Optional[str] = None
 	comments: List[YouTubeComment] = Field(default_factory=list)
     
+	@field_validator('description')
+	@classmethod
+	def _truncate_description(cls, value: Optional[str]) -> Optional[str]:
+		return value[:MAX_DESCRIPTION_CHARS] if value else value
+    
+	@field_validator('comments')
+	@classmethod
+	def _limit_comments(cls, value: List[YouTubeComment]) -> List[YouTubeComment]:
+		return value[:MAX_COMMENTS_PER_VIDEO]
+    
 	def get_url(self) -> str:
 		"""Get the full YouTube URL."""
 		return f"https://www.youtube.com/watch?v={self.video_id}"
@@ -125,6 +162,8 @@ class YouTubeVideo(BaseModel):
 class MatchScore(BaseModel):
 	"""Represents the LLM's confidence score and reasoning for a match."""
     
+	model_config = ConfigDict(frozen=True)
+    
 	confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0-1)")
 	reasoning: str = Field(..., description="Explanation for the score")
 	key_factors: List[str] = Field(default_factory=list, description="Key matching factors")
@@ -134,6 +173,8 @@ class MatchScore(BaseModel):
 class MusicLinkResult(BaseModel):
 	"""Final result of the music linking process."""
     
+	model_config = ConfigDict(frozen=True)
+    
 	soundtrack: SoundtrackMetadata
 	best_match: Optional[YouTubeVideo] = None
 	match_score: Optional[MatchScore] = None
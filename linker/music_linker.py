@@ -1,11 +1,13 @@
 """
 Main music linker pipeline orchestrator.
 """
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import logging
 import time
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 
 from .models import SoundtrackMetadata, MusicLinkResult, YouTubeVideo
@@ -15,6 +17,19 @@ from .gemini_matcher import GeminiMatcher
 logger = logging.getLogger(__name__)
 
 
+def _dedup_key(soundtrack: SoundtrackMetadata) -> Tuple:
+	"""
+	Key under which identical soundtrack entries share one lookup.
+    
+	The title is compared case- and whitespace-insensitively; every other
+	field feeds the search query or the matching prompt, so it must match
+	exactly for two entries to get the same answer.
+	"""
+	context = soundtrack.to_context_dict()
+	context['title'] = ' '.join(soundtrack.title.casefold().split())
+	return tuple(context.values())
+
+
 class MusicLinker:
 	"""
 	Main pipeline for linking soundtrack metadata to YouTube videos.
@@ -61,6 +76,8 @@ class MusicLinker:
 		Returns:
 			MusicLinkResult with the best match and analysis
 		"""
+		# The full query is both the first attempt and the one reported on errors
+		full_query = soundtrack.search_query
 		try:
 			retries = 3
 			for attempt in range(retries):
@@ -69,7 +86,7 @@ class MusicLinker:
 				add_movie = attempt < 1  # Add movie title only on first attempt
 				add_performer = attempt < 2  # Add performer for first 2 attempts
 				# Last attempt uses only the song title for broader search
-				search_query = soundtrack.to_search_query(
+				search_query = full_query if attempt == 0 else soundtrack.to_search_query(
 					add_movie=add_movie, add_performer=add_performer)
 				logger.info(f"Searching for: {search_query}")
 				# Search YouTube for candidates
@@ -122,7 +139,83 @@ class MusicLinker:
 			logger.error(f"Error finding match for '{soundtrack.title}': {e}")
 			return MusicLinkResult(
 				soundtrack=soundtrack,
-				search_query=soundtrack.to_search_query(),
+				search_query=full_query,
+				error=str(e)
+			)
+    
+	async def find_match_async(self, soundtrack: SoundtrackMetadata) -> MusicLinkResult:
+		"""
+		Async version of find_match.
+        
+		The Gemini call is awaited natively; the YouTube client is synchronous,
+		so its calls run in worker threads and backoff uses asyncio.sleep,
+		leaving the event loop free to drive other soundtracks meanwhile.
+        
+		Args:
+			soundtrack: Soundtrack metadata
+            
+		Returns:
+			MusicLinkResult with the best match and analysis
+		"""
+		# The full query is both the first attempt and the one reported on errors
+		full_query = soundtrack.search_query
+		try:
+			retries = 3
+			for attempt in range(retries):
+				logger.info(f"Search attempt {attempt + 1} for '{soundtrack.title}'")
+				add_movie = attempt < 1  # Add movie title only on first attempt
+				add_performer = attempt < 2  # Add performer for first 2 attempts
+				search_query = full_query if attempt == 0 else soundtrack.to_search_query(
+					add_movie=add_movie, add_performer=add_performer)
+				logger.info(f"Searching for: {search_query}")
+				candidates = await asyncio.to_thread(
+					self.youtube_client.search_videos,
+					query=search_query,
+					max_results=self.max_search_results
+				)
+				if candidates:
+					break
+				backoff_delay = (2 ** attempt) + random.uniform(0, 1)
+				logger.info(f"No candidates found, retrying in {backoff_delay:.2f} seconds...")
+				await asyncio.sleep(backoff_delay)
+            
+			if not candidates:
+				return MusicLinkResult(
+					soundtrack=soundtrack,
+					search_query=search_query,
+					error="No YouTube videos found"
+				)
+            
+			logger.info(f"Found {len(candidates)} candidates")
+            
+			if self.use_comments:
+				logger.info("Fetching comments for candidates...")
+				candidates = await asyncio.to_thread(
+					self.youtube_client.enrich_videos_with_comments,
+					candidates,
+					max_comments_per_video=self.max_comments_per_video
+				)
+            
+			logger.info("Analyzing candidates with LLM...")
+			best_match, match_score = await self.gemini_matcher.find_best_match_async(
+				soundtrack=soundtrack,
+				candidates=candidates,
+				use_comments=self.use_comments
+			)
+            
+			return MusicLinkResult(
+				soundtrack=soundtrack,
+				best_match=best_match,
+				match_score=match_score,
+				candidates=candidates,
+				search_query=search_query
+			)
+            
+		except Exception as e:
+			logger.error(f"Error finding match for '{soundtrack.title}': {e}")
+			return MusicLinkResult(
+				soundtrack=soundtrack,
+				search_query=full_query,
 				error=str(e)
 			)
     
@@ -161,7 +254,7 @@ class MusicLinker:
 				logger.error(f"Exception processing '{soundtrack.title}': {e}")
 				results.append(MusicLinkResult(
 					soundtrack=soundtrack,
-					search_query=soundtrack.to_search_query(),
+					search_query=soundtrack.search_query,
 					error=str(e)
 				))
 			
@@ -180,30 +273,56 @@ class MusicLinker:
 		"""
 		Find matches for multiple soundtracks in parallel.
         
+		Synchronous wrapper around find_matches_batch_async.
+        
 		Args:
 			soundtracks: List of soundtrack metadata
-			max_workers: Maximum number of parallel workers
+			max_workers: Maximum number of soundtracks processed concurrently
             
 		Returns:
-			List of MusicLinkResult objects
+			List of MusicLinkResult objects, in input order
 		"""
-		results = []
+		coro = self.find_matches_batch_async(soundtracks, max_workers=max_workers)
+		try:
+			asyncio.get_running_loop()
+		except RuntimeError:
+			return asyncio.run(coro)
+		# Called from inside a running event loop (e.g. a notebook): run the
+		# batch on a fresh loop in a helper thread
+		with ThreadPoolExecutor(max_workers=1) as executor:
+			return executor.submit(asyncio.run, coro).result()
+    
+	async def find_matches_batch_async(
+		self,
+		soundtracks: List[SoundtrackMetadata],
+		max_workers: int = 3
+	) -> List[MusicLinkResult]:
+		"""
+		Find matches for multiple soundtracks concurrently on one event loop.
+        
+		Args:
+			soundtracks: List of soundtrack metadata
+			max_workers: Maximum number of soundtracks in flight at once
+            
+		Returns:
+			List of MusicLinkResult objects, in input order
+		"""
+		semaphore = asyncio.Semaphore(max_workers)
+        
+		# IMDb often repeats the same entry (e.g. "Traditional" songs), so look
+		# each distinct entry up once and fan the result out to its duplicates
+		groups: Dict[Tuple, List[int]] = defaultdict(list)
+		for index, soundtrack in enumerate(soundtracks):
+			groups[_dedup_key(soundtrack)].append(index)
+		if len(groups) < len(soundtracks):
+			logger.info(f"Deduplicated {len(soundtracks)} tracks into {len(groups)} lookups")
+		members = list(groups.values())
         
-		# Process in parallel with thread pool
-		with ThreadPoolExecutor(max_workers=max_workers) as executor:
-			# Submit all tasks
-			future_to_soundtrack = {
-				executor.submit(self.find_match, soundtrack): soundtrack
-				for soundtrack in soundtracks
-			}
-            
-			# Collect results as they complete with progress bar
-			with tqdm(total=len(soundtracks), desc="Processing tracks", unit="track") as pbar:
-				for future in as_completed(future_to_soundtrack):
-					soundtrack = future_to_soundtrack[future]
+		with tqdm(total=len(members), desc="Processing tracks", unit="track") as pbar:
+			async def process(soundtrack: SoundtrackMetadata) -> MusicLinkResult:
+				async with semaphore:
 					try:
-						result = future.result()
-						results.append(result)
+						result = await self.find_match_async(soundtrack)
 						
 						if result.is_successful():
 							logger.info(
@@ -216,12 +335,22 @@ class MusicLinker:
 							
 					except Exception as e:
 						logger.error(f"Exception processing '{soundtrack.title}': {e}")
-						results.append(MusicLinkResult(
+						result = MusicLinkResult(
 							soundtrack=soundtrack,
-							search_query=soundtrack.to_search_query(),
+							search_query=soundtrack.search_query,
 							error=str(e)
-						))
+						)
 					
 					pbar.update(1)
+					return result
+            
+			group_results = await asyncio.gather(
+				*(process(soundtracks[indices[0]]) for indices in members)
+			)
         
+		results: List[Optional[MusicLinkResult]] = [None] * len(soundtracks)
+		for indices, result in zip(members, group_results):
+			results[indices[0]] = result
+			for index in indices[1:]:
+				results[index] = result.model_copy(update={'soundtrack': soundtracks[index]})
 		return results
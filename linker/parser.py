@@ -9,6 +9,25 @@ from rdflib.term import Literal
 from .models import SoundtrackMetadata
 
 
+# Lines starting with any of these are metadata for the current song; any
+# other line starts a new song
+_METADATA_PREFIX_RE = re.compile(
+	r'Music by|Lyrics by|Written by|Performed by|Produced by|Arranged by'
+	r'|includes|Celine Dion|by |\(uncredited\)'
+)
+# Metadata prefix -> (field it sets, prefix stripped by _extract_name)
+_PREFIX_FIELDS = {
+	'Music by': ('composer', 'Music by'),
+	'Lyrics by': ('lyrics_by', 'Lyrics by'),
+	'Written by': ('composer', 'Written by'),
+	'Performed by': ('performer', 'Performed'),
+	'Produced by': ('producer', 'Produced'),
+}
+# Everything _extract_name strips from a name, in one pass: "(as ...)" aliases
+# anywhere, and the rest of the line from " and ..." or "& ..."
+_NAME_CLEANUP_RE = re.compile(r'\s*\(as [^)]+\)|\s+and.*|\s*&.*')
+
+
 class SoundtrackParser:
 	"""Parser for IMDb soundtrack text format."""
     
@@ -25,22 +44,16 @@ class SoundtrackParser:
 			List of SoundtrackMetadata objects
 		"""
 		soundtracks = []
-		lines = text.strip().split('\n')
+		# Strip once up front and drop blank lines, so the loop only dispatches
+		lines = [stripped for line in text.splitlines() if (stripped := line.strip())]
         
 		current_title = None
 		current_data = {}
         
 		for line in lines:
-			line = line.strip()
-			if not line:
-				continue
-            
 			# Check if this is a new song title (first line, not starting with metadata keywords)
-			if not any(line.startswith(prefix) for prefix in [
-				'Music by', 'Lyrics by', 'Written by', 'Performed by', 
-				'Produced by', 'Arranged by', 'includes', 'Celine Dion',
-				'by ', '(uncredited)'
-			]):
+			prefix_match = _METADATA_PREFIX_RE.match(line)
+			if prefix_match is None:
 				# Save previous entry if exists
 				if current_title:
 					soundtrack = SoundtrackParser._create_soundtrack(
@@ -54,17 +67,10 @@ class SoundtrackParser:
 				current_data['is_uncredited'] = False
             
 			# Parse metadata lines
-			elif line.startswith('Music by'):
-				current_data['composer'] = SoundtrackParser._extract_name(line, 'Music by')
-			elif line.startswith('Lyrics by'):
-				current_data['lyrics_by'] = SoundtrackParser._extract_name(line, 'Lyrics by')
-			elif line.startswith('Written by'):
-				current_data['composer'] = SoundtrackParser._extract_name(line, 'Written by')
-			elif line.startswith('Performed by') or line.startswith('Performed &'):
-				current_data['performer'] = SoundtrackParser._extract_name(line, 'Performed')
-			elif line.startswith('Produced by') or line.startswith('Produced and'):
-				current_data['producer'] = SoundtrackParser._extract_name(line, 'Produced')
-			elif line.startswith('by ') and 'composer' not in current_data:
+			elif prefix_match.group() in _PREFIX_FIELDS:
+				field, name_prefix = _PREFIX_FIELDS[prefix_match.group()]
+				current_data[field] = SoundtrackParser._extract_name(line, name_prefix)
+			elif prefix_match.group() == 'by ' and 'composer' not in current_data:
 				# "by Author Name" format
 				current_data['composer'] = SoundtrackParser._extract_name(line, 'by')
 			elif '(uncredited)' in line:
@@ -248,12 +254,7 @@ class SoundtrackParser:
 			name = line.strip()
         
 		# Clean up common patterns
-		name = re.sub(r'\s*\(as [^)]+\)', '', name)  # Remove "(as ...)"
-		name = re.sub(r'\s+and Arranged.*', '', name)  # Remove "and Arranged by"
-		name = re.sub(r'\s+and.*', '', name)  # Remove "and ..."
-		name = re.sub(r'\s*&.*', '', name)  # Remove "& ..."
-        
-		return name.strip()
+		return _NAME_CLEANUP_RE.sub('', name).strip()
     
 	@staticmethod
 	def _create_soundtrack(
@@ -6,67 +6,12 @@ from typing import List
 from .models import SoundtrackMetadata, YouTubeVideo
 
 
-def build_matching_prompt(
-	soundtrack: SoundtrackMetadata,
-	candidates: List[YouTubeVideo],
-	use_comments: bool = True
-) -> str:
-	"""
-	Build the prompt for matching a soundtrack to YouTube videos.
-	
-	Args:
-		soundtrack: Soundtrack metadata to match
-		candidates: List of candidate YouTube videos
-		use_comments: Whether to include comments in the analysis
-		
-	Returns:
-		Formatted prompt string for the LLM
-	"""
-	# Format soundtrack metadata
-	soundtrack_info = f"""
-## Soundtrack Metadata
-- **Title**: {soundtrack.title}
-- **Performer**: {soundtrack.performer or 'Unknown'}
-- **Composer**: {soundtrack.composer or 'Unknown'}
-- **Lyrics By**: {soundtrack.lyrics_by or 'Unknown'}
-- **Producer**: {soundtrack.producer or 'Unknown'}
-- **Movie**: {soundtrack.movie_title or 'Unknown'}
-- **Is Traditional**: {soundtrack.is_traditional}
-- **Additional Info**: {soundtrack.additional_info or 'None'}
-"""
-	
-	# Format candidate videos
-	candidates_info = []
-	for i, video in enumerate(candidates, 1):
-		video_info = f"""
-### Candidate {i}
-- **Video ID**: {video.video_id}
-- **Title**: {video.title}
-- **Channel**: {video.channel_title}
-- **Description**: {video.description[:500] if video.description else 'No description'}...
-- **Views**: {video.view_count:,}
-- **Likes**: {video.like_count:,}
-- **Duration**: {video.duration}
-- **Published**: {video.published_at}
-"""
-		
-		if use_comments and video.comments:
-			top_comments = video.comments[:5]
-			comments_text = "\n".join([
-				f"  - {comment.author}: {comment.text[:80]}..."
-				for comment in top_comments
-			])
-			video_info += f"- **Top Comments**:\n{comments_text}\n"
-		
-		candidates_info.append(video_info)
-	
-	# Construct the full prompt
-	prompt = f"""You are an expert music curator tasked with finding the best YouTube video match for a specific soundtrack from a movie.
-
-{soundtrack_info}
+# Instructions shared by every matching request. They are sent as the system
+# instruction rather than repeated in each prompt; build_matching_prompt only
+# carries the per-soundtrack data.
+MATCHING_SYSTEM_INSTRUCTION = """You are an expert music curator tasked with finding the best YouTube video match for a specific soundtrack from a movie.
 
-## Candidate YouTube Videos
-{''.join(candidates_info)}
+Each request gives the soundtrack metadata followed by a numbered list of candidate YouTube videos.
 
 ## Your Task
 Analyze each candidate video and determine which one is the BEST match for the soundtrack metadata provided. Consider:
@@ -81,7 +26,7 @@ Analyze each candidate video and determine which one is the BEST match for the s
 
 ## Your Response
 Select the best match and provide:
-- **best_match_index**: The candidate number (1 to {len(candidates)})
+- **best_match_index**: The candidate number (1 to the number of candidates)
 - **confidence**: Score from 0.0 to 1.0
 - **reasoning**: Detailed explanation of your choice
 - **key_factors**: List of supporting factors
@@ -89,5 +34,111 @@ Select the best match and provide:
 
 Be thorough in your analysis.
 """
+
+
+_SOUNDTRACK_TEMPLATE = """
+## Soundtrack Metadata
+- **Title**: {title}
+- **Performer**: {performer}
+- **Composer**: {composer}
+- **Lyrics By**: {lyrics_by}
+- **Producer**: {producer}
+- **Movie**: {movie_title}
+- **Is Traditional**: {is_traditional}
+- **Additional Info**: {additional_info}
+"""
+
+_CANDIDATE_TEMPLATE = """
+### Candidate {index}
+- **Video ID**: {video_id}
+- **Title**: {title}
+- **Channel**: {channel_title}
+- **Description**: {description}...
+- **Views**: {view_count:,}
+- **Likes**: {like_count:,}
+- **Duration**: {duration}
+- **Published**: {published_at}
+"""
+
+_CANDIDATES_HEADER = "\n## Candidate YouTube Videos ({count})\n"
+
+
+def build_matching_prompt(
+	soundtrack: SoundtrackMetadata,
+	candidates: List[YouTubeVideo],
+	use_comments: bool = True
+) -> str:
+	"""
+	Build the per-request prompt for matching a soundtrack to YouTube videos.
+	
+	The matching instructions live in MATCHING_SYSTEM_INSTRUCTION; this is
+	only the soundtrack metadata and the candidate list.
+	
+	Args:
+		soundtrack: Soundtrack metadata to match
+		candidates: List of candidate YouTube videos
+		use_comments: Whether to include comments in the analysis
+		
+	Returns:
+		Formatted prompt string for the LLM
+	"""
+	# Every piece is appended to one list and joined once at the end
+	chunks = [
+		_SOUNDTRACK_TEMPLATE.format(
+			title=soundtrack.title,
+			performer=soundtrack.performer or 'Unknown',
+			composer=soundtrack.composer or 'Unknown',
+			lyrics_by=soundtrack.lyrics_by or 'Unknown',
+			producer=soundtrack.producer or 'Unknown',
+			movie_title=soundtrack.movie_title or 'Unknown',
+			is_traditional=soundtrack.is_traditional,
+			additional_info=soundtrack.additional_info or 'None',
+		),
+		_CANDIDATES_HEADER.format(count=len(candidates)),
+	]
+	
+	for i, video in enumerate(candidates, 1):
+		chunks.append(_CANDIDATE_TEMPLATE.format(
+			index=i,
+			video_id=video.video_id,
+			title=video.title,
+			channel_title=video.channel_title,
+			description=video.description or 'No description',
+			view_count=video.view_count,
+			like_count=video.like_count,
+			duration=video.duration,
+			published_at=video.published_at,
+		))
+		
+		if use_comments and video.comments:
+			# Descriptions, comment text and comment count are already capped
+			# when the video is built (see models.MAX_*)
+			chunks.append("- **Top Comments**:\n")
+			for comment in video.comments:
+				chunks.append(f"  - {comment.author}: {comment.text}...\n")
+	
+	return "".join(chunks)
+
+
+def build_bulk_matching_prompt(task_prompts: List[str]) -> str:
+	"""
+	Combine several matching prompts into one request.
+	
+	Each prompt from build_matching_prompt becomes a numbered task; the model
+	answers all of them in one response, so the request overhead is paid
+	once per batch instead of once per soundtrack.
 	
-	return prompt
+	Args:
+		task_prompts: Per-soundtrack prompts, in task order
+		
+	Returns:
+		Formatted prompt string for the LLM
+	"""
+	tasks = "".join(
+		f"\n# Task {i}\n{task_prompt}\n"
+		for i, task_prompt in enumerate(task_prompts, 1)
+	)
+	return f"""This request contains {len(task_prompts)} independent matching tasks. Treat each task on its own: candidate numbers refer only to the candidates listed in that task.
+
+Return one entry in "results" per task, with "task_index" set to the task number (1 to {len(task_prompts)}).
+{tasks}"""
@@ -3,7 +3,8 @@ Configuration and utilities for the music linker.
 """
 import os
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -59,6 +60,20 @@ class Config:
 		return True
 
 
+@lru_cache(maxsize=None)
+def get_config(env_file: Optional[str] = None) -> Config:
+	"""
+	Return the shared Config for an env file, loading it on first use.
+    
+	The environment is read and parsed once per process instead of every
+	time a component needs the settings.
+    
+	Args:
+		env_file: Path to .env file (optional)
+	"""
+	return Config(env_file)
+
+
 def setup_logging(level: str = 'INFO'):
 	"""
 	Configure logging for the application.
@@ -73,110 +88,182 @@ def setup_logging(level: str = 'INFO'):
 	)
 
 
-def save_results_to_json(results: list, output_file: str):
+def _result_to_dict(result) -> dict:
+	"""Convert a MusicLinkResult into the JSON-serialisable dict written to disk."""
+	data = {
+		'soundtrack': {
+			'title': result.soundtrack.title,
+			'performer': result.soundtrack.performer,
+			'composer': result.soundtrack.composer,
+			'movie_title': result.soundtrack.movie_title,
+		},
+		'search_query': result.search_query,
+		'timestamp': result.timestamp.isoformat(),
+	}
+    
+	if result.best_match:
+		data['best_match'] = {
+			'video_id': result.best_match.video_id,
+			'url': result.best_match.url,
+			'title': result.best_match.title,
+			'channel': result.best_match.channel_title,
+			'views': result.best_match.view_count,
+			'likes': result.best_match.like_count,
+		}
+    
+	if result.match_score:
+		data['match_score'] = {
+			'confidence': result.match_score.confidence,
+			'reasoning': result.match_score.reasoning,
+			'key_factors': result.match_score.key_factors,
+			'concerns': result.match_score.concerns,
+		}
+    
+	if result.error:
+		data['error'] = result.error
+    
+	return data
+
+
+def save_results_to_json(results: Iterable, output_file: str):
 	"""
 	Save music link results to a JSON file.
     
+	Results are written one at a time as they are converted, so the whole
+	output never has to be held in memory. A ``.jsonl`` output file gets
+	one JSON object per line (JSON Lines) instead of a single array.
+    
 	Args:
-		results: List of MusicLinkResult objects
+		results: Iterable of MusicLinkResult objects
 		output_file: Path to output file
 	"""
 	import json
-	from datetime import datetime
     
-	output_data = []
+	# Create output directory if needed
+	output_path = Path(output_file)
+	output_path.parent.mkdir(parents=True, exist_ok=True)
     
-	for result in results:
-		data = {
-			'soundtrack': {
-				'title': result.soundtrack.title,
-				'performer': result.soundtrack.performer,
-				'composer': result.soundtrack.composer,
-				'movie_title': result.soundtrack.movie_title,
-			},
-			'search_query': result.search_query,
-			'timestamp': result.timestamp.isoformat(),
-		}
+	with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+		if output_path.suffix == '.jsonl':
+			for result in results:
+				f.write(json.dumps(_result_to_dict(result), ensure_ascii=False))
+				f.write('\n')
+			return
         
-		if result.best_match:
-			data['best_match'] = {
-				'video_id': result.best_match.video_id,
-				'url': result.best_match.url,
-				'title': result.best_match.title,
-				'channel': result.best_match.channel_title,
-				'views': result.best_match.view_count,
-				'likes': result.best_match.like_count,
-			}
-        
-		if result.match_score:
-			data['match_score'] = {
-				'confidence': result.match_score.confidence,
-				'reasoning': result.match_score.reasoning,
-				'key_factors': result.match_score.key_factors,
-				'concerns': result.match_score.concerns,
-			}
-        
-		if result.error:
-			data['error'] = result.error
+		# Same layout as json.dump(list, indent=2), one element at a time
+		separator = '[\n  '
+		for result in results:
+			f.write(separator)
+			f.write(json.dumps(_result_to_dict(result), indent=2, ensure_ascii=False).replace('\n', '\n  '))
+			separator = ',\n  '
+		f.write('[]' if separator == '[\n  ' else '\n]')
+
+
+_CSV_COLUMNS = (
+	'Song Title',
+	'Performer',
+	'Composer',
+	'Movie',
+	'Search Query',
+	'YouTube URL',
+	'Video Title',
+	'Channel',
+	'Confidence',
+	'Views',
+	'Likes',
+	'Error',
+)
+
+
+def _result_columns(results: Iterable) -> dict:
+	"""
+	Collect results column-wise, one list per output column.
+    
+	Missing values are None so the lists can be handed to a columnar writer
+	as-is; the CSV writer renders them as empty cells.
+    
+	Args:
+		results: Iterable of MusicLinkResult objects
         
-		output_data.append(data)
+	Returns:
+		Dict mapping column name to list of values
+	"""
+	columns = {name: [] for name in _CSV_COLUMNS}
+	(titles, performers, composers, movies, queries, urls, video_titles,
+	 channels, confidences, views, likes, errors) = columns.values()
     
-	# Create output directory if needed
-	output_path = Path(output_file)
-	output_path.parent.mkdir(parents=True, exist_ok=True)
+	for result in results:
+		soundtrack = result.soundtrack
+		match = result.best_match
+		titles.append(soundtrack.title)
+		performers.append(soundtrack.performer)
+		composers.append(soundtrack.composer)
+		movies.append(soundtrack.movie_title)
+		queries.append(result.search_query)
+		urls.append(match.url if match else None)
+		video_titles.append(match.title if match else None)
+		channels.append(match.channel_title if match else None)
+		confidences.append(result.match_score.confidence if result.match_score else None)
+		views.append(match.view_count if match else None)
+		likes.append(match.like_count if match else None)
+		errors.append(result.error)
     
-	# Save to file
-	with open(output_file, 'w', encoding='utf-8') as f:
-		json.dump(output_data, f, indent=2, ensure_ascii=False)
+	return columns
 
 
-def save_results_to_csv(results: list, output_file: str):
+def save_results_to_csv(results: Iterable, output_file: str):
 	"""
 	Save music link results to a CSV file.
     
 	Args:
-		results: List of MusicLinkResult objects
+		results: Iterable of MusicLinkResult objects
 		output_file: Path to output file
 	"""
 	import csv
-	from pathlib import Path
     
 	# Create output directory if needed
 	output_path = Path(output_file)
 	output_path.parent.mkdir(parents=True, exist_ok=True)
     
+	columns = _result_columns(results)
+	columns['Confidence'] = [
+		f"{value:.2f}" if value is not None else None
+		for value in columns['Confidence']
+	]
+    
 	with open(output_file, 'w', newline='', encoding='utf-8') as f:
 		writer = csv.writer(f)
-        
-		# Header
-		writer.writerow([
-			'Song Title',
-			'Performer',
-			'Composer',
-			'Movie',
-			'Search Query',
-			'YouTube URL',
-			'Video Title',
-			'Channel',
-			'Confidence',
-			'Views',
-			'Likes',
-			'Error'
-		])
-        
-		# Data rows
-		for result in results:
-			writer.writerow([
-				result.soundtrack.title,
-				result.soundtrack.performer or '',
-				result.soundtrack.composer or '',
-				result.soundtrack.movie_title or '',
-				result.search_query,
-				result.best_match.url if result.best_match else '',
-				result.best_match.title if result.best_match else '',
-				result.best_match.channel_title if result.best_match else '',
-				f"{result.match_score.confidence:.2f}" if result.match_score else '',
-				result.best_match.view_count if result.best_match else '',
-				result.best_match.like_count if result.best_match else '',
-				result.error or ''
-			])
+		writer.writerow(_CSV_COLUMNS)
+		# csv.writer already renders None as an empty cell
+		writer.writerows(zip(*columns.values()))
+
+
+def save_results_to_parquet(results: Iterable, output_file: str):
+	"""
+	Save music link results to a Parquet file.
+    
+	Uses the same columns as save_results_to_csv, but keeps confidence,
+	views and likes numeric, which makes the file much smaller and faster
+	to load for analysis. Requires pyarrow.
+    
+	Args:
+		results: Iterable of MusicLinkResult objects
+		output_file: Path to output file
+	"""
+	try:
+		import pyarrow as pa
+		import pyarrow.parquet as pq
+	except ImportError as e:
+		raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+    
+	# Create output directory if needed
+	output_path = Path(output_file)
+	output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+	numeric_types = {'Confidence': pa.float64(), 'Views': pa.int64(), 'Likes': pa.int64()}
+	columns = _result_columns(results)
+	table = pa.table({
+		name: pa.array(values, type=numeric_types.get(name, pa.string()))
+		for name, values in columns.items()
+	})
+	pq.write_table(table, output_file)
@@ -3,13 +3,18 @@ YouTube API client for searching and fetching video metadata.
 """
 from typing import List, Optional
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httplib2
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from .models import YouTubeVideo, YouTubeComment
+from .models import MAX_COMMENT_CHARS, MAX_COMMENTS_PER_VIDEO, YouTubeVideo, YouTubeComment
 
 logger = logging.getLogger(__name__)
 
+COMMENT_FETCH_WORKERS = 10  # concurrent comment requests per enrich call
+
 
 class YouTubeClient:
 	"""Client for interacting with YouTube Data API v3."""
@@ -23,6 +28,16 @@ class YouTubeClient:
 		"""
 		self.api_key = api_key
 		self.youtube = build('youtube', 'v3', developerKey=api_key)
+		# httplib2.Http is not thread-safe, so every thread executes requests
+		# over its own connection
+		self._local = threading.local()
+    
+	def _http(self) -> httplib2.Http:
+		"""Return this thread's HTTP connection object."""
+		http = getattr(self._local, 'http', None)
+		if http is None:
+			http = self._local.http = httplib2.Http()
+		return http
     
 	def search_videos(
 		self, 
@@ -50,7 +65,7 @@ class YouTubeClient:
 				type='video',
 				order=order,
 				videoCategoryId='10',  # Music category
-			).execute()
+			).execute(http=self._http())
             
 			video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
             
@@ -81,7 +96,7 @@ class YouTubeClient:
 			videos_response = self.youtube.videos().list(
 				part='snippet,contentDetails,statistics',
 				id=','.join(video_ids)
-			).execute()
+			).execute(http=self._http())
             
 			videos = []
 			for item in videos_response.get('items', []):
@@ -128,14 +143,14 @@ class YouTubeClient:
 				maxResults=max_results,
 				order=order,
 				textFormat='plainText'
-			).execute()
+			).execute(http=self._http())
             
 			comments = []
 			for item in comments_response.get('items', []):
 				comment_snippet = item['snippet']['topLevelComment']['snippet']
 				comment = YouTubeComment(
 					author=comment_snippet.get('authorDisplayName', ''),
-					text=comment_snippet.get('textDisplay', ''),
+					text=comment_snippet.get('textDisplay', '')[:MAX_COMMENT_CHARS],
 					like_count=int(comment_snippet.get('likeCount', 0)),
 					published_at=comment_snippet.get('publishedAt', '')
 				)
@@ -162,25 +177,31 @@ class YouTubeClient:
 		Args:
 			videos: List of YouTubeVideo objects
 			max_comments_per_video: Maximum comments to fetch per video
+				(never more than models.MAX_COMMENTS_PER_VIDEO, the number the
+				matching prompt uses)
             
 		Returns:
 			List of YouTubeVideo objects with comments added
 		"""
-		enriched_videos = []
+		max_comments_per_video = min(max_comments_per_video, MAX_COMMENTS_PER_VIDEO)
         
-		for video in videos:
+		def enrich(video: YouTubeVideo) -> YouTubeVideo:
 			try:
 				comments = self.get_video_comments(
 					video.video_id, 
 					max_results=max_comments_per_video
 				)
 				# Create a new video object with comments
-				enriched_video = video.model_copy(update={"comments": comments})
-				enriched_videos.append(enriched_video)
+				return video.model_copy(update={"comments": comments})
                 
 			except Exception as e:
 				logger.warning(f"Failed to fetch comments for {video.video_id}: {e}")
 				# Add video without comments
-				enriched_videos.append(video)
+				return video
+        
+		if len(videos) <= 1:
+			return [enrich(video) for video in videos]
         
-		return enriched_videos
+		# The requests are independent, so fetch them concurrently; map keeps the input order
+		with ThreadPoolExecutor(max_workers=min(len(videos), COMMENT_FETCH_WORKERS)) as executor:
+			return list(executor.map(enrich, videos))
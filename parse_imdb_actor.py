@@ -21,6 +21,7 @@ from rdflib import BNode, Graph, Literal, Namespace, RDF, URIRef
 from rdflib.namespace import XSD
 
 SCHEMA = Namespace("http://schema.org/")
+DEFAULT_MAX_ACTOR_YEAR = 2019
 ACTING_CATEGORY_IDS = {
     "amzn1.imdb.concept.name_credit_category.a9ab2a8b-9153-4edb-a27a-7c2346830d77",
     "amzn1.imdb.concept.name_credit_category.7f6d81aa-23aa-4503-844d-38201eb08761",
@@ -282,29 +283,17 @@ def extract_images(main_column: Dict, nm_id: str) -> List[Dict]:
     return images
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(
-        description="Parse an IMDb actor HTML file and generate RDF triples."
-    )
-    parser.add_argument("input_file", type=Path, help="Path to the saved IMDb HTML file")
-    parser.add_argument(
-        "-o",
-        "--output",
-        type=Path,
-        help="Output TTL path (default: <input_dir>/<nm_id>.ttl)",
-    )
-    parser.add_argument(
-        "--max-actor-year",
-        type=int,
-        default=2019,
-        help="Highest release year to keep in actor filmography (default: 2019).",
-    )
-    args = parser.parse_args()
-
-    if not args.input_file.exists():
-        raise SystemExit(f"Input file {args.input_file} does not exist.")
-
-    html_text = args.input_file.read_text()
+def parse_actor_html(
+    input_file: Path,
+    output: Optional[Path] = None,
+    max_actor_year: Optional[int] = DEFAULT_MAX_ACTOR_YEAR,
+) -> Tuple[Path, str]:
+    """
+    Parse a saved IMDb actor page, write its Turtle file and return
+    (output_path, turtle_text). Raises ValueError when the page lacks the
+    identifiers needed to build the document.
+    """
+    html_text = input_file.read_text()
     soup = BeautifulSoup(html_text, "html.parser")
 
     person_data, article_data, video_data = parse_json_ld(soup)
@@ -315,15 +304,15 @@ def main() -> int:
 
     person_url = person_data.get("url") or article_data.get("url") if article_data else None
     if not person_url:
-        raise SystemExit("Unable to locate person URL in JSON-LD.")
+        raise ValueError("Unable to locate person URL in JSON-LD.")
     if not person_url.endswith("/"):
         person_url += "/"
 
     nm_id = extract_id_from_url(person_url, "nm")
     if not nm_id:
-        raise SystemExit("Could not extract IMDb nm identifier.")
+        raise ValueError("Could not extract IMDb nm identifier.")
 
-    output_path = args.output or args.input_file.parent / f"{nm_id}.ttl"
+    output_path = output or input_file.parent / f"{nm_id}.ttl"
 
     stats_graph = Graph()
     stats_graph.bind("schema", SCHEMA)
@@ -460,7 +449,6 @@ def main() -> int:
     performer_known_for = ordered_known_for
 
     performer_roles: List[Dict] = []
-    max_actor_year = args.max_actor_year
     for entry in actor_dom_entries:
         ensure_movie_entry(movies, entry["id"], entry["name"], entry.get("year"))
         if entry["id"] in performer_known_for:
@@ -921,6 +909,35 @@ def main() -> int:
         )
     )
     print(f"  Images: {len(gallery_images)}  Social links: {len(social_links)}")
+    return output_path, ttl_output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Parse an IMDb actor HTML file and generate RDF triples."
+    )
+    parser.add_argument("input_file", type=Path, help="Path to the saved IMDb HTML file")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Output TTL path (default: <input_dir>/<nm_id>.ttl)",
+    )
+    parser.add_argument(
+        "--max-actor-year",
+        type=int,
+        default=DEFAULT_MAX_ACTOR_YEAR,
+        help=f"Highest release year to keep in actor filmography (default: {DEFAULT_MAX_ACTOR_YEAR}).",
+    )
+    args = parser.parse_args()
+
+    if not args.input_file.exists():
+        raise SystemExit(f"Input file {args.input_file} does not exist.")
+
+    try:
+        parse_actor_html(args.input_file, args.output, args.max_actor_year)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
     return 0
 
 
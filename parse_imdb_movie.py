@@ -6,9 +6,11 @@ Works with any IMDb movie HTML file.
 """
 
 import argparse
+import contextlib
 import json
 import re
 import html
+import sys
 from pathlib import Path
 from bs4 import BeautifulSoup
 from rdflib import Graph, Literal, Namespace, RDF, URIRef, BNode
@@ -36,13 +38,28 @@ def get_id_from_url(url):
 
 def parse_imdb_html(html_file_path):
     """Parse IMDb HTML and generate RDF graph."""
+    with open(html_file_path, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+    return parse_imdb_html_content(html_content)
+
+def parse_movie_html_bytes(data):
+    """Parse IMDb HTML from a bytes-like buffer (e.g. an mmap of the file) and generate RDF graph.
+    
+    The buffer is decoded straight into a str, without first copying the
+    file into a bytes object.
+    """
+    html_content = str(data, 'utf-8')
+    if '\r' in html_content:
+        # Same newline handling as reading the file in text mode
+        html_content = html_content.replace('\r\n', '\n').replace('\r', '\n')
+    return parse_imdb_html_content(html_content)
+
+def parse_imdb_html_content(html_content):
+    """Parse IMDb HTML markup and generate RDF graph."""
     g = Graph()
     g.bind("schema", SCHEMA)
     g.bind("xsd", XSD)
     
-    with open(html_file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
     soup = BeautifulSoup(html_content, 'html.parser')
     
     # Extract JSON-LD
@@ -637,6 +654,39 @@ def parse_imdb_html(html_file_path):
     
     return g
 
+def serialize_turtle(graph):
+    """Serialize the graph to UTF-8 Turtle bytes using the schema: prefix."""
+    output_turtle = graph.serialize(format='turtle', encoding='utf-8')
+    
+    # Fix namespace prefix from schema1 to schema if needed
+    output_turtle = output_turtle.replace(b'schema1:', b'schema:')
+    output_turtle = output_turtle.replace(b'@prefix schema1:', b'@prefix schema:')
+    return output_turtle
+
+def serve(stdin=sys.stdin, stdout=sys.stdout):
+    """Parse files on request until stdin closes, reusing this one interpreter.
+    
+    Each input line is "<html path>\t<ttl path>"; for each one a single line
+    is written back: "OK\t<triple count>" or "ERR\t<error>".
+    """
+    for line in stdin:
+        line = line.rstrip('\n')
+        if not line:
+            continue
+        try:
+            html_path, ttl_path = line.split('\t')
+            # Stray prints from the parser must not end up in the reply stream
+            with contextlib.redirect_stdout(sys.stderr):
+                graph = parse_imdb_html(html_path)
+            with open(ttl_path, 'wb') as f:
+                f.write(serialize_turtle(graph))
+            reply = f"OK\t{len(graph)}"
+        except Exception as e:
+            reply = "ERR\t" + ' '.join(repr(e).split())
+        stdout.write(reply + '\n')
+        stdout.flush()
+    return 0
+
 def main():
     parser = argparse.ArgumentParser(
         description='Parse IMDb HTML file and generate RDF triples in Turtle format.'
@@ -644,6 +694,7 @@ def main():
     parser.add_argument(
         'input_file',
         type=str,
+        nargs='?',
         help='Path to the IMDb HTML file to parse'
     )
     parser.add_argument(
@@ -652,9 +703,20 @@ def main():
         default=None,
         help='Output TTL file path (default: input filename with .ttl extension)'
     )
+    parser.add_argument(
+        '--server',
+        action='store_true',
+        help='Read tab-separated "html_path ttl_path" lines from stdin and '
+             'answer each with one status line on stdout (see serve())'
+    )
     
     args = parser.parse_args()
     
+    if args.server:
+        return serve()
+    if not args.input_file:
+        parser.error('input_file is required unless --server is given')
+    
     html_file = Path(args.input_file)
     
     if not html_file.exists():
@@ -678,11 +740,7 @@ def main():
         return 1
     
     # Serialize to Turtle format
-    output_turtle = graph.serialize(format='turtle', encoding='utf-8')
-    
-    # Fix namespace prefix from schema1 to schema if needed
-    output_turtle = output_turtle.replace(b'schema1:', b'schema:')
-    output_turtle = output_turtle.replace(b'@prefix schema1:', b'@prefix schema:')
+    output_turtle = serialize_turtle(graph)
     
     with open(output_file, 'wb') as f:
         f.write(output_turtle)
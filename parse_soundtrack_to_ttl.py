@@ -9,14 +9,13 @@ import re
 import json
 import html
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 
 from soundtrack_property_mapping import (
-    PROPERTY_MAPPING,
     COMPOUND_ROLES,
-    normalize_label,
+    categorize_label,
     get_compound_roles,
 )
 
@@ -51,9 +50,13 @@ class SoundtrackEntry:
     conductors: List[Person] = field(default_factory=list)
 
 
+# Only the __NEXT_DATA__ script is built into the tree; the rest of the page is skipped
+_NEXT_DATA_STRAINER = SoupStrainer('script', id='__NEXT_DATA__')
+
+
 def extract_next_data(html_content: str) -> Optional[dict]:
     """Extract __NEXT_DATA__ JSON from HTML."""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml', parse_only=_NEXT_DATA_STRAINER)
     next_data_script = soup.find('script', id='__NEXT_DATA__')
     
     if not next_data_script:
@@ -96,21 +99,14 @@ def categorize_label_to_role(label: str) -> List[str]:
     Map a label to role categories.
     Returns list of roles (can be multiple for compound labels).
     """
-    normalized = normalize_label(label)
-    
     # First check compound roles
     compound_roles = get_compound_roles(label)
     if compound_roles:
-        return compound_roles
-    
-    # Then check single-role mappings
-    for category, known_labels in PROPERTY_MAPPING.items():
-        for known in known_labels:
-            known_normalized = normalize_label(known)
-            if known_normalized == normalized or normalized.startswith(known_normalized):
-                return [category]
+        return list(compound_roles)
     
-    return []
+    # Then check single-role mappings (memoized in soundtrack_property_mapping)
+    category, matched, _ = categorize_label(label)
+    return [category] if matched else []
 
 
 def parse_soundtrack_item(item: dict) -> Optional[SoundtrackEntry]:
@@ -0,0 +1,58 @@
+"""Shared page loading for imdbpop.py / imdbpop2.py.
+
+Everything here stays pure-Python compatible so the batch runs can use PyPy
+(run from this directory: ``pypy3 imdbpop2.py``). C extensions are optional:
+orjson is used when installed and stdlib json otherwise, and pages are parsed
+with html5lib, which is pure Python and gets JIT-compiled under PyPy.
+"""
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from bs4 import BeautifulSoup
+from rdflib import URIRef
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson has no wheels for some PyPy versions
+    _json_loads = json.loads
+
+IMDB_BASE = "https://www.imdb.com"
+
+
+def abs_url(url, _base=IMDB_BASE):
+    """Makes an IMDb href absolute (a first-char compare instead of startswith("http"))."""
+    return url if url[:1] == 'h' else _base + url
+
+
+@lru_cache(maxsize=4096)
+def imdb_uri(url):
+    """Returns a URIRef for an IMDb href; cached since the same people recur across roles."""
+    return URIRef(abs_url(url))
+
+
+def extract_json_ld(soup):
+    """Extracts the main JSON-LD block from the IMDb page."""
+    script = soup.find('script', type='application/ld+json')
+    if script:
+        return _json_loads(str(script.string))
+    return None
+
+
+@lru_cache(maxsize=32)
+def _load_soup_and_json(path, mtime):
+    """Parses the HTML file once per (path, mtime) pair."""
+    # Hand raw bytes to the parser and let it decode once, which skips the
+    # text-mode decode and newline translation of the whole file
+    soup = BeautifulSoup(Path(path).read_bytes(), 'html5lib', from_encoding='utf-8')
+    return soup, extract_json_ld(soup)
+
+
+def load(path):
+    """Returns (soup, json_ld) for an IMDb title page, reusing a cached parse.
+
+    The file's mtime is part of the cache key, so a page rewritten during a
+    batch run is parsed again instead of served stale.
+    """
+    path = os.path.abspath(path)
+    return _load_soup_and_json(path, os.stat(path).st_mtime_ns)
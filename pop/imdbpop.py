@@ -1,13 +1,15 @@
-import json
 import re
 from datetime import datetime
-from bs4 import BeautifulSoup
 from rdflib import Graph, Literal, Namespace, RDF, URIRef
 from rdflib.namespace import XSD
+from _parse import IMDB_BASE, imdb_uri, load
 
 # Define Namespaces
 SCHEMA = Namespace("http://schema.org/")
 
+_RE_TT = re.compile(r'/title/(tt\d+)/')
+_MAX_SIMILAR = 25  # "More like this" never shows more titles than this
+
 def parse_duration(pt_string):
     """Ensures duration is passed through or cleaned if necessary."""
     return pt_string
@@ -18,20 +20,11 @@ def clean_text(text):
         return text.strip().replace('\n', ' ').replace('  ', ' ')
     return None
 
-def extract_json_ld(soup):
-    """Extracts the main JSON-LD block from the IMDb page."""
-    script = soup.find('script', type='application/ld+json')
-    if script:
-        return json.loads(script.string)
-    return None
-
-def create_knowledge_graph(html_content, base_url="https://www.imdb.com/"):
+def create_knowledge_graph(soup, data, base_url="https://www.imdb.com/"):
     g = Graph()
     g.bind("schema", SCHEMA)
     g.bind("xsd", XSD)
 
-    soup = BeautifulSoup(html_content, 'html5lib')
-    data = extract_json_ld(soup)
     # print(data.keys())
 
     if not data:
@@ -64,8 +57,7 @@ def create_knowledge_graph(html_content, base_url="https://www.imdb.com/"):
     country_links = soup.select("a[href*='country_of_origin']")
     if country_links:
         # Taking the first one for simplicity, or you can iterate
-        country_url = f"https://www.imdb.com{country_links[0]['href']}"
-        g.add((movie_uri, SCHEMA.countryOfOrigin, URIRef(country_url)))
+        g.add((movie_uri, SCHEMA.countryOfOrigin, imdb_uri(country_links[0]['href'])))
 
     # Languages
     # IMDb often lists languages in a specific ul/li structure or links
@@ -96,68 +88,60 @@ def create_knowledge_graph(html_content, base_url="https://www.imdb.com/"):
         g.add((movie_uri, SCHEMA.thumbnail, URIRef(data['image'])))
 
     # Awards (Scraping specific text)
-    award_text = soup.find("a", href=re.compile("awards"))
+    award_text = soup.select_one('li[data-testid="award_information"] a[href*="awards"]')
     if award_text and "won" in award_text.text.lower():
         # Basic extraction logic, might need tuning based on exact HTML structure
         g.add((movie_uri, SCHEMA.award, Literal(clean_text(award_text.text))))
 
     # Alternate Names (AKA)
-    aka_section = soup.find(string="Also known as")
-    if aka_section:
-        # Navigate up to parent li, then find the span content
-        aka_parent = aka_section.find_parent("li")
-        if aka_parent:
-             aka_item = aka_parent.find("span", class_="ipc-metadata-list-item__list-content-item")
-             if aka_item:
-                 g.add((movie_uri, SCHEMA.alternateName, Literal(aka_item.text)))
-
-    # --- 2. People (Director, Creator, Actors) ---
-    
-    def add_person(person_data, predicate):
+    # The details list tags the AKA row directly, so no string search + parent walk is needed
+    aka_item = soup.select_one('li[data-testid="title-details-akas"] span.ipc-metadata-list-item__list-content-item')
+    if aka_item:
+        g.add((movie_uri, SCHEMA.alternateName, Literal(aka_item.text)))
+
+    # --- 2. People (Director, Creator, Actors) & 3. Organizations (Production Companies) ---
+    # Companies are usually inside 'creator' with type Organization in JSON-LD,
+    # so each list is walked once and dispatched on @type.
+
+    def add_person(person_data, types):
         if not person_data: return
         
         people_list = person_data if isinstance(person_data, list) else [person_data]
         
         for p in people_list:
-            if p['@type'] == 'Person':
-                # Ensure URL is absolute
-                p_url = p['url'] if p['url'].startswith("http") else f"https://www.imdb.com{p['url']}"
-                person_uri = URIRef(p_url)
-                g.add((movie_uri, predicate, person_uri))
-                g.add((person_uri, RDF.type, SCHEMA.Person))
-                g.add((person_uri, SCHEMA.name, Literal(p['name'])))
+            target = types.get(p['@type'])
+            if target is None:
+                continue
+            predicate, rdf_class = target
+            # Ensure URL is absolute
+            entity_uri = imdb_uri(p['url'])
+            g.add((movie_uri, predicate, entity_uri))
+            g.add((entity_uri, RDF.type, rdf_class))
+            if rdf_class == SCHEMA.Organization:
+                # g.add((entity_uri, SCHEMA.name, Literal(p['name'])))  # FIXME not found
+                g.add((entity_uri, SCHEMA.url, entity_uri))
+            else:
+                g.add((entity_uri, SCHEMA.name, Literal(p['name'])))
 
     if 'director' in data:
-        add_person(data['director'], SCHEMA.director)
+        add_person(data['director'], {'Person': (SCHEMA.director, SCHEMA.Person)})
     
     if 'creator' in data:
-        add_person(data['creator'], SCHEMA.creator)
+        add_person(data['creator'], {'Person': (SCHEMA.creator, SCHEMA.Person),
+                                     'Organization': (SCHEMA.productionCompany, SCHEMA.Organization)})
         
     if 'actor' in data:
-        add_person(data['actor'], SCHEMA.actor)
-
-    # --- 3. Organizations (Production Companies) ---
-    # These are usually inside 'creator' with type Organization in JSON-LD
-    if 'creator' in data:
-        creators = data['creator'] if isinstance(data['creator'], list) else [data['creator']]
-        for c in creators:
-            if c['@type'] == 'Organization':
-                org_url = c['url'] if c['url'].startswith("http") else f"https://www.imdb.com{c['url']}"
-                org_uri = URIRef(org_url)
-                g.add((movie_uri, SCHEMA.productionCompany, org_uri))
-                g.add((org_uri, RDF.type, SCHEMA.Organization))
-                # g.add((org_uri, SCHEMA.name, Literal(c['name'])))  # FIXME not found
-                g.add((org_uri, SCHEMA.url, URIRef(org_url)))
+        add_person(data['actor'], {'Person': (SCHEMA.actor, SCHEMA.Person)})
 
     # --- 4. Trailer ---
     if 'trailer' in data:
         t_data = data['trailer']
-        trailer_uri = URIRef(f"https://www.imdb.com{t_data['url']}") # Adjusting for IMDB relative path if needed, usually absolute in JSON
+        trailer_uri = imdb_uri(t_data['url']) # Adjusting for IMDB relative path if needed, usually absolute in JSON
         g.add((movie_uri, SCHEMA.trailer, trailer_uri))
         g.add((trailer_uri, RDF.type, SCHEMA.VideoObject))
         g.add((trailer_uri, SCHEMA.name, Literal(t_data['name'])))
         g.add((trailer_uri, SCHEMA.description, Literal(t_data['description'])))
-        g.add((trailer_uri, SCHEMA.embedUrl, URIRef(f"https://www.imdb.com{t_data['embedUrl']}")))
+        g.add((trailer_uri, SCHEMA.embedUrl, imdb_uri(t_data['embedUrl'])))
         g.add((trailer_uri, SCHEMA.thumbnailUrl, URIRef(t_data['thumbnailUrl'])))
         g.add((trailer_uri, SCHEMA.duration, Literal(t_data['duration'], datatype=XSD.duration)))
         g.add((trailer_uri, SCHEMA.uploadDate, Literal(t_data['uploadDate'], datatype=XSD.dateTime)))
@@ -221,31 +205,28 @@ def create_knowledge_graph(html_content, base_url="https://www.imdb.com/"):
         g.add((budget_node, SCHEMA.description, Literal(budget_text)))
 
     # --- 8. Similar Movies ---
-    # Looking for "More like this" section
-    more_like_this = soup.select("a[href*='tt_mlt']")
-    # Using a set to avoid duplicates
+    # Looking for "More like this" section; scoping to it avoids scanning every link on the page
+    similar_section = soup.find("section", {"data-testid": "MoreLikeThis"})
+    more_like_this = similar_section.find_all("a", href=_RE_TT) if similar_section else []
+    # Using a set of tt IDs to avoid duplicates (IMDb repeats each card's link)
     similar_movies = set()
     for link in more_like_this:
-        href = link['href']
-        # Extract tt ID
-        match = re.search(r'/title/(tt\d+)/', href)
-        if match:
-            similar_movies.add(f"https://www.imdb.com/title/{match.group(1)}")
+        similar_movies.add(_RE_TT.search(link['href']).group(1))
+        if len(similar_movies) >= _MAX_SIMILAR:
+            break
     
-    for movie_url in similar_movies:
-        g.add((movie_uri, SCHEMA.isSimilarTo, URIRef(movie_url)))
+    g.addN((movie_uri, SCHEMA.isSimilarTo, URIRef(f"{IMDB_BASE}/title/{tid}"), g) for tid in similar_movies)
 
     return g
 
 # --- Execution ---
 
-# 1. Load the HTML file
+# 1. Load the HTML file (parsed soup and JSON-LD are cached by path + mtime)
 filename = '../data/titanic_movie.html'
-with open(filename, 'r', encoding='utf-8') as f:
-    html_content = f.read()
+soup, data = load(filename)
 
 # 2. Generate Graph
-graph = create_knowledge_graph(html_content)
+graph = create_knowledge_graph(soup, data)
 if graph:  # print the number of triples in the graph
     print(f"Graph has {len(graph)} triples.")
 
@@ -1,13 +1,34 @@
-import json
 import re
-from bs4 import BeautifulSoup
+import unicodedata
 from rdflib import Graph, Literal, Namespace, RDF, URIRef, BNode
 from rdflib.namespace import XSD
+from _parse import IMDB_BASE, abs_url, imdb_uri, load
 
 # --- Namespaces ---
 SCHEMA = Namespace("http://schema.org/")
 MOV = Namespace("http://movie.example.org/")
 
+_RE_TT = re.compile(r'/title/(tt\d+)')
+_MAX_SIMILAR = 25  # "More like this" never shows more titles than this
+
+def _build_fold_table():
+    """Maps accented Latin letters to their ASCII base (e.g. 'ë' -> 'e')."""
+    table = {ord('ß'): 'ss', ord('Æ'): 'AE', ord('æ'): 'ae', ord('Œ'): 'OE', ord('œ'): 'oe',
+             ord('Ø'): 'O', ord('ø'): 'o', ord('Đ'): 'D', ord('đ'): 'd', ord('Ł'): 'L', ord('ł'): 'l'}
+    for cp in range(0xC0, 0x250):
+        if cp in table:
+            continue
+        base = unicodedata.normalize('NFKD', chr(cp)).encode('ascii', 'ignore').decode('ascii')
+        if base:
+            table[cp] = base
+    return str.maketrans(table)
+
+_FOLD = _build_fold_table()
+
+def fold_text(text):
+    """ASCII-folds and casefolds text so names match captions regardless of accents/case."""
+    return text.translate(_FOLD).casefold()
+
 def clean_text(text):
     """Cleans whitespace and newlines from text."""
     if text:
@@ -19,21 +40,17 @@ def get_id_from_url(url):
     match = re.search(r'/(tt\d+|nm\d+|co\d+)/', url)
     return match.group(1) if match else None
 
-def parse_imdb_html(html_content):
+def parse_imdb_html(soup, json_data):
     g = Graph()
     g.bind("schema", SCHEMA)
     g.bind("mov", MOV)
     g.bind("xsd", XSD)
 
-    soup = BeautifulSoup(html_content, 'html5lib')
-    
     # 1. Base Data from JSON-LD (still useful for core metadata)
-    json_ld_script = soup.find('script', type='application/ld+json')
-    json_data = json.loads(json_ld_script.string) if json_ld_script else {}
+    json_data = json_data or {}
     
     # Define Main Movie URI
-    movie_url = json_data.get('url', 'https://www.imdb.com/title/tt0120338/')
-    if not movie_url.startswith('http'): movie_url = f"https://www.imdb.com{movie_url}"
+    movie_url = abs_url(json_data.get('url', f"{IMDB_BASE}/title/tt0120338/"))
     movie_uri = URIRef(movie_url)
     
     g.add((movie_uri, RDF.type, SCHEMA.Movie))
@@ -56,17 +73,13 @@ def parse_imdb_html(html_content):
     g.add((movie_uri, SCHEMA.description, URIRef(plot_link)))
 
     # Alternate Title (AKA)
-    # Searching for "Also known as" in the details section
-    aka_label = soup.find("a", string="Also known as")
-    if aka_label:
-        aka_ul = aka_label.find_next("ul")
-        if aka_ul:
-            aka_item = aka_ul.find("li")
-            if aka_item:
-                aka_text = aka_item.get_text(strip=True)
-                # Remove ' (original title)' if present
-                aka_text = aka_text.replace(" (original title)", "")
-                g.add((movie_uri, SCHEMA.alternateName, Literal(aka_text)))
+    # The details section tags the AKA row, so select its first value directly
+    aka_item = soup.select_one('li[data-testid="title-details-akas"] ul li')
+    if aka_item:
+        aka_text = aka_item.get_text(strip=True)
+        # Remove ' (original title)' if present
+        aka_text = aka_text.replace(" (original title)", "")
+        g.add((movie_uri, SCHEMA.alternateName, Literal(aka_text)))
 
     # Dates (JSON is reliable for ISO format, but we check HTML for specific regions)
     if 'datePublished' in json_data:
@@ -79,8 +92,7 @@ def parse_imdb_html(html_content):
     # Country of Origin
     country_link = soup.find("a", href=re.compile("country_of_origin"))
     if country_link:
-        country_uri = f"https://www.imdb.com{country_link['href']}"
-        g.add((movie_uri, SCHEMA.countryOfOrigin, URIRef(country_uri)))
+        g.add((movie_uri, SCHEMA.countryOfOrigin, imdb_uri(country_link['href'])))
 
     # Languages
     lang_links = soup.find_all("a", href=re.compile("primary_language"))
@@ -110,57 +122,50 @@ def parse_imdb_html(html_content):
         g.add((movie_uri, SCHEMA.thumbnail, URIRef(json_data['image'])))
 
     # Awards
-    awards_section = soup.find("a", href=re.compile("awards"))
+    awards_section = soup.select_one('li[data-testid="award_information"] a[href*="awards"]')
     if awards_section and "Won" in awards_section.text:
         g.add((movie_uri, SCHEMA.award, Literal(awards_section.text)))
 
     # --- 3. People & Companies ---
 
-    def add_entity(entity_data, predicate, type_class):
+    def add_entity(entity_data, types):
+        """types maps an item's @type to the (predicate, rdf class) it is added with."""
         if not entity_data: return
         items = entity_data if isinstance(entity_data, list) else [entity_data]
         for item in items:
-            if item.get('@type') == type_class:
-                uri_str = item['url']
-                if not uri_str.startswith('http'): uri_str = f"https://www.imdb.com{uri_str}"
-                entity_uri = URIRef(uri_str)
-                g.add((movie_uri, predicate, entity_uri))
-                g.add((entity_uri, RDF.type, getattr(SCHEMA, type_class)))
+            target = types.get(item.get('@type'))
+            if target is None:
+                continue
+            predicate, rdf_class = target
+            entity_uri = imdb_uri(item['url'])
+            g.add((movie_uri, predicate, entity_uri))
+            g.add((entity_uri, RDF.type, rdf_class))
+            if rdf_class == SCHEMA.Organization:
+                # g.add((entity_uri, SCHEMA.name, Literal(item['name'])))
+                g.add((entity_uri, SCHEMA.url, entity_uri))
+            else:
                 g.add((entity_uri, SCHEMA.name, Literal(item['name'])))
                 # Add URL to Person/Org entity as well
-                # g.add((entity_uri, SCHEMA.url, URIRef(uri_str))) 
+                # g.add((entity_uri, SCHEMA.url, entity_uri)) 
 
     # Directors, Creators (Writers), Actors from JSON-LD
-    add_entity(json_data.get('director'), SCHEMA.director, 'Person')
-    add_entity(json_data.get('creator'), SCHEMA.creator, 'Person') # Maps writers
-    add_entity(json_data.get('actor'), SCHEMA.actor, 'Person')
-    
-    # Production Companies (Often listed as creator type Organization in JSON)
-    if 'creator' in json_data:
-        creators = json_data['creator'] if isinstance(json_data['creator'], list) else [json_data['creator']]
-        for c in creators:
-            if c['@type'] == 'Organization':
-                uri_str = c['url']
-                if not uri_str.startswith('http'): uri_str = f"https://www.imdb.com{uri_str}"
-                org_uri = URIRef(uri_str)
-                g.add((movie_uri, SCHEMA.productionCompany, org_uri))
-                g.add((org_uri, RDF.type, SCHEMA.Organization))
-                # g.add((org_uri, SCHEMA.name, Literal(c['name'])))
-                g.add((org_uri, SCHEMA.url, URIRef(uri_str)))
+    # Production Companies are often listed as creator type Organization, so 'creator' is walked once
+    add_entity(json_data.get('director'), {'Person': (SCHEMA.director, SCHEMA.Person)})
+    add_entity(json_data.get('creator'), {'Person': (SCHEMA.creator, SCHEMA.Person), # Maps writers
+                                          'Organization': (SCHEMA.productionCompany, SCHEMA.Organization)})
+    add_entity(json_data.get('actor'), {'Person': (SCHEMA.actor, SCHEMA.Person)})
 
     # --- 4. Trailer ---
     if 'trailer' in json_data:
         t_data = json_data['trailer']
         # Fix relative URL issue
-        embed_url = t_data['embedUrl']
-        if not embed_url.startswith('http'): embed_url = f"https://www.imdb.com{embed_url}"
-        
-        trailer_uri = URIRef(embed_url)
+        trailer_uri = imdb_uri(t_data['embedUrl'])
+
         g.add((movie_uri, SCHEMA.trailer, trailer_uri))
         g.add((trailer_uri, RDF.type, SCHEMA.VideoObject))
         g.add((trailer_uri, SCHEMA.name, Literal(t_data['name'])))
         g.add((trailer_uri, SCHEMA.description, Literal(t_data['description'])))
-        g.add((trailer_uri, SCHEMA.embedUrl, URIRef(embed_url)))
+        g.add((trailer_uri, SCHEMA.embedUrl, trailer_uri))
         g.add((trailer_uri, SCHEMA.thumbnailUrl, URIRef(t_data['thumbnailUrl'])))
         g.add((trailer_uri, SCHEMA.duration, Literal(t_data['duration'], datatype=XSD.duration)))
         g.add((trailer_uri, SCHEMA.uploadDate, Literal(t_data['uploadDate'], datatype=XSD.dateTime)))
@@ -196,18 +201,14 @@ def parse_imdb_html(html_content):
     # Fetch from "More like this" section in HTML
     similar_section = soup.find("section", {"data-testid": "MoreLikeThis"})
     if similar_section:
-        links = similar_section.find_all("a", href=re.compile("/title/tt"))
-        # Use a set to deduplicate
+        links = similar_section.find_all("a", href=_RE_TT)
+        # Use a set to deduplicate; stop once the section's maximum is reached
         seen_titles = set()
         for link in links:
-            href = link['href']
-            tid_match = re.search(r'/title/(tt\d+)', href)
-            if tid_match:
-                tid = tid_match.group(1)
-                if tid not in seen_titles:
-                    seen_titles.add(tid)
-                    sim_uri = URIRef(f"https://www.imdb.com/title/{tid}")
-                    g.add((movie_uri, SCHEMA.isSimilarTo, sim_uri))
+            seen_titles.add(_RE_TT.search(link['href']).group(1))
+            if len(seen_titles) >= _MAX_SIMILAR:
+                break
+        g.addN((movie_uri, SCHEMA.isSimilarTo, URIRef(f"{IMDB_BASE}/title/{tid}"), g) for tid in seen_titles)
 
     # --- 8. Reviews (HTML Scraping) ---
     # We look for the specific Featured Review cards in HTML to get more than just the JSON one
@@ -273,6 +274,10 @@ def parse_imdb_html(html_content):
         
         # Limit to avoiding duplicates
         processed_images = set()
+
+        # Snapshot (folded) actor names once instead of querying the store per image
+        actor_names = {o: fold_text(str(name)) for _, _, o in g.triples((movie_uri, SCHEMA.actor, None))
+                       for name in [g.value(o, SCHEMA.name)] if name}
         
         for link in photo_links:
             href = link['href']
@@ -283,7 +288,7 @@ def parse_imdb_html(html_content):
                 if rm_id in processed_images: continue
                 processed_images.add(rm_id)
                 
-                img_node_url = f"https://www.imdb.com/title/{get_id_from_url(movie_url)}/mediaviewer/{rm_id}/"
+                img_node_url = f"{IMDB_BASE}/title/{get_id_from_url(movie_url)}/mediaviewer/{rm_id}/"
                 img_node = URIRef(img_node_url)
                 
                 # Try to find the actual img tag inside the link for src/caption
@@ -301,10 +306,10 @@ def parse_imdb_html(html_content):
                     # Heuristic to extract mainEntity (actors mentioned in caption)
                     # This iterates over known actors in the graph to see if they are in caption
                     # (A simple improvement for the warm up)
-                    for s, p, o in g.triples((movie_uri, SCHEMA.actor, None)):
-                        actor_name = g.value(o, SCHEMA.name)
-                        if actor_name and str(actor_name) in caption:
-                            g.add((img_node, SCHEMA.mainEntity, o))
+                    caption_norm = fold_text(caption)
+                    for actor_uri, actor_name in actor_names.items():
+                        if actor_name in caption_norm:
+                            g.add((img_node, SCHEMA.mainEntity, actor_uri))
 
     return g
 
@@ -313,10 +318,9 @@ def parse_imdb_html(html_content):
 def main():
     filename = '../data/titanic_movie.html'
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        soup, json_data = load(filename)
 
-        graph = parse_imdb_html(html_content)
+        graph = parse_imdb_html(soup, json_data)
 
         if graph:
             output_turtle = graph.serialize(format='turtle')
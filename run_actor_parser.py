@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Utility script that runs parse_imdb_actor.py for a single HTML file, ensures
+Utility script that runs the parse_imdb_actor parser for a single HTML file, ensures
 the generated Turtle file uses the IMDb actor ID (nm#######) as its filename,
 and validates the output with rdflib while reporting useful summary statistics.
 
@@ -10,39 +10,60 @@ Supports parallel processing with --workers to speed up batch operations.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
 import multiprocessing
 import os
 import re
-import subprocess
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Tuple, List, Optional
 
 from rdflib import Graph
 from rdflib.namespace import RDF
-from openpyxl import Workbook
+import xlsxwriter
+
+try:
+    import oxrdflib  # registers the Rust-backed "Oxigraph" rdflib store
+except ImportError:
+    oxrdflib = None
+OXIGRAPH_AVAILABLE = oxrdflib is not None
 
 PROJECT_ROOT = Path(__file__).resolve().parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from parse_imdb_actor import SCHEMA  # type: ignore  # Reuse shared namespace definitions
+from parse_imdb_actor import SCHEMA, parse_actor_html  # type: ignore  # Reuse shared namespace definitions
+
+MAP_CHUNKSIZE = 32  # work items per IPC batch in parallel mode
+REPORT_INTERVAL = 500  # completions between buffered progress/failure reports in parallel mode
+
+_NM_DIR_RE = re.compile(r"^nm\d+$")
+_NM_CONTENT_RE = re.compile(rb"/name/(nm\d+)/")
+_SCAN_CHUNK_SIZE = 64 * 1024
+_SCAN_OVERLAP = 64  # longer than any /name/nm.../ match, so none is split across chunks
 
 
 def extract_nm_id(html_path: Path) -> str:
     """Extract IMDb nm ID from HTML file path or content."""
     # Try to extract from parent directory name (e.g., extractor/movies/actors/nm0000138/actor.html)
     parent = html_path.parent
-    if parent.name.startswith("nm") and re.match(r"^nm\d+$", parent.name):
+    if parent.name.startswith("nm") and _NM_DIR_RE.match(parent.name):
         return parent.name
     
-    # Try to extract from HTML content
+    # Try to extract from HTML content, scanning raw bytes chunk by chunk and
+    # stopping at the first match instead of decoding the whole file
     try:
-        content = html_path.read_text()
-        match = re.search(r'/name/(nm\d+)/', content)
-        if match:
-            return match.group(1)
+        with html_path.open("rb") as fh:
+            tail = b""
+            while chunk := fh.read(_SCAN_CHUNK_SIZE):
+                buffer = tail + chunk
+                match = _NM_CONTENT_RE.search(buffer)
+                if match:
+                    return match.group(1).decode("ascii")
+                tail = buffer[-_SCAN_OVERLAP:]
     except Exception:
         pass
     
@@ -50,33 +71,35 @@ def extract_nm_id(html_path: Path) -> str:
 
 
 def run_parser(
-    parse_script: Path,
     html_path: Path,
     ttl_path: Path,
     max_actor_year: int | None = None,
     show_output: bool = False,
-) -> None:
-    """Invoke parse_imdb_actor.py via subprocess to generate the TTL file."""
-    cmd = [sys.executable, str(parse_script), str(html_path), "-o", str(ttl_path)]
-    if max_actor_year is not None:
-        cmd.extend(["--max-actor-year", str(max_actor_year)])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"Parser failed with exit code {result.returncode}:\n"
-            f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
-        )
-    if show_output and result.stdout.strip():
-        print(result.stdout.strip())
-    if result.stderr.strip():
-        print(result.stderr.strip(), file=sys.stderr)
+) -> str:
+    """Call parse_imdb_actor in-process to generate the TTL file; returns the Turtle text."""
+    kwargs = {} if max_actor_year is None else {"max_actor_year": max_actor_year}
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            _, ttl_text = parse_actor_html(html_path, ttl_path, **kwargs)
+    except Exception as exc:
+        raise RuntimeError(f"Parser failed: {exc}\nSTDOUT:\n{output.getvalue()}") from exc
+    if show_output and output.getvalue().strip():
+        print(output.getvalue().strip())
+    return ttl_text
 
 
-def load_graph(ttl_path: Path) -> Graph:
-    """Load the generated TTL file into rdflib to verify syntax."""
-    graph = Graph()
-    graph.parse(ttl_path, format="turtle")
+def load_graph(ttl_path: Path, data: str | None = None) -> Graph:
+    """Load the generated TTL into rdflib to verify syntax.
+
+    When the parser's Turtle text is passed as `data` it is parsed directly,
+    skipping the round trip through the file that was just written.
+    """
+    graph = Graph(store="Oxigraph") if OXIGRAPH_AVAILABLE else Graph()
+    if data is None:
+        graph.parse(ttl_path, format="turtle")
+    else:
+        graph.parse(data=data, format="turtle")
     return graph
 
 
@@ -84,37 +107,55 @@ def gather_stats(graph: Graph) -> Dict[str, Any]:
     """Collect useful statistics about the parsed actor graph."""
     stats: Dict[str, Any] = {"triples": len(graph)}
     
-    person_uri = next(graph.subjects(RDF.type, SCHEMA.Person), None)
+    # One pass over rdf:type triples gives the entity counts and the person
+    type_counts: Counter = Counter()
+    person_uri = None
+    for subject, _, rdf_type in graph.triples((None, RDF.type, None)):
+        type_counts[rdf_type] += 1
+        if person_uri is None and rdf_type == SCHEMA.Person:
+            person_uri = subject
+    
     if person_uri:
         stats["person_uri"] = str(person_uri)
-        name = graph.value(person_uri, SCHEMA.name)
-        stats["person_name"] = str(name) if name else "Unknown"
         
-        stats["performer_in_count"] = len(list(graph.objects(person_uri, SCHEMA.performerIn)))
-        stats["award_count"] = len(list(graph.objects(person_uri, SCHEMA.award)))
-        stats["image_count"] = len(list(graph.objects(person_uri, SCHEMA.image)))
-        stats["video_count"] = len(list(graph.objects(person_uri, SCHEMA.video)))
+        # One pass over the person's own triples instead of a lookup per predicate
+        predicate_counts: Counter = Counter()
+        name = None
+        birth_date = None
+        job_titles = []
+        for _, predicate, obj in graph.triples((person_uri, None, None)):
+            predicate_counts[predicate] += 1
+            if predicate == SCHEMA.name:
+                name = name or obj
+            elif predicate == SCHEMA.birthDate:
+                birth_date = birth_date or obj
+            elif predicate == SCHEMA.jobTitle:
+                job_titles.append(obj)
         
-        birth_date = graph.value(person_uri, SCHEMA.birthDate)
+        stats["person_name"] = str(name) if name else "Unknown"
+        stats["performer_in_count"] = predicate_counts[SCHEMA.performerIn]
+        stats["award_count"] = predicate_counts[SCHEMA.award]
+        stats["image_count"] = predicate_counts[SCHEMA.image]
+        stats["video_count"] = predicate_counts[SCHEMA.video]
         stats["birth_date"] = str(birth_date) if birth_date else None
-        
-        job_titles = list(graph.objects(person_uri, SCHEMA.jobTitle))
-        stats["job_titles"] = [str(jt) for jt in job_titles]
+        # Job titles come from a small vocabulary (Actor, Producer, ...); interning
+        # lets the thousands of stats dicts kept for the workbook share one copy
+        stats["job_titles"] = [sys.intern(str(jt)) for jt in job_titles]
     
-    stats["movies"] = len(list(graph.subjects(RDF.type, SCHEMA.Movie)))
-    stats["image_objects"] = len(list(graph.subjects(RDF.type, SCHEMA.ImageObject)))
-    stats["video_objects"] = len(list(graph.subjects(RDF.type, SCHEMA.VideoObject)))
+    stats["movies"] = type_counts[SCHEMA.Movie]
+    stats["image_objects"] = type_counts[SCHEMA.ImageObject]
+    stats["video_objects"] = type_counts[SCHEMA.VideoObject]
     
     return stats
 
 
 def process_actor_html(
     html_path: Path,
-    parse_script: Path,
     output_dir: Path | None,
     max_actor_year: int | None,
     show_parser_output: bool,
     quiet: bool = False,
+    validate: bool = False,
 ) -> Tuple[Path, Dict[str, Any]]:
     """Run parser + validation for a single actor HTML file and return stats."""
     html_path = html_path.resolve()
@@ -129,25 +170,26 @@ def process_actor_html(
     
     if not quiet:
         print(f"\nRunning parser on {html_path} -> {ttl_path}")
-    run_parser(parse_script, html_path, ttl_path, max_actor_year, show_output=show_parser_output)
+    ttl_text = run_parser(html_path, ttl_path, max_actor_year, show_output=show_parser_output)
     
-    graph = load_graph(ttl_path)
+    # With --validate, re-read the file from disk instead of parsing the in-memory copy
+    graph = load_graph(ttl_path) if validate else load_graph(ttl_path, data=ttl_text)
     stats = gather_stats(graph)
     return ttl_path, stats
 
 
 def _worker_process_actor(
-    args_tuple: Tuple[Path, Path, Optional[Path], Optional[int], bool]
+    args_tuple: Tuple[Path, Optional[Path], Optional[int], bool, bool]
 ) -> Tuple[Path, Optional[Path], Optional[Dict[str, Any]], Optional[str]]:
     """
     Worker function for parallel processing.
     Returns (html_path, ttl_path, stats, error_message).
     If successful, error_message is None. If failed, stats is None.
     """
-    html_path, parse_script, output_dir, max_actor_year, show_parser_output = args_tuple
+    html_path, output_dir, max_actor_year, show_parser_output, validate = args_tuple
     try:
         ttl_path, stats = process_actor_html(
-            html_path, parse_script, output_dir, max_actor_year, show_parser_output, quiet=True
+            html_path, output_dir, max_actor_year, show_parser_output, quiet=True, validate=validate
         )
         return (html_path, ttl_path, stats, None)
     except Exception as exc:
@@ -157,11 +199,17 @@ def _worker_process_actor(
 def discover_actor_html_files(actors_root: Path) -> List[Path]:
     """Find all HTML files that match nm*/actor.html."""
     actors_root = actors_root.resolve()
-    pattern = "nm*/actor.html"
     if actors_root.name.startswith("nm") and (actors_root / "actor.html").exists():
-        html_files = [actors_root / "actor.html"]
-    else:
-        html_files = list(actors_root.rglob(pattern))
+        return [actors_root / "actor.html"]
+    # Two-level os.scandir walk: DirEntry carries the file type from readdir,
+    # so only the candidate actor.html files need a stat
+    html_files = []
+    with os.scandir(actors_root) as entries:
+        for entry in entries:
+            if entry.name.startswith("nm") and entry.is_dir():
+                html_path = os.path.join(entry.path, "actor.html")
+                if os.path.isfile(html_path):
+                    html_files.append(Path(html_path))
     return sorted(html_files)
 
 
@@ -170,10 +218,14 @@ def write_stats_excel(results: List[Tuple[Path, Dict[str, Any]]], destination: P
     destination = destination.resolve()
     destination.parent.mkdir(parents=True, exist_ok=True)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Actor Stats"
-    headers = [
+    # constant_memory flushes each row as XML once it is written; plain strings
+    # stay strings (no URL/number conversion of URIs or IDs)
+    wb = xlsxwriter.Workbook(
+        str(destination),
+        {"constant_memory": True, "strings_to_numbers": False, "strings_to_urls": False},
+    )
+    ws = wb.add_worksheet("Actor Stats")
+    headers = (
         "ttl_file",
         "actor_id",
         "actor_name",
@@ -188,13 +240,13 @@ def write_stats_excel(results: List[Tuple[Path, Dict[str, Any]]], destination: P
         "video_objects",
         "birth_date",
         "job_titles",
-    ]
-    ws.append(headers)
+    )
+    ws.write_row(0, 0, headers)
 
-    for ttl_path, stats in results:
+    for row_idx, (ttl_path, stats) in enumerate(results, 1):
         actor_id = ttl_path.stem
         job_titles_str = ", ".join(stats.get("job_titles", []))
-        row = [
+        row = (
             str(ttl_path),
             actor_id,
             stats.get("person_name", ""),
@@ -209,10 +261,10 @@ def write_stats_excel(results: List[Tuple[Path, Dict[str, Any]]], destination: P
             stats.get("video_objects", 0),
             stats.get("birth_date", ""),
             job_titles_str,
-        ]
-        ws.append(row)
+        )
+        ws.write_row(row_idx, 0, row)
 
-    wb.save(destination)
+    wb.close()
     print(f"Wrote stats for {len(results)} actors to {destination}")
 
 
@@ -220,9 +272,9 @@ def write_error_log(failures: List[Tuple[Path, Exception]], destination: Path) -
     """Write failure details to a plain-text log."""
     destination = destination.resolve()
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with open(destination, "w", encoding="utf-8") as fh:
-        for html_file, exc in failures:
-            fh.write(f"{html_file}: {exc}\n")
+    lines = [f"{html_file}: {exc}\n" for html_file, exc in failures]
+    with open(destination, "w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.writelines(lines)
     print(f"Logged {len(failures)} failures to {destination}")
 
 
@@ -244,12 +296,6 @@ def main() -> int:
         action="store_true",
         help="Process every actor HTML file found under --actors-root.",
     )
-    parser.add_argument(
-        "--parse-script",
-        type=Path,
-        default=PROJECT_ROOT / "parse_imdb_actor.py",
-        help="Optional path to parse_imdb_actor.py (defaults to project root).",
-    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -278,12 +324,17 @@ def main() -> int:
         "--max-actor-year",
         type=int,
         default=None,
-        help="Highest release year to keep in actor filmography (passed to parse_imdb_actor.py).",
+        help="Highest release year to keep in actor filmography (passed to the parser).",
     )
     parser.add_argument(
         "--show-parser-output",
         action="store_true",
-        help="Print stdout from parse_imdb_actor.py for each run.",
+        help="Print the parser's output for each run.",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Re-read each written TTL file from disk for validation instead of parsing the parser's in-memory output.",
     )
     parser.add_argument(
         "-j", "--workers",
@@ -294,10 +345,6 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    parse_script = args.parse_script.resolve()
-    if not parse_script.exists():
-        parser.error(f"parse_imdb_actor.py not found at {parse_script}")
-
     if args.all_actors:
         html_files = discover_actor_html_files(args.actors_root)
         if not html_files:
@@ -317,34 +364,41 @@ def main() -> int:
             
             # Prepare work items
             work_items = [
-                (html_file, parse_script, args.output_dir, args.max_actor_year, args.show_parser_output)
+                (html_file, args.output_dir, args.max_actor_year, args.show_parser_output, args.validate)
                 for html_file in html_files
             ]
             
+            # Failure messages and progress are buffered and written in blocks so the
+            # main process doesn't take the stdio lock once per completed future
             completed = 0
+            recent_failures: List[str] = []
             with ProcessPoolExecutor(max_workers=num_workers) as executor:
-                futures = {
-                    executor.submit(_worker_process_actor, item): item[0]
-                    for item in work_items
-                }
-                
-                for future in as_completed(futures):
-                    html_path, ttl_path, stats, error_msg = future.result()
+                # Workers report errors in their result tuple, so plain map() is enough;
+                # chunking sends work items over IPC in batches rather than one per file
+                results = executor.map(_worker_process_actor, work_items, chunksize=MAP_CHUNKSIZE)
+                for html_path, ttl_path, stats, error_msg in results:
                     completed += 1
                     
                     if error_msg is None:
                         successes.append((ttl_path, stats))
-                        if completed % 100 == 0 or completed == len(html_files):
-                            print(f"  Progress: {completed}/{len(html_files)} ({100*completed//len(html_files)}%)")
                     else:
                         failures.append((html_path, Exception(error_msg)))
-                        print(f"Failed on {html_path}: {error_msg}", file=sys.stderr)
+                        recent_failures.append(f"Failed on {html_path}: {error_msg}")
+                    
+                    if completed % REPORT_INTERVAL == 0 or completed == len(html_files):
+                        if recent_failures:
+                            # Keep stderr failures in order with buffered stdout lines
+                            sys.stdout.flush()
+                            sys.stderr.write("\n".join(recent_failures) + "\n")
+                            recent_failures.clear()
+                        print(f"  Progress: {completed}/{len(html_files)} ({100*completed//len(html_files)}%)", flush=True)
         else:
             # Sequential processing (original behavior)
             for html_file in html_files:
                 try:
                     result = process_actor_html(
-                        html_file, parse_script, args.output_dir, args.max_actor_year, args.show_parser_output
+                        html_file, args.output_dir, args.max_actor_year, args.show_parser_output,
+                        validate=args.validate,
                     )
                     successes.append(result)
                 except Exception as exc:
@@ -373,10 +427,10 @@ def main() -> int:
     try:
         ttl_path, stats = process_actor_html(
             args.actor_html,
-            parse_script,
             args.output_dir,
             args.max_actor_year,
             args.show_parser_output,
+            validate=args.validate,
         )
         
         print("\n" + "=" * 60)
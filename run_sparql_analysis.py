@@ -6,51 +6,182 @@ and calculate what percentage return informative results.
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from collections import defaultdict
 from rdflib import Graph
+from rdflib.plugins.sparql import prepareQuery
+
+try:
+    import oxrdflib  # registers the Rust-backed "Oxigraph" rdflib store
+except ImportError:
+    oxrdflib = None
+OXIGRAPH_AVAILABLE = oxrdflib is not None
+
+PREFIX_RE = re.compile(r'(PREFIX\s+\w+:\s*<[^>]+>\s*)+')
+# Matches a query header comment: # Q1: Question text
+QUERY_HEADER_RE = re.compile(r'#\s*(Q\d+:.*\S)')
+_Q_RE = re.compile(r'Q(\d+)')
 
 
 def parse_sparql_queries(filepath: str) -> dict[str, str]:
-    """Parse SPARQL queries from the file, extracting query name and query text."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    # Extract PREFIX declarations (at the top of the file)
-    prefix_pattern = r'(PREFIX\s+\w+:\s*<[^>]+>\s*)+'
-    prefix_match = re.search(prefix_pattern, content)
-    prefixes = prefix_match.group(0) if prefix_match else ""
-    
-    # Pattern to match query comments and the query that follows
-    # Matches: # Q1: Question text\nSELECT ... }
-    query_pattern = r'#\s*(Q\d+:\s*[^\n]+)\s*\n(SELECT[\s\S]*?}\s*)(?=\n\s*#|\Z)'
-    
+    """Parse SPARQL queries from the file, extracting query name and query text.
+
+    The file is scanned line by line: PREFIX lines before the first query are
+    shared by every query, a "# Qn: ..." comment names the next query, and a
+    query runs from its SELECT line until its braces balance again.
+    """
+    prefix_lines = []
     queries = {}
-    for match in re.finditer(query_pattern, content):
-        query_name = match.group(1).strip()
-        query_body = match.group(2).strip()
-        # Combine prefixes with query body
-        full_query = prefixes + "\n" + query_body
-        queries[query_name] = full_query
-    
+    current_name = None
+    body = []
+    depth = 0
+    in_query = False
+
+    def flush():
+        queries[current_name] = "\n".join(prefix_lines) + "\n\n" + "".join(body).strip()
+
+    with open(filepath, 'r') as f:
+        for line in f:
+            stripped = line.strip()
+            if in_query:
+                body.append(line)
+                depth += line.count('{') - line.count('}')
+                if depth <= 0 and '}' in line:
+                    flush()
+                    in_query, current_name = False, None
+                continue
+
+            if stripped.startswith('#'):
+                header = QUERY_HEADER_RE.match(stripped)
+                if header:
+                    current_name = header.group(1)
+            elif stripped.startswith('PREFIX') and not queries and current_name is None:
+                prefix_lines.append(stripped)
+            elif stripped.startswith('SELECT') and current_name is not None:
+                in_query = True
+                body = [line]
+                depth = line.count('{') - line.count('}')
+                if depth <= 0 and '}' in line:
+                    flush()
+                    in_query, current_name = False, None
+
+    # Unterminated final query: keep whatever was read, as the old regex did at EOF
+    if in_query:
+        flush()
+
     return queries
 
 
 def find_all_movie_ttl_files(base_dir: str) -> list[Path]:
     """Find all TTL files in movie_html directories."""
+    # os.scandir reuses the type info from readdir instead of stat-ing every entry
     ttl_files = []
-    base_path = Path(base_dir)
-    
-    for movie_dir in base_path.iterdir():
-        if movie_dir.is_dir() and movie_dir.name.startswith('tt'):
-            movie_html_dir = movie_dir / 'movie_html'
-            if movie_html_dir.exists():
-                for ttl_file in movie_html_dir.glob('*.ttl'):
-                    ttl_files.append(ttl_file)
+    with os.scandir(base_dir) as movie_dirs:
+        for movie_dir in movie_dirs:
+            if not (movie_dir.name.startswith('tt') and movie_dir.is_dir()):
+                continue
+            movie_html_dir = os.path.join(movie_dir.path, 'movie_html')
+            try:
+                with os.scandir(movie_html_dir) as entries:
+                    ttl_files.extend(
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith('.ttl') and entry.is_file()
+                    )
+            except FileNotFoundError:
+                continue
     
     return sorted(ttl_files)
 
 
+@lru_cache(maxsize=None)
+def compile_query(query_str: str):
+    """Parse a SPARQL query once per process.
+
+    Prepared queries cannot be pickled, so each worker keeps its own cache
+    instead of receiving compiled queries from the parent.
+    """
+    return prepareQuery(query_str)
+
+
+def build_combined_query(queries: dict[str, str]) -> str:
+    """Fuse all queries into one SELECT that reports which of them match.
+
+    Each query becomes a sub-SELECT tagged with its position in `queries`
+    (?q), so one engine pass over the graph answers every query.
+    """
+    prefixes = {}
+    branches = []
+    for idx, query_str in enumerate(queries.values()):
+        prefix_match = PREFIX_RE.match(query_str.lstrip())
+        prefix_block = prefix_match.group(0) if prefix_match else ""
+        for line in prefix_block.strip().splitlines():
+            prefixes[line.strip()] = None
+        body = query_str.lstrip()[len(prefix_block):].strip()
+        branches.append(f"{{ {{ {body} }} BIND({idx} AS ?q) }}")
+    return "\n".join(prefixes) + "\nSELECT ?q WHERE {\n" + "\nUNION\n".join(branches) + "\n}\nGROUP BY ?q"
+
+
+def run_query(g: Graph, query_str: str):
+    """Run a query string, using the prepared-query cache unless Oxigraph is active."""
+    # Oxigraph parses query strings natively and rejects pre-parsed rdflib queries
+    query = query_str if OXIGRAPH_AVAILABLE else compile_query(query_str)
+    return g.query(query)
+
+
+_worker_graph: Graph | None = None
+
+
+def get_worker_graph() -> Graph:
+    """Return this process's Graph, emptied of the previously analysed file.
+
+    Reusing one Graph per worker keeps the store's index structures alive
+    between files instead of rebuilding them for every small TTL.
+    """
+    global _worker_graph
+    if _worker_graph is None:
+        _worker_graph = Graph(store="Oxigraph") if OXIGRAPH_AVAILABLE else Graph()
+    else:
+        _worker_graph.remove((None, None, None))
+    return _worker_graph
+
+
+def analyse_file(ttl_file: Path, queries: dict[str, str], combined_query: str | None = None) -> dict[str, str]:
+    """Load one TTL file and run every query on it.
+
+    With `combined_query` (see build_combined_query) all queries are answered
+    in a single pass; if it fails, each query is run separately so errors are
+    attributed to the right query.
+
+    Returns {query_name: 'success' | 'empty' | 'error'}.
+    """
+    try:
+        g = get_worker_graph()
+        g.parse(ttl_file, format='turtle')
+    except Exception as e:
+        print(f"  Error loading {ttl_file}: {e}")
+        return {query_name: 'error' for query_name in queries}
+
+    if combined_query is not None:
+        try:
+            hits = {int(row.q) for row in run_query(g, combined_query)}
+            return {query_name: 'success' if idx in hits else 'empty'
+                    for idx, query_name in enumerate(queries)}
+        except Exception:
+            pass
+
+    outcomes = {}
+    for query_name, query_str in queries.items():
+        try:
+            # Only emptiness matters, so stop at the first solution instead of materialising all
+            has_results = next(iter(run_query(g, query_str)), None) is not None
+            outcomes[query_name] = 'success' if has_results else 'empty'
+        except Exception as e:
+            outcomes[query_name] = 'error'
+    return outcomes
+
+
 def main():
     # Paths
     sparql_file = '/home/ioannis/PycharmProjects/imdb4m/QA/sparql_queries.txt'
@@ -60,10 +191,12 @@ def main():
     print("Parsing SPARQL queries...")
     queries = parse_sparql_queries(sparql_file)
     print(f"Found {len(queries)} queries:\n")
-    for name in sorted(queries.keys(), key=lambda x: int(re.search(r'Q(\d+)', x).group(1))):
+    for name in sorted(queries.keys(), key=lambda x: int(_Q_RE.search(x).group(1))):
         print(f"  - {name}")
     print()
     
+    combined_query = build_combined_query(queries)
+
     # Find all TTL files
     print("Finding movie TTL files...")
     ttl_files = find_all_movie_ttl_files(movies_dir)
@@ -72,32 +205,15 @@ def main():
     # Statistics tracking
     query_stats = defaultdict(lambda: {'success': 0, 'empty': 0, 'error': 0})
     
-    # Process each TTL file
+    # Process each TTL file; files are independent, so spread them over all cores
     print("Running queries on all TTL files...")
-    for i, ttl_file in enumerate(ttl_files, 1):
-        if i % 50 == 0 or i == len(ttl_files):
-            print(f"  Processing file {i}/{len(ttl_files)}: {ttl_file.name}")
-        
-        # Load graph
-        try:
-            g = Graph()
-            g.parse(ttl_file, format='turtle')
-        except Exception as e:
-            print(f"  Error loading {ttl_file}: {e}")
-            for query_name in queries:
-                query_stats[query_name]['error'] += 1
-            continue
-        
-        # Run each query
-        for query_name, query_str in queries.items():
-            try:
-                results = list(g.query(query_str))
-                if results:
-                    query_stats[query_name]['success'] += 1
-                else:
-                    query_stats[query_name]['empty'] += 1
-            except Exception as e:
-                query_stats[query_name]['error'] += 1
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        per_file_results = executor.map(partial(analyse_file, queries=queries, combined_query=combined_query), ttl_files, chunksize=16)
+        for i, (ttl_file, outcomes) in enumerate(zip(ttl_files, per_file_results), 1):
+            if i % 50 == 0 or i == len(ttl_files):
+                print(f"  Processing file {i}/{len(ttl_files)}: {ttl_file.name}")
+            for query_name, outcome in outcomes.items():
+                query_stats[query_name][outcome] += 1
     
     # Print results
     print("\n" + "=" * 100)
@@ -112,7 +228,7 @@ def main():
     overall_success = 0
     overall_total = 0
     
-    for query_name in sorted(queries.keys(), key=lambda x: int(re.search(r'Q(\d+)', x).group(1))):
+    for query_name in sorted(queries.keys(), key=lambda x: int(_Q_RE.search(x).group(1))):
         stats = query_stats[query_name]
         total = stats['success'] + stats['empty'] + stats['error']
         coverage = (stats['success'] / total * 100) if total > 0 else 0
@@ -6,39 +6,29 @@ Ensures Titanic and Gladiator are included in the selection.
 
 import csv
 import random
+from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, NamedTuple, Tuple
 
 
-def read_csv_file(csv_path: Path) -> List[Dict[str, str]]:
-    """Read a CSV file and return list of dictionaries."""
-    movies = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            movies.append(row)
-    return movies
+def read_csv_file(csv_path: Path) -> Tuple[List[NamedTuple], Dict[str, NamedTuple]]:
+    """Read a CSV file and return (list of rows, movie_id -> row index).
 
+    Rows are namedtuples built from the header, which is much cheaper than a
+    dict per row (csv.DictReader) while keeping every column for the output.
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        row_type = namedtuple('MovieRow', next(reader), rename=True)
+        movies = [row_type._make(row) for row in reader]
+    return movies, {movie.movie_id: movie for movie in movies}
 
-def find_movie(movies: List[Dict[str, str]], movie_id: str) -> Dict[str, str] | None:
-    """Find a movie by its ID."""
-    for movie in movies:
-        if movie['movie_id'] == movie_id:
-            return movie
-    return None
 
-
-def sample_movies(movies: List[Dict[str, str]], required_movies: List[Dict[str, str]], 
-                  excluded_ids: set, n: int) -> List[Dict[str, str]]:
+def sample_movies(movies: List[NamedTuple], required_movies: List[NamedTuple],
+                  excluded_ids: set, n: int) -> List[NamedTuple]:
     """Sample n movies from the list, ensuring required movies are included and excluding duplicates."""
-    # Filter out movies that are already selected (by movie_id)
-    available_movies = [m for m in movies if m['movie_id'] not in excluded_ids]
-    
     # Filter required movies to only include those not already selected
-    new_required = [m for m in required_movies if m['movie_id'] not in excluded_ids]
-    
-    # Remove required movies from the pool to avoid duplicates
-    pool = [m for m in available_movies if m not in new_required]
+    new_required = [m for m in required_movies if m.movie_id not in excluded_ids]
     
     # Calculate how many more we need
     needed = n - len(new_required)
@@ -46,7 +36,11 @@ def sample_movies(movies: List[Dict[str, str]], required_movies: List[Dict[str,
     if needed <= 0:
         return new_required[:n]
     
-    # Sample the remaining movies
+    # Pool of movies that are neither already selected nor required; random.sample
+    # over it keeps the seeded picks (and so sampled_movies.csv) reproducible
+    required_ids = {m.movie_id for m in new_required}
+    pool = [m for m in movies
+            if m.movie_id not in excluded_ids and m.movie_id not in required_ids]
     if len(pool) < needed:
         sampled = pool
     else:
@@ -80,43 +74,46 @@ def main():
     
     all_sampled = []
     selected_ids = set()  # Track selected movie IDs to avoid duplicates
+    header_fields = None  # Column names, taken once from the first CSV
     
     print("Sampling movies from CSV files:\n")
     
     for csv_file in csv_files:
         print(f"Processing: {csv_file.name}")
-        movies = read_csv_file(csv_file)
+        movies, movies_by_id = read_csv_file(csv_file)
+        if header_fields is None and movies:
+            header_fields = movies[0]._fields
         
         # Find required movies in this file (only if not already selected)
         required = []
-        titanic = find_movie(movies, titanic_id)
-        gladiator = find_movie(movies, gladiator_id)
+        titanic = movies_by_id.get(titanic_id)
+        gladiator = movies_by_id.get(gladiator_id)
         
         if titanic and titanic_id not in selected_ids:
             required.append(titanic)
-            print(f"  ✓ Found Titanic: {titanic['title']}")
+            print(f"  ✓ Found Titanic: {titanic.title}")
         
         if gladiator and gladiator_id not in selected_ids:
             required.append(gladiator)
-            print(f"  ✓ Found Gladiator: {gladiator['title']}")
+            print(f"  ✓ Found Gladiator: {gladiator.title}")
         
         # Sample 5 movies (excluding already selected ones)
         sampled = sample_movies(movies, required, selected_ids, 5)
         
         # Update selected IDs
         for movie in sampled:
-            selected_ids.add(movie['movie_id'])
+            selected_ids.add(movie.movie_id)
         
         all_sampled.extend(sampled)
         
         print(f"  Selected {len(sampled)} movies:")
         for movie in sampled:
             marker = " [REQUIRED]" if movie in required else ""
-            print(f"    - {movie['title']} ({movie['movie_id']}){marker}")
+            print(f"    - {movie.title} ({movie.movie_id}){marker}")
         print()
     
     # Verify required movies are included
-    selected_movie_ids = {movie['movie_id'] for movie in all_sampled}
+    selected_movie_ids = {movie.movie_id for movie in all_sampled}
     titanic_included = titanic_id in selected_movie_ids
     gladiator_included = gladiator_id in selected_movie_ids
     
@@ -129,18 +126,18 @@ def main():
     
     for i, movie in enumerate(all_sampled, 1):
         marker = ""
-        if movie['movie_id'] == titanic_id:
+        if movie.movie_id == titanic_id:
             marker = " [TITANIC]"
-        elif movie['movie_id'] == gladiator_id:
+        elif movie.movie_id == gladiator_id:
             marker = " [GLADIATOR]"
-        print(f"{i:2d}. {movie['title']:50s} | {movie['movie_id']:12s} | Rating: {movie['rating']:4s}{marker}")
+        print(f"{i:2d}. {movie.title:50s} | {movie.movie_id:12s} | Rating: {movie.rating:4s}{marker}")
     
     # Save to a new CSV file
     output_file = csv_dir / 'sampled_movies.csv'
-    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+    with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
         if all_sampled:
-            writer = csv.DictWriter(f, fieldnames=all_sampled[0].keys())
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(header_fields)
             writer.writerows(all_sampled)
     
     print(f"\n✓ Results saved to: {output_file}")
@@ -3,15 +3,24 @@
 Utility script that runs parse_imdb_movie.py for a single HTML file, ensures
 the generated Turtle file uses the IMDb ID as its filename, and validates the
 output with rdflib while reporting useful summary statistics.
+
+Supports parallel processing with --workers to speed up batch operations.
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import csv
+import mmap
+import os
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from rdflib import Graph
 from rdflib.namespace import RDF
@@ -21,36 +30,154 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from parse_imdb_movie import SCHEMA  # type: ignore  # Reuse shared namespace definitions
+from parse_imdb_movie import SCHEMA, parse_movie_html_bytes, serialize_turtle  # type: ignore  # Reuse shared namespace definitions
+
+MAP_CHUNKSIZE = 16  # work items per IPC batch in parallel mode
+
+
+def parse_html_file(html_path: str) -> Graph:
+    """Parse a movie page from a memory map of the file instead of reading it into memory first."""
+    with open(html_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:  # empty files cannot be mapped
+            return parse_movie_html_bytes(b"")
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_movie_html_bytes(mm)
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", "replace")
+
+
+class ParserDaemon:
+    """A long-lived `parse_script --server` child that parses files on request.
+
+    The interpreter and the parser's imports are paid for once instead of
+    once per movie. Requests and replies are single lines over the child's
+    stdin/stdout; its stderr is passed straight through.
+    """
+
+    def __init__(self, parse_script: Path) -> None:
+        self.parse_script = parse_script
+        self.proc: subprocess.Popen | None = None
+
+    def _start(self) -> subprocess.Popen:
+        self.proc = subprocess.Popen(
+            [sys.executable, str(self.parse_script), "--server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        return self.proc
+
+    def parse(self, html_path: str, ttl_path: str) -> int:
+        """Have the child write ttl_path for html_path; returns the triple count."""
+        if "\t" in html_path + ttl_path or "\n" in html_path + ttl_path:
+            raise ValueError(f"Cannot pass path with tab or newline to parser daemon: {html_path}")
+        proc = self.proc if self.proc is not None and self.proc.poll() is None else self._start()
+        try:
+            proc.stdin.write(f"{html_path}\t{ttl_path}\n")
+            proc.stdin.flush()
+            reply = proc.stdout.readline()
+        except OSError:
+            reply = ""
+        if not reply:
+            # The child died mid-request; the next call starts a fresh one
+            self.close()
+            raise RuntimeError("Parser daemon exited unexpectedly")
+        status, _, detail = reply.rstrip("\n").partition("\t")
+        if status != "OK":
+            raise RuntimeError(f"Parser failed: {detail}")
+        return int(detail)
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        proc, self.proc = self.proc, None
+        try:
+            proc.stdin.close()  # EOF ends the child's request loop
+        except OSError:
+            pass
+        proc.wait()
+
+
+_parser_daemon: ParserDaemon | None = None
+
+
+def get_parser_daemon(parse_script: Path) -> ParserDaemon:
+    """Return this process's parser daemon, starting it on first use."""
+    global _parser_daemon
+    if _parser_daemon is None:
+        _parser_daemon = ParserDaemon(parse_script)
+        atexit.register(_parser_daemon.close)
+    return _parser_daemon
 
 
 def run_parser(
     parse_script: Path,
-    html_path: Path,
-    ttl_path: Path,
+    html_path: str,
+    ttl_path: str,
     show_output: bool = False,
-) -> None:
-    """Invoke parse_imdb_movie.py via subprocess to generate the TTL file."""
-    cmd = [sys.executable, str(parse_script), str(html_path), "-o", str(ttl_path)]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    use_subprocess: bool = False,
+    use_daemon: bool = False,
+) -> Graph | None:
+    """Generate the TTL file for one movie and return the parsed graph.
+
+    The parser is called in-process, so no interpreter is started per movie.
+    With `use_subprocess`, parse_script is run in a separate interpreter
+    instead (isolating parser crashes) and None is returned; `use_daemon`
+    does the same through one persistent parse_script process per worker.
+    """
+    if use_daemon:
+        triples = get_parser_daemon(parse_script).parse(html_path, ttl_path)
+        if show_output:
+            print(f"Successfully generated {ttl_path}\nTotal triples: {triples}")
+        return None
+
+    if not use_subprocess:
+        try:
+            graph = parse_html_file(html_path)
+            with open(ttl_path, "wb") as fh:
+                fh.write(serialize_turtle(graph))
+        except Exception as exc:
+            raise RuntimeError(f"Parser failed: {exc!r}") from exc
+        if show_output:
+            print(f"Successfully generated {ttl_path}\nTotal triples: {len(graph)}")
+        return graph
+
+    cmd = [sys.executable, str(parse_script), html_path, "-o", ttl_path]
+    # Output is kept as bytes and only decoded when it is actually shown
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
         raise RuntimeError(
             f"Parser failed with exit code {result.returncode}:\n"
-            f"STDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}"
+            f"STDOUT:\n{_decode(result.stdout)}\nSTDERR:\n{_decode(result.stderr)}"
         )
     if show_output and result.stdout.strip():
-        print(result.stdout.strip())
+        print(_decode(result.stdout).strip())
     if result.stderr.strip():
-        print(result.stderr.strip(), file=sys.stderr)
+        print(_decode(result.stderr).strip(), file=sys.stderr)
+    return None
 
 
-def load_graph(ttl_path: Path) -> Graph:
+def load_graph(ttl_path: str) -> Graph:
     """Load the generated TTL file into rdflib to verify syntax."""
     graph = Graph()
     graph.parse(ttl_path, format="turtle")
     return graph
 
 
+_COUNTED_PREDICATES = frozenset({
+    SCHEMA.actor,
+    SCHEMA.director,
+    SCHEMA.genre,
+    SCHEMA.inLanguage,
+    SCHEMA.review,
+    SCHEMA.image,
+})
+
+
 def gather_stats(graph: Graph) -> Dict[str, Any]:
     """Collect a handful of useful statistics about the parsed movie graph."""
     stats: Dict[str, Any] = {"triples": len(graph)}
@@ -59,100 +186,209 @@ def gather_stats(graph: Graph) -> Dict[str, Any]:
         stats["movie_uri"] = str(movie_uri)
         name = graph.value(movie_uri, SCHEMA.name)
         stats["movie_name"] = str(name) if name else "Unknown"
-        stats["actor_count"] = len(list(graph.objects(movie_uri, SCHEMA.actor)))
-        stats["director_count"] = len(list(graph.objects(movie_uri, SCHEMA.director)))
-        stats["genre_count"] = len(list(graph.objects(movie_uri, SCHEMA.genre)))
-        stats["language_count"] = len(list(graph.objects(movie_uri, SCHEMA.inLanguage)))
-        stats["review_count"] = len(list(graph.objects(movie_uri, SCHEMA.review)))
-        stats["image_count"] = len(list(graph.objects(movie_uri, SCHEMA.image)))
+        # One pass over the movie's own triples instead of a sweep per predicate;
+        # Counter does the counting in C and only the reported predicates are kept
+        predicate_counts: Counter = Counter(
+            predicate for _, predicate, _ in graph.triples((movie_uri, None, None))
+            if predicate in _COUNTED_PREDICATES
+        )
+        stats["actor_count"] = predicate_counts[SCHEMA.actor]
+        stats["director_count"] = predicate_counts[SCHEMA.director]
+        stats["genre_count"] = predicate_counts[SCHEMA.genre]
+        stats["language_count"] = predicate_counts[SCHEMA.inLanguage]
+        stats["review_count"] = predicate_counts[SCHEMA.review]
+        stats["image_count"] = predicate_counts[SCHEMA.image]
     return stats
 
 
 def process_html_file(
-    html_path: Path,
+    html_path: str,
     parse_script: Path,
-    output_dir: Path | None,
+    output_dir: str | None,
     show_parser_output: bool,
-) -> Tuple[Path, Dict[str, Any]]:
+    use_subprocess: bool = False,
+    validate: bool = False,
+    use_daemon: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
     """Run parser + validation for a single HTML file and return stats."""
-    html_path = html_path.resolve()
-    if not html_path.exists():
+    # Plain str paths throughout: this runs once per movie, and every Path
+    # operation would allocate a new object
+    html_path = os.path.abspath(html_path)
+    if not os.path.exists(html_path):
         raise FileNotFoundError(f"HTML file not found: {html_path}")
 
-    target_dir = output_dir.resolve() if output_dir else html_path.parent
-    target_dir.mkdir(parents=True, exist_ok=True)
-    ttl_path = target_dir / f"{html_path.stem}.ttl"
+    target_dir = os.path.abspath(output_dir) if output_dir else os.path.dirname(html_path)
+    os.makedirs(target_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(html_path))[0]
+    ttl_path = os.path.join(target_dir, f"{stem}.ttl")
 
     print(f"\nRunning parser on {html_path} -> {ttl_path}")
-    run_parser(parse_script, html_path, ttl_path, show_output=show_parser_output)
+    graph = run_parser(
+        parse_script, html_path, ttl_path,
+        show_output=show_parser_output, use_subprocess=use_subprocess,
+        use_daemon=use_daemon,
+    )
 
-    graph = load_graph(ttl_path)
+    # Re-read the written file only when asked to (or when the parser ran out of process)
+    if graph is None or validate:
+        graph = load_graph(ttl_path)
     stats = gather_stats(graph)
     return ttl_path, stats
 
 
-def discover_movie_html_files(movies_root: Path) -> List[Path]:
+def _worker_process_html(
+    args_tuple: Tuple[str, Path, Optional[str], bool, bool, bool, bool]
+) -> Tuple[str, Optional[str], Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Worker function for parallel processing.
+    Returns (html_path, ttl_path, stats, error_message); stats is None on failure.
+    """
+    (html_path, parse_script, output_dir, show_parser_output,
+     use_subprocess, validate, use_daemon) = args_tuple
+    try:
+        ttl_path, stats = process_html_file(
+            html_path, parse_script, output_dir, show_parser_output,
+            use_subprocess=use_subprocess, validate=validate, use_daemon=use_daemon,
+        )
+        return (html_path, ttl_path, stats, None)
+    except Exception as exc:
+        return (html_path, None, None, str(exc))
+
+
+def discover_movie_html_files(movies_root: Path) -> List[str]:
     """Find all HTML files that match /tt#######/movie_html/tt#######.html."""
     movies_root = movies_root.resolve()
-    pattern = "tt*/movie_html/tt*.html"
     if movies_root.name.startswith("tt") and (movies_root / "movie_html").exists():
-        html_files = list((movies_root / "movie_html").glob("tt*.html"))
+        movie_dirs = [str(movies_root)]
     else:
-        html_files = list(movies_root.rglob(pattern))
+        # The layout is fixed (movies_root/tt*/movie_html/), so scan just those two
+        # levels with os.scandir instead of walking the whole tree with rglob
+        with os.scandir(movies_root) as entries:
+            movie_dirs = [
+                entry.path for entry in entries
+                if entry.name.startswith("tt") and entry.is_dir(follow_symlinks=False)
+            ]
+
+    html_files = []
+    for movie_dir in movie_dirs:
+        try:
+            with os.scandir(os.path.join(movie_dir, "movie_html")) as entries:
+                html_files.extend(
+                    entry.path for entry in entries
+                    if entry.name.startswith("tt") and entry.name.endswith(".html")
+                )
+        except FileNotFoundError:
+            continue
     return sorted(html_files)
 
 
-def write_stats_excel(results: List[Tuple[Path, Dict[str, Any]]], destination: Path) -> None:
-    """Persist per-movie statistics to an Excel workbook."""
+STATS_HEADERS = [
+    "ttl_file",
+    "movie_id",
+    "movie_name",
+    "movie_uri",
+    "triples",
+    "actor_count",
+    "director_count",
+    "genre_count",
+    "language_count",
+    "review_count",
+    "image_count",
+]
+
+
+# Columns written as numbers; everything else is text
+_NUMERIC_STATS_COLUMNS = frozenset(range(STATS_HEADERS.index("triples"), len(STATS_HEADERS)))
+
+
+def stats_row(ttl_path: str, stats: Dict[str, Any]) -> List[Any]:
+    """Build one movie's row of statistics in STATS_HEADERS order."""
+    return [
+        ttl_path,
+        os.path.splitext(os.path.basename(ttl_path))[0],
+        stats.get("movie_name", ""),
+        stats.get("movie_uri", ""),
+        stats.get("triples", 0),
+        stats.get("actor_count", 0),
+        stats.get("director_count", 0),
+        stats.get("genre_count", 0),
+        stats.get("language_count", 0),
+        stats.get("review_count", 0),
+        stats.get("image_count", 0),
+    ]
+
+
+def open_stats_workbook() -> Tuple[Workbook, Any]:
+    """Create the stats workbook and its sheet with the header row written."""
+    # write_only streams each appended row to the sheet XML instead of keeping Cell objects
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Movie Stats")
+    ws.append(STATS_HEADERS)
+    return wb, ws
+
+
+def append_stats_row(ws: Any, ttl_path: str, stats: Dict[str, Any]) -> None:
+    """Append one movie's statistics to the stats sheet."""
+    ws.append(stats_row(ttl_path, stats))
+
+
+def save_stats_workbook(wb: Workbook, destination: Path, count: int) -> None:
     destination = destination.resolve()
     destination.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(destination)
+    print(f"Wrote stats for {count} movies to {destination}")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Movie Stats"
-    headers = [
-        "ttl_file",
-        "movie_id",
-        "movie_name",
-        "movie_uri",
-        "triples",
-        "actor_count",
-        "director_count",
-        "genre_count",
-        "language_count",
-        "review_count",
-        "image_count",
-    ]
-    ws.append(headers)
 
+def write_stats_excel(results: List[Tuple[str, Dict[str, Any]]], destination: Path) -> None:
+    """Persist per-movie statistics to an Excel workbook."""
+    wb, ws = open_stats_workbook()
     for ttl_path, stats in results:
-        movie_id = ttl_path.stem
-        row = [
-            str(ttl_path),
-            movie_id,
-            stats.get("movie_name", ""),
-            stats.get("movie_uri", ""),
-            stats.get("triples", 0),
-            stats.get("actor_count", 0),
-            stats.get("director_count", 0),
-            stats.get("genre_count", 0),
-            stats.get("language_count", 0),
-            stats.get("review_count", 0),
-            stats.get("image_count", 0),
-        ]
-        ws.append(row)
+        append_stats_row(ws, ttl_path, stats)
+    save_stats_workbook(wb, destination, len(results))
 
-    wb.save(destination)
+
+def write_stats_csv(results: List[Tuple[str, Dict[str, Any]]], destination: Path) -> None:
+    """Persist per-movie statistics to a CSV file."""
+    destination = destination.resolve()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with open(destination, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(STATS_HEADERS)
+        writer.writerows(stats_row(ttl_path, stats) for ttl_path, stats in results)
     print(f"Wrote stats for {len(results)} movies to {destination}")
 
 
-def write_error_log(failures: List[Tuple[Path, Exception]], destination: Path) -> None:
+def convert_stats_csv_to_xlsx(csv_path: Path, destination: Path, count: int) -> None:
+    """Copy a stats CSV written by the batch loop into an Excel workbook in one pass."""
+    wb, ws = open_stats_workbook()
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        next(reader)  # header already written by open_stats_workbook
+        for row in reader:
+            ws.append([
+                int(value) if i in _NUMERIC_STATS_COLUMNS else value
+                for i, value in enumerate(row)
+            ])
+    save_stats_workbook(wb, destination, count)
+
+
+def write_stats(
+    results: List[Tuple[str, Dict[str, Any]]], destination: Path, stats_format: str
+) -> None:
+    """Write the stats as Excel, CSV (next to it, with a .csv suffix) or both."""
+    if stats_format in ("xlsx", "both"):
+        write_stats_excel(results, destination)
+    if stats_format in ("csv", "both"):
+        write_stats_csv(results, destination.with_suffix(".csv"))
+
+
+def write_error_log(failures: List[Tuple[str, Exception]], destination: Path) -> None:
     """Write failure details to a plain-text log."""
     destination = destination.resolve()
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with open(destination, "w", encoding="utf-8") as fh:
-        for html_file, exc in failures:
-            fh.write(f"{html_file}: {exc}\n")
+    lines = [f"{html_file}: {exc}\n" for html_file, exc in failures]
+    with open(destination, "w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.writelines(lines)
     print(f"Logged {len(failures)} failures to {destination}")
 
 
@@ -196,7 +432,14 @@ def main() -> int:
         "--stats-xlsx",
         type=Path,
         default=PROJECT_ROOT / "movie_stats.xlsx",
-        help="Path to the Excel file that will store per-movie statistics.",
+        help="Path to the Excel file that will store per-movie statistics "
+             "(the CSV form is written next to it with a .csv suffix).",
+    )
+    parser.add_argument(
+        "--stats-format",
+        choices=("csv", "xlsx", "both"),
+        default="xlsx",
+        help="Format of the per-movie statistics (default: xlsx).",
     )
     parser.add_argument(
         "--error-log",
@@ -209,6 +452,27 @@ def main() -> int:
         action="store_true",
         help="Print stdout from parse_imdb_movie.py for each run.",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run --parse-script in a separate interpreter per file instead of in-process.",
+    )
+    parser.add_argument(
+        "--parser-daemon",
+        action="store_true",
+        help="Run --parse-script out of process, but as one long-lived --server child per worker.",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Re-read each written TTL file with rdflib instead of using the parser's in-memory graph.",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel workers for --all-movies (default: 1, use 0 for CPU count).",
+    )
 
     args = parser.parse_args()
 
@@ -221,27 +485,67 @@ def main() -> int:
         if not html_files:
             parser.error(f"No movie HTML files found under {args.movies_root}")
 
-        successes: List[Tuple[Path, Dict[str, Any]]] = []
-        failures: List[Tuple[Path, Exception]] = []
-        for html_file in html_files:
-            try:
-                result = process_html_file(
-                    html_file, parse_script, args.output_dir, args.show_parser_output
-                )
-                successes.append(result)
-            except Exception as exc:
-                failures.append((html_file, exc))
-                print(f"Failed on {html_file}: {exc}", file=sys.stderr)
-
-        print(f"\nBatch complete: {len(successes)} succeeded, {len(failures)} failed.")
-        if successes:
-            write_stats_excel(successes, args.stats_xlsx)
-            total_triples = sum(stats.get("triples", 0) for _, stats in successes)
-            print(f"Total triples across successes: {total_triples}")
-            largest = max(successes, key=lambda item: item[1].get("triples", 0))
-            print(
-                f"Largest graph: {largest[0].name} with {largest[1].get('triples', 0)} triples"
-            )
+        # Rows are streamed to a CSV as each movie finishes, so only the running
+        # totals below are kept in memory and no openpyxl work happens per movie;
+        # the workbook, if wanted, is built from the CSV once the batch is done.
+        # For xlsx-only output the CSV is a scratch file next to the workbook, so
+        # a movie_stats.csv from an earlier csv run is left alone
+        csv_only_for_xlsx = args.stats_format == "xlsx"
+        stats_xlsx = args.stats_xlsx.resolve()
+        if csv_only_for_xlsx:
+            stats_csv = stats_xlsx.with_name(stats_xlsx.name + ".csv.tmp")
+        else:
+            stats_csv = stats_xlsx.with_suffix(".csv")
+        stats_csv.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            succeeded = 0
+            total_triples = 0
+            largest: Tuple[str, int] | None = None
+            failures: List[Tuple[str, Exception]] = []
+            num_workers = args.workers or os.cpu_count() or 1
+            output_dir = str(args.output_dir) if args.output_dir else None
+            work_items = [
+                (html_file, parse_script, output_dir, args.show_parser_output,
+                 args.subprocess, args.validate, args.parser_daemon)
+                for html_file in html_files
+            ]
+            pool = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else nullcontext()
+            with pool as executor, open(
+                stats_csv, "w", newline="", encoding="utf-8", buffering=1 << 20
+            ) as stats_fh:
+                stats_writer = csv.writer(stats_fh)
+                stats_writer.writerow(STATS_HEADERS)
+                if executor is None:
+                    results = map(_worker_process_html, work_items)
+                else:
+                    print(f"Processing {len(html_files)} movies with {num_workers} parallel workers...")
+                    # Files are independent; the main process alone owns the stats file
+                    results = executor.map(_worker_process_html, work_items, chunksize=MAP_CHUNKSIZE)
+                for html_file, ttl_path, stats, error_msg in results:
+                    if error_msg is not None:
+                        failures.append((html_file, Exception(error_msg)))
+                        print(f"Failed on {html_file}: {error_msg}", file=sys.stderr)
+                        continue
+                    stats_writer.writerow(stats_row(ttl_path, stats))
+                    succeeded += 1
+                    triples = stats.get("triples", 0)
+                    total_triples += triples
+                    if largest is None or triples > largest[1]:
+                        largest = (ttl_path, triples)
+
+            print(f"\nBatch complete: {succeeded} succeeded, {len(failures)} failed.")
+            if succeeded:
+                if args.stats_format in ("xlsx", "both"):
+                    convert_stats_csv_to_xlsx(stats_csv, args.stats_xlsx, succeeded)
+                if not csv_only_for_xlsx:
+                    print(f"Wrote stats for {succeeded} movies to {stats_csv}")
+                print(f"Total triples across successes: {total_triples}")
+                print(f"Largest graph: {os.path.basename(largest[0])} with {largest[1]} triples")
+            elif not csv_only_for_xlsx:
+                stats_csv.unlink()
+        finally:
+            if csv_only_for_xlsx:
+                stats_csv.unlink(missing_ok=True)
 
         if failures:
             write_error_log(failures, args.error_log)
@@ -254,10 +558,13 @@ def main() -> int:
 
     success = [
         process_html_file(
-            args.html_file, parse_script, args.output_dir, args.show_parser_output
+            str(args.html_file), parse_script,
+            str(args.output_dir) if args.output_dir else None, args.show_parser_output,
+            use_subprocess=args.subprocess, validate=args.validate,
+            use_daemon=args.parser_daemon,
         )
     ]
-    write_stats_excel(success, args.stats_xlsx)
+    write_stats(success, args.stats_xlsx, args.stats_format)
     return 0
 
 
@@ -14,8 +14,17 @@ Schema.org structure:
   - schema:author -> author (for older songs where distinction is unclear)
 """
 
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
+import io
 import re
+import sys
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # =============================================================================
 # PROPERTY MAPPING
@@ -24,7 +33,7 @@ import re
 # Maps IMDb labels to schema.org properties
 # Priority order matters - more specific patterns should come first
 
-PROPERTY_MAPPING: Dict[str, List[str]] = {
+PROPERTY_MAPPING: Dict[str, Tuple[str, ...]] = {
     # -------------------------------------------------------------------------
     # COMPOSER variations -> schema:composer (on MusicComposition)
     # For the person who wrote the MUSIC
@@ -251,8 +260,8 @@ PROPERTY_MAPPING: Dict[str, List[str]] = {
 # These labels indicate multiple roles for the same person
 # =============================================================================
 
-COMPOUND_ROLES: Dict[str, List[str]] = {
-    # Label -> list of roles the person holds
+COMPOUND_ROLES: Dict[str, Tuple[str, ...]] = {
+    # Label -> roles the person holds
     'Written and Performed by': ['author', 'byArtist'],
     'Composed and Performed by': ['composer', 'byArtist'],
     'Written and Produced by': ['author', 'producer'],
@@ -284,6 +293,18 @@ COMPOUND_ROLES: Dict[str, List[str]] = {
     'Music and Performed by': ['composer', 'byArtist'],
 }
 
+# Freeze the static tables: tuples cannot be mutated by callers and are smaller
+# than lists, and interning makes every category/label string a single shared
+# object, so comparisons and dict lookups against them hit the identity fast path
+PROPERTY_MAPPING = {
+    sys.intern(category): tuple(sys.intern(label) for label in labels)
+    for category, labels in PROPERTY_MAPPING.items()
+}
+COMPOUND_ROLES = {
+    sys.intern(label): tuple(sys.intern(role) for role in roles)
+    for label, roles in COMPOUND_ROLES.items()
+}
+
 # =============================================================================
 # SCHEMA.ORG MAPPING
 # Maps our internal categories to schema.org properties
@@ -316,52 +337,96 @@ SCHEMA_ORG_MAPPING = {
 # HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=8192)
 def normalize_label(label: str) -> str:
     """Normalize a label for comparison."""
     return ' '.join(label.split()).lower().strip()
 
 
+def _match_prefix(normalized: str) -> Optional[str]:
+    """Return the category of the first known pattern (in priority order) that starts the label.
+
+    Walks the pattern trie along the label once, keeping the highest-priority
+    pattern that ends on the way, instead of trying every pattern in turn.
+    """
+    node = _PATTERN_TRIE
+    best = node.get(_TERMINAL)
+    for char in normalized:
+        node = node.get(char)
+        if node is None:
+            break
+        terminal = node.get(_TERMINAL)
+        if terminal is not None and (best is None or terminal < best):
+            best = terminal
+    return best[1] if best is not None else None
+
+
+# Lookup tables built once at import: the known labels normalized in priority
+# order, and exact-match tables mapping normalized labels straight to results
+_PATTERNS: List[Tuple[str, str]] = [
+    (normalize_label(known), category)
+    for category, known_labels in PROPERTY_MAPPING.items()
+    for known in known_labels
+]
+# Character trie of the patterns; a node's _TERMINAL entry is the
+# (priority, category) of the first pattern ending there
+_TERMINAL = None
+_PATTERN_TRIE: dict = {}
+for _priority, (_known_normalized, _category) in enumerate(_PATTERNS):
+    _node = _PATTERN_TRIE
+    for _char in _known_normalized:
+        _node = _node.setdefault(_char, {})
+    _node.setdefault(_TERMINAL, (_priority, _category))
+_COMPOUND_EXACT: Dict[str, Tuple[str, ...]] = {}
+for _compound_label, _roles in COMPOUND_ROLES.items():
+    _COMPOUND_EXACT.setdefault(normalize_label(_compound_label), _roles)
+# An exact label can still be claimed by an earlier, shorter pattern it starts
+# with, so store whatever the priority-ordered scan would return for it
+_EXACT_MAP: Dict[str, Optional[str]] = {
+    known_normalized: _match_prefix(known_normalized) for known_normalized, _ in _PATTERNS
+}
+
+
+@lru_cache(maxsize=4096)
 def categorize_label(label: str) -> Tuple[Optional[str], bool, bool]:
     """
     Categorize a label into schema.org property categories.
     
+    Results are memoized: the same few dozen labels make up almost every
+    soundtrack credit.
+    
     Returns:
         Tuple of (category, is_matched, is_compound)
     """
     normalized = normalize_label(label)
     
     # First check compound roles
-    for compound_label, roles in COMPOUND_ROLES.items():
-        if normalize_label(compound_label) == normalized:
-            return roles[0], True, True  # Return primary role, matched, is compound
+    roles = _COMPOUND_EXACT.get(normalized)
+    if roles is not None:
+        return roles[0], True, True  # Return primary role, matched, is compound
     
-    # Then check single-role mappings
-    for category, known_labels in PROPERTY_MAPPING.items():
-        for known in known_labels:
-            known_normalized = normalize_label(known)
-            if known_normalized == normalized:
-                return category, True, False
-            # Also check if label starts with known pattern
-            if normalized.startswith(known_normalized):
-                return category, True, False
+    # Then check single-role mappings: exact labels first, otherwise the first
+    # known pattern the label starts with
+    if normalized in _EXACT_MAP:
+        category = _EXACT_MAP[normalized]
+    else:
+        category = _match_prefix(normalized)
+    if category is not None:
+        return category, True, False
     
     return None, False, False
 
 
-def get_compound_roles(label: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def get_compound_roles(label: str) -> Tuple[str, ...]:
     """
     Get all roles for a compound label.
     
     Returns:
-        List of role categories, or empty list if not compound
+        Tuple of role categories, or empty tuple if not compound
+        (shared between calls, hence immutable)
     """
-    normalized = normalize_label(label)
-    
-    for compound_label, roles in COMPOUND_ROLES.items():
-        if normalize_label(compound_label) == normalized:
-            return roles
-    
-    return []
+    return _COMPOUND_EXACT.get(normalize_label(label), ())
 
 
 def get_schema_property(category: str) -> Optional[Tuple[str, str]]:
@@ -374,6 +439,9 @@ def get_schema_property(category: str) -> Optional[Tuple[str, str]]:
     return SCHEMA_ORG_MAPPING.get(category)
 
 
+_LABEL_RE = re.compile(r'([A-Za-z\s]+[Bb]y)')
+
+
 def extract_label_from_text(text: str) -> List[str]:
     """
     Extract property labels from free text.
@@ -385,8 +453,7 @@ def extract_label_from_text(text: str) -> List[str]:
         List of extracted labels
     """
     # Common pattern: "Something by Name"
-    pattern = r'([A-Za-z\s]+(?:by|By))'
-    matches = re.findall(pattern, text)
+    matches = _LABEL_RE.findall(text)
     
     labels = []
     for match in matches:
@@ -397,6 +464,38 @@ def extract_label_from_text(text: str) -> List[str]:
     return labels
 
 
+def extract_labels_from_html(data: bytes) -> List[str]:
+    """
+    Extract property labels from an HTML document or fragment.
+    
+    Streams the markup through lxml's iterparse and only looks at <li>
+    elements, the nodes that hold soundtrack credits, so the regex runs on
+    small per-item strings instead of the whole page. Each element is cleared
+    once read, keeping memory flat on multi-MB pages.
+    
+    Args:
+        data: Raw HTML bytes
+        
+    Returns:
+        List of extracted labels, in document order
+    """
+    if not LXML_AVAILABLE:
+        return extract_label_from_text(data.decode('utf-8', errors='replace'))
+    
+    labels = []
+    if not data.strip():
+        return labels
+    context = etree.iterparse(io.BytesIO(data), events=('end',), tag='li',
+                              html=True, recover=True)
+    for _, element in context:
+        # Scan each text node on its own so a label never runs into the
+        # preceding name ("Written by <a>Joe</a> Performed by ...")
+        for text in element.itertext():
+            labels.extend(extract_label_from_text(text))
+        element.clear()
+    return labels
+
+
 # =============================================================================
 # SUMMARY STATISTICS
 # =============================================================================
@@ -3,25 +3,37 @@
 Validate soundtrack TTL files and generate statistics in an Excel file.
 """
 
+import heapq
+import itertools
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-import pandas as pd
-from rdflib import Graph, Namespace, URIRef, RDF
+import xlsxwriter
+from rdflib import Graph, Namespace, URIRef, RDF, BNode, Literal
 from rdflib.exceptions import ParserError
 
+try:
+    import oxrdflib  # registers the Rust-backed "Oxigraph" rdflib store
+except ImportError:
+    oxrdflib = None
+OXIGRAPH_AVAILABLE = oxrdflib is not None
+
 # Define namespaces
 SCHEMA = Namespace("http://schema.org/")
 
 
-@dataclass
+@dataclass(slots=True)
 class SoundtrackStats:
     """Statistics for a single movie soundtrack."""
     movie_id: str
     movie_uri: str
     ttl_file: str
+    ttl_name: str = ""
     is_valid: bool = True
     error_message: str = ""
     
@@ -49,12 +61,257 @@ class SoundtrackStats:
     composer_names: List[str] = field(default_factory=list)
 
 
-def validate_and_analyze_ttl(ttl_path: Path) -> SoundtrackStats:
+# Terms in the subject/predicate -> objects index built below: IRIs are
+# interned strings (a person IRI recurs as performer, composer and Person
+# subject, so lookups compare by identity), blank nodes are ints and
+# literals are (lexical form, language tag or datatype IRI) tuples
+RDF_TYPE = sys.intern(str(RDF.type))
+
+# First lines of every file written by parse_soundtrack_to_ttl.py; only
+# files starting with them are given to the fast scanner
+EMITTER_HEADER = (
+    b'@prefix schema: <http://schema.org/> .\n'
+    b'@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n'
+)
+
+# Types and predicates looked up for every file, built once
+T_MUSIC_RECORDING = sys.intern(str(SCHEMA.MusicRecording))
+T_MUSIC_COMPOSITION = sys.intern(str(SCHEMA.MusicComposition))
+T_PERSON = sys.intern(str(SCHEMA.Person))
+P_NAME = sys.intern(str(SCHEMA.name))
+P_BY_ARTIST = sys.intern(str(SCHEMA.byArtist))
+P_PRODUCER = sys.intern(str(SCHEMA.producer))
+P_COMPOSER = sys.intern(str(SCHEMA.composer))
+P_LYRICIST = sys.intern(str(SCHEMA.lyricist))
+P_AUTHOR = sys.intern(str(SCHEMA.author))
+
+# One token of the Turtle subset our soundtrack emitter writes; whitespace
+# and comments match without a named group and are skipped
+_TTL_TOKEN_RE = re.compile(r"""
+    \s+ | \#[^\n]*
+    | <(?P<iri>[^<>"{}|^`\\\s]*)>
+    | "(?P<literal>(?:[^"\\\n\r]|\\.)*)"
+      (?: @(?P<lang>[A-Za-z]+(?:-[A-Za-z0-9]+)*)
+        | \^\^(?: <(?P<datatype_iri>[^<>"\s]*)> | (?P<datatype_pname>[A-Za-z][\w-]*:[\w-]*) ) )?
+    | (?P<punct>[\[\],;.])
+    | (?P<word>@prefix | [A-Za-z][\w-]*:(?:[\w-]+(?:\.[\w-]+)*)? | :[\w-]* | a(?![\w:-]))
+""", re.VERBOSE)
+
+_TTL_ESCAPE_RE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))')
+_TTL_ESCAPES = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f', '"': '"', "'": "'", '\\': '\\'}
+
+
+def _unescape_ttl_string(s: str) -> str:
+    """Resolve the escape sequences of a Turtle string literal."""
+    def replace(match: re.Match) -> str:
+        code = match.group(1) or match.group(2)
+        if code:
+            return chr(int(code, 16))
+        if match.group(3) not in _TTL_ESCAPES:
+            raise ValueError(f"unsupported escape \\{match.group(3)}")
+        return _TTL_ESCAPES[match.group(3)]
+    return _TTL_ESCAPE_RE.sub(replace, s) if '\\' in s else s
+
+
+@dataclass
+class TripleIndex:
+    """
+    Triples of one file, indexed in the single sweep that reads them.
+    
+    `objects` maps (subject, predicate) to an insertion-ordered dict whose
+    keys are the distinct objects of that pair; `typed` maps each rdf:type
+    to its subjects in document order; `size` counts distinct triples.
+    """
+    objects: Dict[Tuple, Dict] = field(default_factory=dict)
+    typed: Dict[str, Dict] = field(default_factory=dict)
+    size: int = 0
+    
+    def add(self, subject, predicate: str, obj):
+        """Record one triple; repeated triples are ignored."""
+        targets = self.objects.setdefault((subject, predicate), {})
+        if obj in targets:
+            return
+        targets[obj] = None
+        self.size += 1
+        if predicate == RDF_TYPE:
+            self.typed.setdefault(obj, {})[subject] = None
+
+
+def fast_parse_soundtrack_ttl(text: str) -> TripleIndex:
+    """
+    Parse a soundtrack TTL file without building an rdflib Graph.
+    
+    Handles the subset of Turtle that parse_soundtrack_to_ttl.py emits:
+    @prefix lines, IRIs, prefixed names, plain/tagged/typed string literals
+    and nested blank nodes ([ ... ]). Anything else raises ValueError, so
+    the caller can fall back to rdflib.
+    
+    Args:
+        text: Contents of the TTL file
+        
+    Returns:
+        TripleIndex of the file's triples
+    """
+    triples = TripleIndex()
+    prefixes: Dict[str, str] = {}
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TTL_TOKEN_RE.match(text, pos)
+        if match is None:
+            raise ValueError(f"unsupported syntax at offset {pos}")
+        pos = match.end()
+        if match.lastgroup is not None:
+            tokens.append(match)
+    tokens.append(None)
+    
+    index = 0
+    bnode_count = 0
+    
+    def expand(pname: str) -> str:
+        prefix, _, local = pname.partition(':')
+        if prefix not in prefixes:
+            raise ValueError(f"undefined prefix {prefix}:")
+        return sys.intern(prefixes[prefix] + local)
+    
+    def expect(punct: str):
+        nonlocal index
+        token = tokens[index]
+        if token is None or token.group('punct') != punct:
+            raise ValueError(f"expected '{punct}'")
+        index += 1
+    
+    def peek_punct() -> Optional[str]:
+        token = tokens[index]
+        return token.group('punct') if token is not None else None
+    
+    def parse_term(allow_literal: bool):
+        nonlocal index, bnode_count
+        token = tokens[index]
+        if token is None:
+            raise ValueError("unexpected end of file")
+        index += 1
+        kind = token.lastgroup
+        if kind == 'iri':
+            return sys.intern(token.group('iri'))
+        if kind == 'word' and token.group('word') not in ('a', '@prefix'):
+            return expand(token.group('word'))
+        if token.group('punct') == '[':
+            bnode_count += 1
+            node = bnode_count
+            if peek_punct() != ']':
+                parse_predicate_objects(node)
+            expect(']')
+            return node
+        if allow_literal and token.group('literal') is not None:
+            if token.group('lang'):
+                suffix = token.group('lang').lower()
+            elif token.group('datatype_iri') is not None:
+                suffix = token.group('datatype_iri')
+            elif token.group('datatype_pname'):
+                suffix = expand(token.group('datatype_pname'))
+            else:
+                suffix = None
+            return (_unescape_ttl_string(token.group('literal')), suffix)
+        raise ValueError(f"unexpected token {token.group()!r}")
+    
+    def parse_predicate_objects(subject):
+        nonlocal index
+        while True:
+            token = tokens[index]
+            if token is not None and token.group('word') == 'a':
+                index += 1
+                predicate = RDF_TYPE
+            else:
+                predicate = parse_term(allow_literal=False)
+                if not isinstance(predicate, str):
+                    raise ValueError("blank node used as predicate")
+            triples.add(subject, predicate, parse_term(allow_literal=True))
+            while peek_punct() == ',':
+                index += 1
+                triples.add(subject, predicate, parse_term(allow_literal=True))
+            if peek_punct() != ';':
+                return
+            # Turtle allows repeated and trailing semicolons
+            while peek_punct() == ';':
+                index += 1
+            if peek_punct() in ('.', ']'):
+                return
+    
+    while tokens[index] is not None:
+        token = tokens[index]
+        if token.group('word') == '@prefix':
+            name, iri = tokens[index + 1], tokens[index + 2]
+            if name is None or iri is None or not (name.group('word') or '').endswith(':') or iri.lastgroup != 'iri':
+                raise ValueError("malformed @prefix")
+            prefixes[name.group('word')[:-1]] = iri.group('iri')
+            index += 3
+            expect('.')
+            continue
+        subject = parse_term(allow_literal=False)
+        if not (isinstance(subject, int) and peek_punct() == '.'):
+            parse_predicate_objects(subject)
+        expect('.')
+    
+    return triples
+
+
+def parse_ttl_graph(ttl_path: Path, strict: bool = False) -> Graph:
+    """
+    Parse a TTL file into an rdflib Graph, with Oxigraph's parser when available.
+    
+    A file Oxigraph rejects is parsed again with rdflib's own parser, so
+    invalid files keep rdflib's ParserError messages. Strict mode always uses
+    rdflib's memory store, whose subject order the name lists depend on.
+    """
+    if OXIGRAPH_AVAILABLE and not strict:
+        g = Graph(store="Oxigraph")
+        try:
+            g.parse(ttl_path, format='turtle')
+            return g
+        except Exception:
+            pass
+    g = Graph()
+    g.parse(ttl_path, format='turtle')
+    return g
+
+
+def _graph_to_index(g: Graph) -> TripleIndex:
+    """Build the fast_parse_soundtrack_ttl index from a parsed rdflib Graph."""
+    bnodes: Dict[BNode, int] = {}
+    
+    def term(t):
+        if isinstance(t, Literal):
+            return (str(t), t.language or (str(t.datatype) if t.datatype else None))
+        if isinstance(t, BNode):
+            return bnodes.setdefault(t, len(bnodes) + 1)
+        return sys.intern(str(t))
+    
+    triples = TripleIndex()
+    # Typed subjects first, so `typed` keeps the order g.subjects(RDF.type, ...)
+    # gives rather than the grouping of a full scan; repeats below are ignored
+    for s, p, o in itertools.chain(g.triples((None, RDF.type, None)), g):
+        triples.add(term(s), sys.intern(str(p)), term(o))
+    return triples
+
+
+def _term_text(t) -> str:
+    """String value of an index term, as str() gives for rdflib terms."""
+    return t[0] if isinstance(t, tuple) else str(t)
+
+
+def validate_and_analyze_ttl(ttl_path: Path, strict: bool = False) -> SoundtrackStats:
     """
     Validate a TTL file and extract statistics.
     
+    Files written by our emitter (see EMITTER_HEADER) are scanned with
+    fast_parse_soundtrack_ttl; other files, and files it cannot handle,
+    are parsed with rdflib, which also provides the error message for
+    invalid files.
+    
     Args:
         ttl_path: Path to the TTL file
+        strict: Always parse with rdflib, e.g. to audit the fast scanner
         
     Returns:
         SoundtrackStats object with validation results and statistics
@@ -64,104 +321,85 @@ def validate_and_analyze_ttl(ttl_path: Path) -> SoundtrackStats:
     stats = SoundtrackStats(
         movie_id=movie_id,
         movie_uri=f"https://www.imdb.com/title/{movie_id}/",
-        ttl_file=str(ttl_path)
+        ttl_file=str(ttl_path),
+        ttl_name=ttl_path.name
     )
     
-    # File stats
-    stats.file_size_bytes = ttl_path.stat().st_size
-    with open(ttl_path, 'r', encoding='utf-8') as f:
-        stats.file_lines = sum(1 for _ in f)
-    
-    # Try to parse with rdflib
-    g = Graph()
-    try:
-        g.parse(ttl_path, format='turtle')
-        stats.is_valid = True
-    except ParserError as e:
-        stats.is_valid = False
-        stats.error_message = str(e)[:200]
-        return stats
-    except Exception as e:
-        stats.is_valid = False
-        stats.error_message = f"Unexpected error: {str(e)[:200]}"
-        return stats
+    # File stats, from a single read of the file; newlines are counted on
+    # the raw bytes, plus one for a final line without a newline
+    data = ttl_path.read_bytes()
+    stats.file_size_bytes = len(data)
+    stats.file_lines = data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+    text = data.decode('utf-8')
+    
+    triples = None
+    if not strict and data.startswith(EMITTER_HEADER):
+        try:
+            triples = fast_parse_soundtrack_ttl(text)
+        except ValueError:
+            pass
+    
+    if triples is None:
+        # Not in the subset we understand (or strict mode): let rdflib decide
+        try:
+            g = parse_ttl_graph(ttl_path, strict=strict)
+            stats.is_valid = True
+        except ParserError as e:
+            stats.is_valid = False
+            stats.error_message = str(e)[:200]
+            return stats
+        except Exception as e:
+            stats.is_valid = False
+            stats.error_message = f"Unexpected error: {str(e)[:200]}"
+            return stats
+        triples = _graph_to_index(g)
     
     # Count total triples
-    stats.total_triples = len(g)
+    stats.total_triples = triples.size
+    objects, typed = triples.objects, triples.typed
     
-    # Count MusicRecordings (tracks)
-    music_recordings = list(g.subjects(RDF.type, SCHEMA.MusicRecording))
-    stats.num_tracks = len(music_recordings)
+    def related(subjects, predicate: str) -> Dict:
+        """Distinct objects of `predicate` over `subjects`, in first-seen order."""
+        found = {}
+        for subject in subjects:
+            found.update(objects.get((subject, predicate), {}))
+        return found
     
-    # Get track names
-    for recording in music_recordings:
-        names = list(g.objects(recording, SCHEMA.name))
-        for name in names:
-            stats.track_names.append(str(name))
+    def names(subjects) -> List[str]:
+        return list(map(_term_text, related(subjects, P_NAME)))
     
-    # Count performers (byArtist)
-    performers = set()
+    # Tracks and the people credited on them
+    music_recordings = typed.get(T_MUSIC_RECORDING, {})
+    stats.num_tracks = len(music_recordings)
     for recording in music_recordings:
-        for artist in g.objects(recording, SCHEMA.byArtist):
-            performers.add(artist)
-    stats.num_performers = len(performers)
+        stats.track_names.extend(map(_term_text, objects.get((recording, P_NAME), ())))
     
-    # Get performer names
-    for performer in performers:
-        names = list(g.objects(performer, SCHEMA.name))
-        for name in names:
-            stats.performer_names.append(str(name))
+    performers = related(music_recordings, P_BY_ARTIST)
+    stats.num_performers = len(performers)
+    stats.performer_names = names(performers)
+    stats.num_producers = len(related(music_recordings, P_PRODUCER))
     
-    # Count producers
-    producers = set()
-    for recording in music_recordings:
-        for producer in g.objects(recording, SCHEMA.producer):
-            producers.add(producer)
-    stats.num_producers = len(producers)
-    
-    # Get MusicCompositions
-    music_compositions = list(g.subjects(RDF.type, SCHEMA.MusicComposition))
-    
-    # Count composers
-    composers = set()
-    for composition in music_compositions:
-        for composer in g.objects(composition, SCHEMA.composer):
-            composers.add(composer)
+    # Compositions and their writers
+    music_compositions = typed.get(T_MUSIC_COMPOSITION, {})
+    composers = related(music_compositions, P_COMPOSER)
     stats.num_composers = len(composers)
-    
-    # Get composer names
-    for composer in composers:
-        names = list(g.objects(composer, SCHEMA.name))
-        for name in names:
-            stats.composer_names.append(str(name))
-    
-    # Count lyricists
-    lyricists = set()
-    for composition in music_compositions:
-        for lyricist in g.objects(composition, SCHEMA.lyricist):
-            lyricists.add(lyricist)
-    stats.num_lyricists = len(lyricists)
-    
-    # Count authors
-    authors = set()
-    for composition in music_compositions:
-        for author in g.objects(composition, SCHEMA.author):
-            authors.add(author)
-    stats.num_authors = len(authors)
+    stats.composer_names = names(composers)
+    stats.num_lyricists = len(related(music_compositions, P_LYRICIST))
+    stats.num_authors = len(related(music_compositions, P_AUTHOR))
     
     # Count unique persons
-    persons = list(g.subjects(RDF.type, SCHEMA.Person))
-    stats.num_unique_persons = len(persons)
+    stats.num_unique_persons = len(typed.get(T_PERSON, {}))
     
     return stats
 
 
-def process_all_ttl_files(base_dir: Path) -> List[SoundtrackStats]:
+def process_all_ttl_files(base_dir: Path, strict: bool = False) -> List[SoundtrackStats]:
     """
     Process all TTL files and collect statistics.
     
     Args:
         base_dir: Base directory containing movie folders
+        strict: Parse every file with rdflib instead of the fast scanner
         
     Returns:
         List of SoundtrackStats objects
@@ -175,18 +413,20 @@ def process_all_ttl_files(base_dir: Path) -> List[SoundtrackStats]:
     valid_count = 0
     invalid_count = 0
     
-    for i, ttl_path in enumerate(ttl_files):
-        stats = validate_and_analyze_ttl(ttl_path)
-        all_stats.append(stats)
-        
-        if stats.is_valid:
-            valid_count += 1
-        else:
-            invalid_count += 1
-            print(f"INVALID: {ttl_path.name}: {stats.error_message}")
-        
-        if (i + 1) % 50 == 0:
-            print(f"Progress: {i + 1}/{len(ttl_files)} files processed...")
+    # Files are independent, so spread them over all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        per_file_stats = executor.map(partial(validate_and_analyze_ttl, strict=strict), ttl_files, chunksize=16)
+        for i, (ttl_path, stats) in enumerate(zip(ttl_files, per_file_stats)):
+            all_stats.append(stats)
+            
+            if stats.is_valid:
+                valid_count += 1
+            else:
+                invalid_count += 1
+                print(f"INVALID: {ttl_path.name}: {stats.error_message}")
+            
+            if (i + 1) % 50 == 0:
+                print(f"Progress: {i + 1}/{len(ttl_files)} files processed...")
     
     print()
     print(f"Validation complete: {valid_count} valid, {invalid_count} invalid")
@@ -194,6 +434,59 @@ def process_all_ttl_files(base_dir: Path) -> List[SoundtrackStats]:
     return all_stats
 
 
+MOVIE_DETAIL_COLUMNS = (
+    'Movie ID',
+    'Movie URI',
+    'TTL File',
+    'Valid',
+    'Error',
+    'Total Triples',
+    'Num Tracks',
+    'Num Performers',
+    'Num Producers',
+    'Num Composers',
+    'Num Lyricists',
+    'Num Authors',
+    'Num Unique Persons',
+    'File Size (bytes)',
+    'File Lines',
+    'Track Names',
+    'Performer Names',
+    'Composer Names',
+)
+
+
+# Columns reduced for the summary sheet
+SUMMARY_COLUMNS = (
+    'Valid',
+    'Total Triples',
+    'Num Tracks',
+    'Num Performers',
+    'Num Producers',
+    'Num Composers',
+    'Num Lyricists',
+    'Num Authors',
+    'Num Unique Persons',
+    'File Size (bytes)',
+)
+
+# Header style pandas' to_excel used for these sheets
+HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+
+def _join_names(names: List[str], limit: int = 10) -> str:
+    """Join the first `limit` names for a report cell, marking truncation with '...'."""
+    return '; '.join(names[:limit]) + ('...' if len(names) > limit else '')
+
+
+def _write_sheet(workbook: xlsxwriter.Workbook, name: str, header_format, columns, rows):
+    """Write a header row and then `rows`, in order (as constant_memory mode requires)."""
+    worksheet = workbook.add_worksheet(name)
+    worksheet.write_row(0, 0, columns, header_format)
+    for row_idx, row in enumerate(rows, 1):
+        worksheet.write_row(row_idx, 0, row)
+
+
 def generate_excel_report(stats_list: List[SoundtrackStats], output_path: Path):
     """
     Generate an Excel file with statistics.
@@ -202,105 +495,97 @@ def generate_excel_report(stats_list: List[SoundtrackStats], output_path: Path):
         stats_list: List of SoundtrackStats objects
         output_path: Path for the output Excel file
     """
-    # Create main dataframe
-    data = []
-    for stats in stats_list:
-        row = {
-            'Movie ID': stats.movie_id,
-            'Movie URI': stats.movie_uri,
-            'TTL File': Path(stats.ttl_file).name,
-            'Valid': stats.is_valid,
-            'Error': stats.error_message if not stats.is_valid else '',
-            'Total Triples': stats.total_triples,
-            'Num Tracks': stats.num_tracks,
-            'Num Performers': stats.num_performers,
-            'Num Producers': stats.num_producers,
-            'Num Composers': stats.num_composers,
-            'Num Lyricists': stats.num_lyricists,
-            'Num Authors': stats.num_authors,
-            'Num Unique Persons': stats.num_unique_persons,
-            'File Size (bytes)': stats.file_size_bytes,
-            'File Lines': stats.file_lines,
-            'Track Names': '; '.join(stats.track_names[:10]) + ('...' if len(stats.track_names) > 10 else ''),
-            'Performer Names': '; '.join(stats.performer_names[:10]) + ('...' if len(stats.performer_names) > 10 else ''),
-            'Composer Names': '; '.join(stats.composer_names[:10]) + ('...' if len(stats.composer_names) > 10 else ''),
-        }
-        data.append(row)
-    
-    df = pd.DataFrame(data)
-    
-    # Sort by Movie ID
-    df = df.sort_values('Movie ID')
-    
-    # Create summary statistics
-    summary_data = {
-        'Metric': [
-            'Total Files',
-            'Valid Files',
-            'Invalid Files',
-            'Total Triples',
-            'Total Tracks',
-            'Total Performers',
-            'Total Producers',
-            'Total Composers',
-            'Total Lyricists',
-            'Total Authors',
-            'Total Unique Persons',
-            'Average Triples per File',
-            'Average Tracks per File',
-            'Average Performers per File',
-            'Average Composers per File',
-            'Max Tracks in Single File',
-            'Max Performers in Single File',
-            'Max Composers in Single File',
-            'Total File Size (KB)',
-            'Average File Size (bytes)',
-        ],
-        'Value': [
-            len(stats_list),
-            df['Valid'].sum(),
-            len(stats_list) - df['Valid'].sum(),
-            df['Total Triples'].sum(),
-            df['Num Tracks'].sum(),
-            df['Num Performers'].sum(),
-            df['Num Producers'].sum(),
-            df['Num Composers'].sum(),
-            df['Num Lyricists'].sum(),
-            df['Num Authors'].sum(),
-            df['Num Unique Persons'].sum(),
-            round(df['Total Triples'].mean(), 2),
-            round(df['Num Tracks'].mean(), 2),
-            round(df['Num Performers'].mean(), 2),
-            round(df['Num Composers'].mean(), 2),
-            df['Num Tracks'].max(),
-            df['Num Performers'].max(),
-            df['Num Composers'].max(),
-            round(df['File Size (bytes)'].sum() / 1024, 2),
-            round(df['File Size (bytes)'].mean(), 2),
-        ]
-    }
-    summary_df = pd.DataFrame(summary_data)
-    
-    # Write to Excel with multiple sheets
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        # Summary sheet first
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Detailed data sheet
-        df.to_excel(writer, sheet_name='Movie Details', index=False)
-        
-        # Invalid files sheet (if any)
-        invalid_df = df[~df['Valid']]
-        if len(invalid_df) > 0:
-            invalid_df.to_excel(writer, sheet_name='Invalid Files', index=False)
-        
-        # Top movies by track count
-        top_tracks_df = df.nlargest(20, 'Num Tracks')[['Movie ID', 'Num Tracks', 'Track Names']]
-        top_tracks_df.to_excel(writer, sheet_name='Top 20 by Tracks', index=False)
-        
-        # Top movies by performer count
-        top_performers_df = df.nlargest(20, 'Num Performers')[['Movie ID', 'Num Performers', 'Performer Names']]
-        top_performers_df.to_excel(writer, sheet_name='Top 20 by Performers', index=False)
+    # One row per movie, sorted by Movie ID
+    rows = sorted(
+        (
+            (
+                stats.movie_id,
+                stats.movie_uri,
+                stats.ttl_name,
+                stats.is_valid,
+                stats.error_message if not stats.is_valid else '',
+                stats.total_triples,
+                stats.num_tracks,
+                stats.num_performers,
+                stats.num_producers,
+                stats.num_composers,
+                stats.num_lyricists,
+                stats.num_authors,
+                stats.num_unique_persons,
+                stats.file_size_bytes,
+                stats.file_lines,
+                _join_names(stats.track_names),
+                _join_names(stats.performer_names),
+                _join_names(stats.composer_names),
+            )
+            for stats in stats_list
+        ),
+        key=lambda row: row[0],
+    )
+    column_index = {name: idx for idx, name in enumerate(MOVIE_DETAIL_COLUMNS)}
+    
+    # Create summary statistics from one transposed pass over the rows
+    columns = dict(zip(MOVIE_DETAIL_COLUMNS, zip(*rows))) if rows else {}
+    totals = {name: sum(columns.get(name, ())) for name in SUMMARY_COLUMNS}
+    means = {name: round(totals[name] / len(rows), 2) if rows else None for name in SUMMARY_COLUMNS}
+    maxima = {name: max(columns.get(name, ()), default=None) for name in SUMMARY_COLUMNS}
+    summary_rows = [
+        ('Total Files', len(stats_list)),
+        ('Valid Files', totals['Valid']),
+        ('Invalid Files', len(stats_list) - totals['Valid']),
+        ('Total Triples', totals['Total Triples']),
+        ('Total Tracks', totals['Num Tracks']),
+        ('Total Performers', totals['Num Performers']),
+        ('Total Producers', totals['Num Producers']),
+        ('Total Composers', totals['Num Composers']),
+        ('Total Lyricists', totals['Num Lyricists']),
+        ('Total Authors', totals['Num Authors']),
+        ('Total Unique Persons', totals['Num Unique Persons']),
+        ('Average Triples per File', means['Total Triples']),
+        ('Average Tracks per File', means['Num Tracks']),
+        ('Average Performers per File', means['Num Performers']),
+        ('Average Composers per File', means['Num Composers']),
+        ('Max Tracks in Single File', maxima['Num Tracks']),
+        ('Max Performers in Single File', maxima['Num Performers']),
+        ('Max Composers in Single File', maxima['Num Composers']),
+        ('Total File Size (KB)', round(totals['File Size (bytes)'] / 1024, 2)),
+        ('Average File Size (bytes)', means['File Size (bytes)']),
+    ]
+    
+    def top(column: str, name_column: str):
+        """The 20 rows with the largest `column` (ties keep Movie ID order)."""
+        idx = column_index[column]
+        picked = heapq.nlargest(20, rows, key=lambda row: row[idx])
+        return [(row[0], row[idx], row[column_index[name_column]]) for row in picked]
+    
+    # Write every sheet row by row; constant_memory streams each row to disk
+    # as it is written. URIs are kept as plain strings
+    workbook = xlsxwriter.Workbook(
+        str(output_path),
+        {'constant_memory': True, 'strings_to_urls': False},
+    )
+    header_format = workbook.add_format(HEADER_FORMAT)
+    
+    # Summary sheet first
+    _write_sheet(workbook, 'Summary', header_format, ('Metric', 'Value'), summary_rows)
+    
+    # Detailed data sheet
+    _write_sheet(workbook, 'Movie Details', header_format, MOVIE_DETAIL_COLUMNS, rows)
+    
+    # Invalid files sheet (if any)
+    invalid_rows = [row for row in rows if not row[column_index['Valid']]]
+    if invalid_rows:
+        _write_sheet(workbook, 'Invalid Files', header_format, MOVIE_DETAIL_COLUMNS, invalid_rows)
+    
+    # Top movies by track count
+    _write_sheet(workbook, 'Top 20 by Tracks', header_format,
+                 ('Movie ID', 'Num Tracks', 'Track Names'), top('Num Tracks', 'Track Names'))
+    
+    # Top movies by performer count
+    _write_sheet(workbook, 'Top 20 by Performers', header_format,
+                 ('Movie ID', 'Num Performers', 'Performer Names'), top('Num Performers', 'Performer Names'))
+    
+    workbook.close()
     
     print(f"\nExcel report saved to: {output_path}")
 
@@ -388,10 +673,16 @@ def main():
         help='Output Excel file path'
     )
     
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Parse every file with rdflib instead of the fast TTL scanner (slower, for auditing)'
+    )
+    
     args = parser.parse_args()
     
     # Process all files
-    all_stats = process_all_ttl_files(args.input_dir)
+    all_stats = process_all_ttl_files(args.input_dir, strict=args.strict)
     
     # Print summary to console
     print_summary(all_stats)
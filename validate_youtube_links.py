@@ -6,11 +6,13 @@ Opens YouTube links from Excel file one by one in Chrome browser,
 displays a GUI window for validation, and updates the Excel file
 with Y/N responses.
 """
+import os
+import queue
 import sys
 import time
 import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 # Import tkinter only when needed (checked in run method)
@@ -23,10 +25,12 @@ except ImportError:
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from openpyxl import load_workbook
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackRow:
     """Represents a row from the Excel file."""
     row_index: int  # Excel row number (1-indexed, including header)
@@ -41,6 +45,16 @@ class TrackRow:
 class YouTubeValidator:
     """Main validator class that manages browser, GUI, and Excel updates."""
     
+    # Saving rewrites the whole workbook, so responses are batched: save after
+    # this many unsaved updates, or when this many seconds have passed since
+    # the last save or since the last update (and always when closing)
+    SAVE_EVERY_UPDATES = 8
+    SAVE_INTERVAL_SECONDS = 5
+    WRITER_ERROR_POLL_MS = 500
+    
+    # Upper bound on waiting for a page to become interactive
+    PAGE_LOAD_TIMEOUT_SECONDS = 10
+    
     def __init__(self, excel_path: Path, interval_seconds: int = 20):
         self.excel_path = excel_path
         self.interval_seconds = interval_seconds
@@ -49,7 +63,23 @@ class YouTubeValidator:
         self.worksheet = None
         self.tracks: list[TrackRow] = []
         self.current_index = 0
-        self.auto_advance_timer: Optional[threading.Timer] = None
+        # Tk `after` id of the pending auto-advance, if any
+        self.auto_advance_id: Optional[str] = None
+        # (url, window handle) of the next track, loading in a background tab
+        self._preloaded: Optional[Tuple[str, str]] = None
+        # (row, value) updates applied to the workbook but not saved yet
+        self._unsaved: list[Tuple[int, str]] = []
+        self._last_save = time.monotonic()
+        self._save_failed = False
+        
+        # Workbook edits and saves happen on one writer thread, fed through
+        # this queue, so the Tk main thread never blocks on a save. Failures
+        # come back through _writer_errors and are shown by the Tk thread
+        self._updates: queue.Queue = queue.Queue()
+        self._writer_errors: queue.Queue = queue.Queue()
+        self.writer_error_poll_id: Optional[str] = None
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
         
         # GUI components
         self.root: Optional[tk.Tk] = None
@@ -63,40 +93,44 @@ class YouTubeValidator:
     def load_excel(self):
         """Load Excel file and extract track data."""
         print(f"Loading Excel file: {self.excel_path}")
-        self.workbook = load_workbook(self.excel_path)
-        self.worksheet = self.workbook.active
+        # Scan in read-only mode, which streams rows without building styled
+        # cell objects; the writable workbook is only loaded for the first save
+        workbook = load_workbook(self.excel_path, read_only=True)
         
-        # Read all rows (skip header row)
+        # Read all rows (skip header row). Already validated rows are dropped
+        # as they stream past, before a TrackRow is built for them
         self.tracks = []
-        for row_idx in range(2, self.worksheet.max_row + 1):
-            movie_id = self.worksheet.cell(row=row_idx, column=1).value or ''
-            movie_name = self.worksheet.cell(row=row_idx, column=2).value or ''
-            track_name = self.worksheet.cell(row=row_idx, column=3).value or ''
-            track_url = self.worksheet.cell(row=row_idx, column=4).value or ''
-            correct = self.worksheet.cell(row=row_idx, column=5).value or ''
-            comments = self.worksheet.cell(row=row_idx, column=6).value or ''
+        url_count = 0
+        rows = workbook.active.iter_rows(min_row=2, max_col=6, values_only=True)
+        for row_idx, row in enumerate(rows, start=2):
+            # Short rows come back with fewer than 6 values
+            movie_id, movie_name, track_name, track_url, correct, comments = (
+                value or '' for value in row + (None,) * (6 - len(row))
+            )
             
             # Only include rows with URLs
-            if track_url:
-                self.tracks.append(TrackRow(
-                    row_index=row_idx,
-                    movie_id=str(movie_id),
-                    movie_name=str(movie_name),
-                    track_name=str(track_name),
-                    track_url=str(track_url),
-                    correct=str(correct),
-                    comments=str(comments)
-                ))
-        
-        print(f"Loaded {len(self.tracks)} tracks with URLs")
-        
-        # Filter out already validated tracks (only process tracks without Y or N)
-        validated_count = len(self.tracks)
-        self.tracks = [
-            t for t in self.tracks 
-            if not t.correct.strip() or t.correct.strip().upper() not in ['Y', 'N']
-        ]
-        print(f"After filtering validated tracks: {len(self.tracks)} remaining (skipped {validated_count - len(self.tracks)} already validated)")
+            if not track_url:
+                continue
+            url_count += 1
+            
+            # Only process tracks without Y or N
+            correct = str(correct)
+            if correct.strip().upper() in ('Y', 'N'):
+                continue
+            
+            self.tracks.append(TrackRow(
+                row_index=row_idx,
+                movie_id=str(movie_id),
+                movie_name=str(movie_name),
+                track_name=str(track_name),
+                track_url=str(track_url),
+                correct=correct,
+                comments=str(comments)
+            ))
+        
+        workbook.close()
+        print(f"Loaded {url_count} tracks with URLs")
+        print(f"After filtering validated tracks: {len(self.tracks)} remaining (skipped {url_count - len(self.tracks)} already validated)")
     
     def setup_browser(self):
         """Set up Chrome browser with Selenium."""
@@ -263,25 +297,67 @@ class YouTubeValidator:
         
         try:
             print(f"Opening URL: {url}")
+            preloaded, self._preloaded = self._preloaded, None
+            if preloaded and preloaded[0] == url:
+                # Already loading (or loaded) in a background tab: bring it to
+                # the front and close the tab of the previous track
+                previous = self.driver.current_window_handle
+                self.driver.switch_to.window(preloaded[1])
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': previous})
+                return
+            if preloaded:
+                self.driver.execute_cdp_cmd('Target.closeTarget', {'targetId': preloaded[1]})
             self.driver.get(url)
-            time.sleep(2)  # Wait for page to load
+            # Wait until the page is interactive rather than a fixed delay
+            try:
+                WebDriverWait(self.driver, self.PAGE_LOAD_TIMEOUT_SECONDS).until(
+                    lambda d: d.execute_script('return document.readyState') in ('interactive', 'complete')
+                )
+            except TimeoutException:
+                print(f"Page still loading after {self.PAGE_LOAD_TIMEOUT_SECONDS}s, continuing")
         except Exception as e:
             print(f"Error opening URL: {e}")
             messagebox.showerror("Error", f"Failed to open URL:\n{e}")
     
+    def preload_url(self, url: str):
+        """Start loading a URL in a background tab, ready for open_url.
+        
+        The tab is created through the DevTools protocol so it never gets
+        focus; Chrome holds back media playback in tabs that have not been
+        shown, so the preloaded video stays silent until it is opened.
+        """
+        if not self.driver:
+            return
+        
+        try:
+            before = set(self.driver.window_handles)
+            self.driver.execute_cdp_cmd('Target.createTarget', {'url': url, 'background': True})
+            new_handles = set(self.driver.window_handles) - before
+            if new_handles:
+                self._preloaded = (url, new_handles.pop())
+        except Exception as e:
+            # Preloading is only an optimisation; open_url falls back to driver.get
+            print(f"Could not preload {url}: {e}")
+    
+    def cancel_auto_advance(self):
+        """Cancel the pending auto-advance, if any."""
+        if self.auto_advance_id is not None and self.root:
+            self.root.after_cancel(self.auto_advance_id)
+        self.auto_advance_id = None
+    
     def schedule_auto_advance(self):
-        """Schedule automatic advance to next track after interval."""
-        if self.auto_advance_timer:
-            self.auto_advance_timer.cancel()
+        """Schedule automatic advance to next track after interval.
         
-        self.auto_advance_timer = threading.Timer(
-            self.interval_seconds,
-            self.auto_advance
-        )
-        self.auto_advance_timer.start()
+        Runs through the Tk event loop, so auto_advance updates the widgets
+        on the main thread.
+        """
+        self.cancel_auto_advance()
+        if self.root:
+            self.auto_advance_id = self.root.after(self.interval_seconds * 1000, self.auto_advance)
     
     def auto_advance(self):
         """Automatically advance to next track."""
+        self.auto_advance_id = None
         if self.current_index < len(self.tracks) - 1:
             self.current_index += 1
             self.load_current_track()
@@ -301,25 +377,90 @@ class YouTubeValidator:
         if track.track_url:
             self.open_url(track.track_url)
         
+        # Load the next track while this one is being judged
+        if self.current_index + 1 < len(self.tracks):
+            self.preload_url(self.tracks[self.current_index + 1].track_url)
+        
         # Schedule auto-advance
         self.schedule_auto_advance()
     
+    def load_workbook_for_writing(self):
+        """Load the workbook for editing, once, on the first update."""
+        if self.workbook is None:
+            self.workbook = load_workbook(self.excel_path)
+            self.worksheet = self.workbook.active
+    
+    def save_workbook(self):
+        """Write the workbook to a temporary file and atomically replace the Excel file."""
+        tmp_path = self.excel_path.with_suffix('.tmp')
+        self.workbook.save(tmp_path)
+        os.replace(tmp_path, self.excel_path)
+        for row_index, value in self._unsaved:
+            print(f"✓ Updated row {row_index} with '{value}'")
+        self._unsaved.clear()
+        self._last_save = time.monotonic()
+    
+    def _writer_loop(self):
+        """Apply queued (row, value) updates to the workbook and save them in batches.
+        
+        Only this thread touches self.workbook. A None item flushes pending
+        updates and stops the loop. Unsaved updates stay pending after a failed
+        save, so the next save retries them.
+        """
+        while True:
+            try:
+                item = self._updates.get(timeout=self.SAVE_INTERVAL_SECONDS)
+            except queue.Empty:
+                item = ()  # idle: flush whatever is pending
+            
+            try:
+                if item:
+                    row_index, value = item
+                    self.load_workbook_for_writing()
+                    # Update the correct (y/N) column (column 5)
+                    self.worksheet.cell(row=row_index, column=5).value = value
+                    self._unsaved.append(item)
+                if self._unsaved and (
+                    not item  # closing or idle
+                    or len(self._unsaved) >= self.SAVE_EVERY_UPDATES
+                    or time.monotonic() - self._last_save > self.SAVE_INTERVAL_SECONDS
+                ):
+                    self.save_workbook()
+                    self._save_failed = False
+                    if item is None:
+                        print("✓ Excel file saved")
+            except Exception as e:
+                print(f"Error updating Excel: {e}")
+                # Report the first failure of a streak, not every retry
+                if not self._save_failed:
+                    self._save_failed = True
+                    self._writer_errors.put(e)
+            
+            if item is None:
+                return
+    
     def update_excel(self, track: TrackRow, value: str):
-        """Update Excel file with validation result."""
-        try:
-            # Update the correct (y/N) column (column 5)
-            self.worksheet.cell(row=track.row_index, column=5).value = value
-            self.workbook.save(self.excel_path)
-            print(f"✓ Updated row {track.row_index} with '{value}'")
-            track.correct = value
-        except Exception as e:
-            print(f"Error updating Excel: {e}")
-            messagebox.showerror("Error", f"Failed to update Excel file:\n{e}")
+        """Queue the validation result for the writer thread, which reports it once saved."""
+        self._updates.put((track.row_index, value))
+        track.correct = value
+    
+    def show_writer_errors(self):
+        """Show the errors the writer thread has reported (runs on the Tk thread)."""
+        while True:
+            try:
+                error = self._writer_errors.get_nowait()
+            except queue.Empty:
+                return
+            messagebox.showerror("Error", f"Failed to update Excel file:\n{error}")
+    
+    def poll_writer_errors(self):
+        """Check for writer errors now and again every WRITER_ERROR_POLL_MS."""
+        self.show_writer_errors()
+        self.writer_error_poll_id = self.root.after(self.WRITER_ERROR_POLL_MS, self.poll_writer_errors)
     
     def handle_response(self, value: str):
         """Handle Yes/No button click."""
-        if self.auto_advance_timer:
-            self.auto_advance_timer.cancel()
+        self.cancel_auto_advance()
         
         track = self.tracks[self.current_index]
         self.update_excel(track, value)
@@ -337,8 +478,7 @@ class YouTubeValidator:
     
     def skip_current(self):
         """Skip current track without updating."""
-        if self.auto_advance_timer:
-            self.auto_advance_timer.cancel()
+        self.cancel_auto_advance()
         
         # Advance to next track
         if self.current_index < len(self.tracks) - 1:
@@ -350,16 +490,17 @@ class YouTubeValidator:
     
     def on_closing(self):
         """Handle window close event."""
-        if self.auto_advance_timer:
-            self.auto_advance_timer.cancel()
+        self.cancel_auto_advance()
         
-        # Save workbook before closing
-        try:
-            if self.workbook:
-                self.workbook.save(self.excel_path)
-                print("✓ Excel file saved")
-        except Exception as e:
-            print(f"Error saving Excel: {e}")
+        # Let the writer thread save pending updates before closing
+        if self._writer.is_alive():
+            self._updates.put(None)
+            self._writer.join()
+        if self.root:
+            if self.writer_error_poll_id:
+                self.root.after_cancel(self.writer_error_poll_id)
+                self.writer_error_poll_id = None
+            self.show_writer_errors()
         
         # Close browser
         if self.driver:
@@ -392,6 +533,7 @@ class YouTubeValidator:
             
             # Create GUI
             self.create_gui()
+            self.poll_writer_errors()
             
             # Load first track
             self.load_current_track()